@@ -6,7 +6,7 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import { StatusBar } from 'expo-status-bar';
 
 // Imports for Logic & Data
-import { getRandomWord, isWordValid } from '../../constants/word_list';
+import { getDailyWord, getRandomWord, isWordValid } from '../../constants/word_list';
 import { ENDPOINTS } from '../../constants/config';
 import { getOrCreateUserId } from '../../utils/user_manager';
 
@@ -20,11 +20,12 @@ export default function GameScreen() {
   const [gameStatus, setGameStatus] = useState<'playing' | 'won' | 'lost'>('playing');
 
   useEffect(() => {
-    startNewGame();
+    // First round is the daily word, replays are random
+    getDailyWord().then(startNewGame);
   }, []);
 
-  const startNewGame = () => {
-    const newWord = getRandomWord();
+  const startNewGame = (word?: string) => {
+    const newWord = word ?? getRandomWord();
     console.log("Answer:", newWord);
     setSolution(newWord);
     setGuesses([]);
@@ -65,7 +66,7 @@ export default function GameScreen() {
     }
   };
 
-  const submitGuess = () => {
+  const submitGuess = async () => {
     // 1. Check Length
     if (currentGuess.length !== WORD_LENGTH) {
       Alert.alert("For kort", "Ordet må ha 5 bokstaver!");
@@ -73,7 +74,7 @@ export default function GameScreen() {
     }
 
     // 2. Check Dictionary
-    if (!isWordValid(currentGuess)) {
+    if (!(await isWordValid(currentGuess))) {
       Alert.alert("Ukjent ord", "Dette ordet finnes ikke i ordlisten vår.");
       return;
     }
@@ -87,12 +88,12 @@ export default function GameScreen() {
       setGameStatus('won');
       handleWin(); // Trigger Streak Update here
       Alert.alert("Gratulerer!", `Du klarte det! Ordet var ${solution}`, [
-        { text: "Spill igjen", onPress: startNewGame }
+        { text: "Spill igjen", onPress: () => startNewGame() }
       ]);
     } else if (newGuesses.length >= MAX_GUESSES) {
       setGameStatus('lost');
       Alert.alert("Beklager", `Du tapte. Ordet var ${solution}`, [
-        { text: "Prøv igjen", onPress: startNewGame }
+        { text: "Prøv igjen", onPress: () => startNewGame() }
       ]);
     }
   };
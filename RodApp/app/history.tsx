@@ -18,6 +18,7 @@ export default function HistoryScreen() {
   const router = useRouter();
   const [history, setHistory] = useState<Conversation[]>([]);
   const [userId, setUserId] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   
   // Edit Modal State
   const [modalVisible, setModalVisible] = useState(false);
@@ -36,11 +37,26 @@ export default function HistoryScreen() {
       const data = await response.json();
       
       setHistory(data.conversations || []);
+      setNextCursor(data.next_cursor || null);
     } catch (e) {
       console.error("Failed to load history", e);
     }
   };
 
+  // Loads the next (older) page when the list is scrolled to the end
+  const loadMore = async () => {
+    if (!userId || !nextCursor) return;
+    try {
+      const response = await fetch(`${ENDPOINTS.HISTORY}/${userId}?cursor=${encodeURIComponent(nextCursor)}`);
+      const data = await response.json();
+
+      setHistory(prev => [...prev, ...(data.conversations || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (e) {
+      console.error("Failed to load more history", e);
+    }
+  };
+
   // Initial Load
   useEffect(() => {
     loadHistory();
@@ -118,6 +134,8 @@ export default function HistoryScreen() {
         renderItem={renderItem}
         keyExtractor={(item) => item.id.toString()}
         contentContainerStyle={{ padding: 20 }}
+        onEndReached={loadMore}
+        onEndReachedThreshold={0.5}
       />
 
       <Modal
@@ -11,4 +11,6 @@ export const ENDPOINTS = {
   USER_STREAK: `${API_BASE_URL}/user/streak`,
   USER_ACTIVITY: `${API_BASE_URL}/user/activity`,
   MEDIA_NEWS: `${API_BASE_URL}/media/news`,
+  WORDS_VALIDATE: `${API_BASE_URL}/words/validate`,
+  WORDS_DAILY: `${API_BASE_URL}/words/daily`,
 };
\ No newline at end of file
@@ -1,1176 +0,0 @@
-// Auto-generated from Norsk Ordbank
-export const VALID_GUESSES = [
-  "AAGOT", "AAKRE", "AANON", "AASEN", "ABAYA", "ABBED", "ABBOR", "ABEBA", "ABERA", "ABERE",
-  "ABORT", "ABROT", "ACCRA", "ACIDA", "ACREN", "ACRES", "ACYLA", "ADDER", "ADDIS", "ADEPT",
-  "ADJØA", "ADLER", "ADLES", "ADLET", "ADLYD", "ADLØD", "ADOBE", "ADOLF", "ADVAR", "ADVIS",
-  "AEROB", "AFASI", "AFORI", "AFTEN", "AGAPE", "AGAVE", "AGDER", "AGEDE", "AGENE", "AGENS",
-  "AGENT", "AGERE", "AGERT", "AGETE", "AGGET", "AGNAT", "AGNEN", "AGNER", "AGNES", "AGNET",
-  "AGNOR", "AGONI", "AGORA", "AGRAR", "AGURK", "AIOLI", "AIREN", "AIRER", "AIRES", "AKABA",
-  "AKING", "AKKAR", "AKKER", "AKKES", "AKKET", "AKNEN", "AKNER", "AKPER", "AKRYL", "AKSEL",
-  "AKSEN", "AKSER", "AKSET", "AKSJE", "AKSLA", "AKSLE", "AKSON", "AKTEN", "AKTER", "AKTES",
-  "AKTET", "AKTIN", "AKTIV", "AKTOR", "AKTRE", "AKTØR", "AKUTT", "ALALI", "ALANT", "ALARM",
-  "ALBIN", "ALBUA", "ALBUE", "ALBUM", "ALDER", "ALDRA", "ALDRE", "ALDRI", "ALEDE", "ALENE",
-  "ALERT", "ALETE", "ALEUT", "ALGEN", "ALGER", "ALGIN", "ALGOL", "ALIAS", "ALIBI", "ALING",
-  "ALKAN", "ALKEN", "ALKER", "ALKIS", "ALKYD", "ALKYL", "ALKYN", "ALLAH", "ALLEL", "ALLER",
-  "ALLYL", "ALMEN", "ALMER", "ALNER", "ALOEN", "ALOER", "ALPEN", "ALPER", "ALPIN", "ALTAN",
-  "ALTEN", "ALTER", "ALTET", "ALTRA", "ALTRE", "ALTSÅ", "ALUNA", "ALVED", "ALVEN", "ALVER",
-  "ALVOR", "AMBAR", "AMBRA", "AMCAR", "AMDAL", "AMENA", "AMENE", "AMFIA", "AMIDA", "AMINA",
-  "AMMAN", "AMMEN", "AMMER", "AMMES", "AMMET", "AMORF", "AMPEL", "AMPER", "AMPRE", "AMTER",
-  "AMTET", "AMUND", "AMØBE", "ANALE", "ANALT", "ANBUD", "ANDEL", "ANDEN", "ANDER", "ANDES",
-  "ANDET", "ANDRA", "ANDRE", "ANDRO", "ANDRÉ", "ANDUV", "ANDØV", "ANDØY", "ANEMI", "ANENE",
-  "ANFØR", "ANGAV", "ANGEL", "ANGEN", "ANGER", "ANGES", "ANGET", "ANGIR", "ANGIS", "ANGLA",
-  "ANGLE", "ANGRA", "ANGRE", "ANGST", "ANGÅR", "ANGÅS", "ANING", "ANION", "ANITA", "ANKEL",
-  "ANKEN", "ANKER", "ANKES", "ANKET", "ANKOM", "ANKRA", "ANKRE", "ANLØP", "ANMOD", "ANNAL",
-  "ANNAM", "ANNEN", "ANNET", "ANNUA", "ANODE", "ANRIK", "ANROP", "ANSEN", "ANSER", "ANSES",
-  "ANSET", "ANSKU", "ANSLO", "ANSLÅ", "ANSTE", "ANSTO", "ANSTÅ", "ANSØK", "ANTAR", "ANTAS",
-  "ANTEN", "ANTER", "ANTES", "ANTET", "ANTOK", "ANTON", "ANTYD", "ANVIS", "AORTA", "APATI",
-  "APEDE", "APENE", "APERI", "APETE", "APHEL", "APING", "APOGE", "APOGÉ", "APPEN", "APPER",
-  "APRIL", "APSIS", "APTER", "ARAEN", "ARAER", "ARDEN", "ARDER", "ARDES", "ARDET", "AREAL",
-  "ARENA", "ARENE", "ARGER", "ARGES", "ARGET", "ARGON", "ARGOT", "ARIDE", "ARIEN", "ARIER",
-  "ARILD", "ARISK", "ARKEN", "ARKER", "ARKET", "ARKIV", "ARMEN", "ARMER", "ARMES", "ARMET",
-  "ARMOD", "ARNEN", "ARNER", "AROMA", "ARPEN", "ARPER", "ARRET", "ARRIG", "ARSEN", "ARTEN",
-  "ARTER", "ARTES", "ARTET", "ARTIG", "ARVEN", "ARVER", "ARVES", "ARVET", "ARVID", "ASDIC",
-  "ASENA", "ASENE", "ASETE", "ASIAT", "ASKEN", "ASKER", "ASKET", "ASKIM", "ASKØY", "ASLAK",
-  "ASPEN", "ASPER", "ASPIK", "ASSEN", "ASSER", "ASTAT", "ASTMA", "ASTRI", "ASWAN", "ASYLA",
-  "ATALE", "ATALT", "ATHEN", "ATLAS", "ATLET", "ATOLL", "ATOMA", "ATONI", "ATOPI", "ATRIA",
-  "ATSJO", "ATTEN", "ATTER", "ATTOM", "ATTPÅ", "ATTRA", "ATTRE", "ATTRÅ", "ATTÅT", "ATYPI",
-  "AUDUN", "AUEDE", "AUENE", "AUETE", "AUFER", "AUGUR", "AUING", "AUKEN", "AUKER", "AUKES",
-  "AUKET", "AUKRA", "AUKTE", "AUREN", "AURER", "AURES", "AURET", "AURUM", "AUSEN", "AUSER",
-  "AUSES", "AUSTA", "AUSTE", "AUTOR", "AVART", "AVBUD", "AVBØT", "AVBØY", "AVDAL", "AVDEL",
-  "AVDRA", "AVDRO", "AVDUK", "AVDØD", "AVENE", "AVENY", "AVERS", "AVFAS", "AVFEI", "AVFYR",
-  "AVFØD", "AVFØR", "AVGAV", "AVGIR", "AVGIS", "AVGUD", "AVGÅR", "AVGÅS", "AVHOL", "AVHØR",
-  "AVIND", "AVISA", "AVISE", "AVISO", "AVIST", "AVKLE", "AVKOD", "AVKOK", "AVKOM", "AVLAT",
-  "AVLED", "AVLEI", "AVLEN", "AVLER", "AVLES", "AVLET", "AVLIV", "AVLUR", "AVLUS", "AVLUT",
-  "AVLYD", "AVLYS", "AVLÅS", "AVLØP", "AVLØS", "AVMÅL", "AVRIM", "AVROP", "AVRUS", "AVSER",
-  "AVSES", "AVSIG", "AVSIL", "AVSKY", "AVSLO", "AVSLÅ", "AVSON", "AVSTO", "AVSTÅ", "AVSUG",
-  "AVSVI", "AVSØK", "AVTAK", "AVTAL", "AVTAR", "AVTAS", "AVTOK", "AVUND", "AVVEG", "AVVEI",
-  "AVVEK", "AVVIK", "AVVIS", "AXLER", "BABEL", "BABLA", "BABLE", "BACON", "BADEN", "BADER",
-  "BADES", "BADET", "BAGEN", "BAGER", "BAGGE", "BAHAI", "BAHIA", "BAISS", "BAJAS", "BAKEN",
-  "BAKER", "BAKES", "BAKET", "BAKKA", "BAKKE", "BAKLI", "BAKOL", "BAKOM", "BAKPÅ", "BAKRE",
-  "BAKSA", "BAKSE", "BAKST", "BAKTE", "BAKUT", "BALEN", "BALER", "BALES", "BALET", "BALJA",
-  "BALJE", "BALLA", "BALLE", "BALSA", "BALTE", "BAMSE", "BANAK", "BANAL", "BANAN", "BANDA",
-  "BANDE", "BANDT", "BANDY", "BANEN", "BANER", "BANES", "BANET", "BANGA", "BANGE", "BANJO",
-  "BANKA", "BANKE", "BANKO", "BANNA", "BANNE", "BANTE", "BANTU", "BARDE", "BARDU", "BAREN",
-  "BARER", "BARES", "BARET", "BARKA", "BARKE", "BARNA", "BARON", "BARRE", "BARSK", "BARSL",
-  "BASAL", "BASAR", "BASEL", "BASEN", "BASER", "BASES", "BASIS", "BASKA", "BASKE", "BASMA",
-  "BASME", "BASSE", "BASSI", "BASSO", "BASTA", "BASTE", "BASUN", "BATCH", "BATEN", "BATER",
-  "BATES", "BATET", "BATON", "BATOR", "BAUEN", "BAUER", "BAUGA", "BAUGE", "BAUMÉ", "BAUSE",
-  "BAUST", "BAUTA", "BAUTE", "BAYER", "BEACH", "BEAKT", "BEBOP", "BEBOR", "BEBOS", "BEBUD",
-  "BEDAG", "BEDER", "BEDES", "BEDET", "BEDRA", "BEDRE", "BEDRO", "BEDTE", "BEDYR", "BEDÅR",
-  "BEDØM", "BEDØV", "BEFAL", "BEFAR", "BEFRI", "BEFØL", "BEGAV", "BEGER", "BEGGE", "BEGIR",
-  "BEGIS", "BEGLO", "BEGNA", "BEGRA", "BEGRE", "BEGÅR", "BEGÅS", "BEHAG", "BEHOV", "BEHØV",
-  "BEIGE", "BEILA", "BEILE", "BEILT", "BEINA", "BEINE", "BEING", "BEINK", "BEINT", "BEIRA",
-  "BEISA", "BEISE", "BEISK", "BEIST", "BEITA", "BEITE", "BEITO", "BEJAA", "BEJAE", "BEKER",
-  "BEKES", "BEKET", "BEKLE", "BEKOM", "BEKTE", "BELAG", "BELEN", "BELET", "BELJA", "BELJE",
-  "BELMA", "BELME", "BELTA", "BELTE", "BELYS", "BELÅN", "BELÆR", "BELØP", "BEMAL", "BEMØY",
-  "BENDA", "BENDE", "BENDT", "BENER", "BENES", "BENET", "BENKA", "BENKE", "BENTE", "BENZO",
-  "BENÅD", "BERAM", "BERED", "BERET", "BERGA", "BERGE", "BERGH", "BERIK", "BERIT", "BERME",
-  "BERNT", "BEROP", "BEROR", "BEROS", "BERTA", "BERTE", "BERUS", "BERØM", "BERØR", "BERØV",
-  "BESER", "BESES", "BESJE", "BESKE", "BESKN", "BESKT", "BESKU", "BESLO", "BESLÅ", "BESNA",
-  "BESNE", "BESOV", "BESTA", "BESTE", "BESTO", "BESTÅ", "BESYV", "BESØK", "BETAL", "BETAR",
-  "BETAS", "BETEL", "BETEN", "BETER", "BETES", "BETLA", "BETLE", "BETOK", "BETON", "BETRE",
-  "BETRO", "BETYR", "BETYS", "BETØD", "BEVAR", "BEVDE", "BEVEG", "BEVEN", "BEVER", "BEVES",
-  "BEVET", "BEVIS", "BEVRA", "BEVRE", "BEYEN", "BEYER", "BEÅND", "BEÆRA", "BEÆRE", "BIALA",
-  "BIAVL", "BIBEL", "BIDDE", "BIDEA", "BIDIG", "BIDRA", "BIDRO", "BIDÉA", "BIEDE", "BIELV",
-  "BIENE", "BIETE", "BIFAG", "BIFIL", "BIGAM", "BIING", "BIKKA", "BIKKE", "BIKSE", "BIKTA",
-  "BIKTE", "BILAG", "BILDA", "BILDE", "BILEN", "BILER", "BILES", "BILKØ", "BILLE", "BILTE",
-  "BILYD", "BIMBO", "BINDA", "BINDE", "BINGE", "BINGO", "BINNA", "BINNE", "BINOM", "BINÆR",
-  "BISAK", "BISAM", "BISEN", "BISER", "BISKE", "BISKT", "BISLA", "BISLE", "BISNA", "BISNE",
-  "BISOL", "BISON", "BISTO", "BISTÅ", "BITEN", "BITER", "BITES", "BITNE", "BITRE", "BITTA",
-  "BITTE", "BIVRA", "BIVRE", "BIVÅN", "BIZET", "BJEFF", "BJELL", "BJERK", "BJUGN", "BJØRG",
-  "BJØRK", "BJØRN", "BLADA", "BLADD", "BLADR", "BLAFF", "BLAFR", "BLAKK", "BLAKN", "BLAKR",
-  "BLAKT", "BLANC", "BLAND", "BLANK", "BLANT", "BLASS", "BLAST", "BLAUT", "BLEIA", "BLEIE",
-  "BLEIG", "BLEIK", "BLEIV", "BLEKA", "BLEKE", "BLEKK", "BLEKN", "BLEKT", "BLEND", "BLESA",
-  "BLEST", "BLIDE", "BLIDT", "BLIKK", "BLIND", "BLINK", "BLITS", "BLITT", "BLITZ", "BLIVE",
-  "BLOCK", "BLODA", "BLOGG", "BLOKK", "BLOME", "BLOND", "BLOTA", "BLOTE", "BLOTT", "BLUES",
-  "BLUFF", "BLUND", "BLUNK", "BLUSA", "BLUSE", "BLUSS", "BLYET", "BLYGD", "BLYGE", "BLYGT",
-  "BLÅIS", "BLÅNA", "BLÅNE", "BLÅSA", "BLÅSE", "BLÅST", "BLÅTT", "BLÆRA", "BLÆRE", "BLØDD",
-  "BLØFF", "BLØGG", "BLØTE", "BLØTT", "BLØYT", "BOAEN", "BOAER", "BOBBY", "BOBEN", "BOBER",
-  "BOBIL", "BOBIN", "BOBLA", "BOBLE", "BODDE", "BODEN", "BODER", "BODIL", "BODIN", "BOENE",
-  "BOERE", "BOGEN", "BOGER", "BOGES", "BOGET", "BOGEY", "BOGGI", "BOGNA", "BOGNE", "BOHEM",
-  "BOIEN", "BOIER", "BOING", "BOJAR", "BOKEN", "BOKER", "BOKNA", "BOKNE", "BOKSA", "BOKSE",
-  "BOKÅR", "BOLDE", "BOLDT", "BOLEN", "BOLER", "BOLES", "BOLET", "BOLIG", "BOLKA", "BOLKE",
-  "BOLLA", "BOLLE", "BOLNA", "BOLNE", "BOLTA", "BOLTE", "BOLTR", "BOMBA", "BOMBE", "BOMKØ",
-  "BOMMA", "BOMME", "BONDE", "BONER", "BONES", "BONET", "BONGA", "BONGE", "BONGO", "BONTE",
-  "BONUM", "BONUS", "BOOKA", "BOOKE", "BOOTS", "BOPEL", "BOPEN", "BOPER", "BORAT", "BORDA",
-  "BORDE", "BORER", "BORES", "BORET", "BORGA", "BORGE", "BORIS", "BORKA", "BORRA", "BORRE",
-  "BORSJ", "BORTE", "BORTI", "BOSOA", "BOSSA", "BOSSE", "BOTEN", "BOTER", "BOTES", "BOTET",
-  "BOTID", "BOTLA", "BOTNA", "BOTNE", "BOWEN", "BOWER", "BOWLA", "BOWLE", "BOYEN", "BOYER",
-  "BRAGD", "BRAKA", "BRAKE", "BRAKK", "BRAKT", "BRAND", "BRANN", "BRANT", "BRASA", "BRASE",
-  "BRASK", "BRASS", "BRAST", "BRATN", "BRATT", "BRAUT", "BRAVA", "BRAVE", "BRAVO", "BRAVT",
-  "BREDD", "BREDE", "BREDT", "BREEN", "BREER", "BREGD", "BREIA", "BREID", "BREIE", "BREIM",
-  "BREIS", "BREIT", "BREKA", "BREKE", "BREKK", "BREKT", "BREMS", "BRENN", "BRENT", "BREST",
-  "BRETT", "BREVA", "BRIEN", "BRIER", "BRIFA", "BRIFE", "BRIGG", "BRIKS", "BRIMA", "BRING",
-  "BRINK", "BRISE", "BRISK", "BRIST", "BRITA", "BRITE", "BRITT", "BRODD", "BROEN", "BROER",
-  "BROKA", "BROKK", "BROLA", "BRONS", "BROTN", "BROTT", "BROWN", "BRUDA", "BRUDD", "BRUEN",
-  "BRUER", "BRUKA", "BRUKE", "BRUKT", "BRULA", "BRUML", "BRUNA", "BRUNE", "BRUNT", "BRUSA",
-  "BRUSE", "BRUSK", "BRUST", "BRUTT", "BRUUN", "BRYDD", "BRYET", "BRYGG", "BRYNA", "BRYNE",
-  "BRYNT", "BRYSK", "BRYST", "BRYTE", "BRÅKA", "BRÅKE", "BRÅKT", "BRÅNA", "BRÅNE", "BRÅNT",
-  "BRÅTE", "BRÅTT", "BRØDA", "BRØDE", "BRØLA", "BRØLE", "BRØLT", "BRØNN", "BRØNT", "BRØST",
-  "BRØYT", "BUBIL", "BUDDE", "BUDEN", "BUDET", "BUDNE", "BUDTE", "BUDØL", "BUEDE", "BUENE",
-  "BUETE", "BUFAR", "BUFEA", "BUFFE", "BUFFO", "BUFFÉ", "BUFRA", "BUFRE", "BUGGE", "BUGNA",
-  "BUGNE", "BUING", "BUKEN", "BUKER", "BUKES", "BUKET", "BUKKA", "BUKKE", "BUKLA", "BUKLE",
-  "BUKSA", "BUKSE", "BUKTA", "BUKTE", "BULDR", "BULEN", "BULER", "BULES", "BULET", "BULKA",
-  "BULKE", "BULLE", "BULNA", "BULNE", "BULTE", "BUMSA", "BUMSE", "BUNAD", "BUNKA", "BUNKE",
-  "BUNKR", "BUNNA", "BUNNE", "BUNTA", "BUNTE", "BUORM", "BURDE", "BURER", "BURES", "BURET",
-  "BURKA", "BURMA", "BUROT", "BURTE", "BUSEN", "BUSER", "BUSES", "BUSET", "BUSKA", "BUSKE",
-  "BUSSA", "BUSSE", "BUSTA", "BUSTE", "BUTAN", "BUTID", "BUTTA", "BUTTE", "BYBUD", "BYDAG",
-  "BYDDE", "BYDEL", "BYDER", "BYDES", "BYENE", "BYGDA", "BYGDE", "BYGEN", "BYGER", "BYGET",
-  "BYGGA", "BYGGE", "BYGSL", "BYING", "BYKLE", "BYKSA", "BYKSE", "BYKST", "BYLIV", "BYLTA",
-  "BYLTE", "BYMUR", "BYMÅL", "BYNÆR", "BYRDE", "BYRGE", "BYRGT", "BYRÅA", "BYRÅD", "BYSSA",
-  "BYSSE", "BYSTA", "BYSTE", "BYTEN", "BYTTA", "BYTTE", "BYTUR", "BÅENE", "BÅING", "BÅKEN",
-  "BÅKER", "BÅLEN", "BÅLER", "BÅLET", "BÅNDA", "BÅREN", "BÅRER", "BÅRES", "BÅRET", "BÅRNE",
-  "BÅSEN", "BÅSER", "BÅSES", "BÅSET", "BÅSTE", "BÅTEN", "BÅTER", "BÆENE", "BÆRER", "BÆRES",
-  "BÆRET", "BÆRUM", "BÆRÅR", "BÆSJA", "BÆSJE", "BØENE", "BØKEN", "BØKER", "BØKLA", "BØKLE",
-  "BØLEN", "BØLER", "BØLES", "BØLET", "BØLGA", "BØLGE", "BØLLA", "BØLLE", "BØLTE", "BØMLO",
-  "BØNNA", "BØNNE", "BØREK", "BØREN", "BØRER", "BØRGE", "BØRNA", "BØRNE", "BØRRE", "BØRSA",
-  "BØRSE", "BØRST", "BØSSA", "BØSSE", "BØTEN", "BØTER", "BØTES", "BØTTA", "BØTTE", "BØYDE",
-  "BØYEN", "BØYER", "BØYES", "BØYET", "BØYLE", "CADIZ", "CAMPA", "CAMPE", "CAPEN", "CAPER",
-  "CAPRI", "CARGO", "CASEN", "CASER", "CASHA", "CASHE", "CASTA", "CASTE", "CELLA", "CELLE",
-  "CELLO", "CESUR", "CHATT", "CHICE", "CHICT", "CHIEF", "CHILE", "CHILI", "CHIPS", "CHOKA",
-  "CHOKE", "CHUCK", "CIRKA", "CITER", "CLAUS", "CLOUA", "COACH", "COBOL", "COCOM", "CONGA",
-  "CORNY", "CORPS", "COSTA", "COVER", "COVRA", "COVRE", "COXEN", "COXER", "CRACK", "CRAZY",
-  "CREDO", "CREPE", "CREWA", "CROON", "CROSS", "CRUEN", "CRUER", "CRUIS", "CRUXA", "CRÊPE",
-  "CULPA", "CUPEN", "CUPER", "CURIE", "CURLA", "CURLE", "CYANA", "CYKEL", "CYSTE", "CÆSAR",
-  "DABBA", "DABBE", "DACCA", "DACHS", "DADDA", "DADLA", "DADLE", "DAFFA", "DAFFE", "DAGEN",
-  "DAGER", "DAGES", "DAGET", "DAGNA", "DAGNE", "DAHLE", "DAKAR", "DALBU", "DALBY", "DALEN",
-  "DALER", "DALES", "DALET", "DALIT", "DALKA", "DALKE", "DALLA", "DALLE", "DALTA", "DALTE",
-  "DAMEN", "DAMER", "DAMPA", "DAMPE", "DANDY", "DANEN", "DANER", "DANGL", "DANKA", "DANKE",
-  "DANNA", "DANNE", "DANSA", "DANSE", "DANSK", "DARRA", "DARRE", "DASKA", "DASKE", "DASSA",
-  "DATEL", "DATEN", "DATER", "DATES", "DATET", "DATID", "DATIV", "DATOR", "DATUM", "DAUDE",
-  "DAUDT", "DAUER", "DAUES", "DAUET", "DAVID", "DAVIT", "DEBET", "DEBIL", "DEBUT", "DECCA",
-  "DEGGA", "DEGGE", "DEILD", "DEISA", "DEISE", "DEIST", "DEKAN", "DEKAR", "DEKKA", "DEKKE",
-  "DEKOD", "DEKOR", "DEKTE", "DELEN", "DELER", "DELES", "DELET", "DELFI", "DELHI", "DELJA",
-  "DELJE", "DELTA", "DELTE", "DEMMA", "DEMME", "DEMON", "DEMPA", "DEMPE", "DEMRA", "DEMRE",
-  "DEMTE", "DENAR", "DENGE", "DENGT", "DENIM", "DENNE", "DEPOT", "DEPPA", "DEPPE", "DEPTA",
-  "DERAV", "DERBY", "DERES", "DEROM", "DERPÅ", "DERRE", "DESIM", "DESTO", "DETTE", "DEVON",
-  "DEVOT", "DHENE", "DIARE", "DIARÉ", "DIASA", "DIDYM", "DIEDE", "DIEGO", "DIETE", "DIETT",
-  "DIGEL", "DIGER", "DIGGA", "DIGGE", "DIGRE", "DIING", "DIJON", "DIKER", "DIKES", "DIKET",
-  "DIKKA", "DIKKE", "DIKTA", "DIKTE", "DILDO", "DILLA", "DILLE", "DILTA", "DILTE", "DIMEN",
-  "DIMES", "DIMMA", "DIMME", "DIMPL", "DIMTE", "DINAR", "DINER", "DINGL", "DINGO", "DINGS",
-  "DIODE", "DIPOL", "DIRKA", "DIRKE", "DIRRA", "DIRRE", "DISEN", "DISER", "DISES", "DISET",
-  "DISIG", "DISKA", "DISKE", "DISKO", "DISSA", "DISSE", "DITTO", "DIVAN", "DJERV", "DJINN",
-  "DJUPA", "DJUPE", "DJUPN", "DJUPT", "DNEPR", "DOBBA", "DOBBE", "DOBLA", "DOBLE", "DODGE",
-  "DODRE", "DOENE", "DOGEN", "DOGER", "DOGGA", "DOGGE", "DOGMA", "DOGME", "DOKKA", "DOKKE",
-  "DOLCE", "DOLKA", "DOLKE", "DOLPA", "DOMEN", "DOMER", "DOMRA", "DONAU", "DONEN", "DONER",
-  "DONES", "DONET", "DONNA", "DONOR", "DONTE", "DOPEN", "DOPER", "DOPES", "DOPET", "DOPPE",
-  "DOREN", "DORER", "DORES", "DORET", "DORGA", "DORGE", "DORIS", "DORMA", "DORME", "DORSK",
-  "DORTE", "DOSEN", "DOSER", "DOSIS", "DOTER", "DOTTA", "DOTTE", "DOVEN", "DOVER", "DOVNA",
-  "DOVNE", "DOVRE", "DOYEN", "DRADD", "DRAFT", "DRAGA", "DRAGE", "DRAGS", "DRAKE", "DRAKK",
-  "DRAKT", "DRAMA", "DRANK", "DRAPA", "DRASS", "DRATT", "DRAUG", "DREGG", "DREIA", "DREID",
-  "DREIE", "DREIS", "DREIT", "DREIV", "DRENA", "DRENE", "DRENG", "DRENT", "DREPE", "DREPT",
-  "DRESS", "DRETT", "DREVA", "DRIBL", "DRIFT", "DRIKK", "DRIKS", "DRILL", "DRILT", "DRINK",
-  "DRIST", "DRITA", "DRITE", "DRITT", "DRIVA", "DRIVE", "DRODL", "DROGA", "DROGE", "DROGS",
-  "DRONE", "DROPP", "DROPS", "DROSA", "DROTT", "DRUEN", "DRUER", "DRUKN", "DRULT", "DRUNT",
-  "DRYGD", "DRYGE", "DRYGT", "DRYPP", "DRYPT", "DRYSS", "DRYST", "DRÅKA", "DRÅPA", "DRÅPE",
-  "DRÅTT", "DRØFT", "DRØMT", "DRØNN", "DRØNT", "DRØSA", "DRØSE", "DRØSS", "DRØST", "DRØYD",
-  "DRØYE", "DRØYT", "DUBAI", "DUBBA", "DUBBE", "DUBLE", "DUBLÉ", "DUELL", "DUENE", "DUETT",
-  "DUFTA", "DUFTE", "DUGDE", "DUGER", "DUGES", "DUGGA", "DUGGE", "DUKAT", "DUKEN", "DUKER",
-  "DUKES", "DUKET", "DUKKA", "DUKKE", "DULGT", "DULLA", "DULLE", "DULMA", "DULME", "DULTA",
-  "DULTE", "DUMMA", "DUMME", "DUMMY", "DUMPA", "DUMPE", "DUMPT", "DUNDR", "DUNEN", "DUNER",
-  "DUNES", "DUNET", "DUNGA", "DUNGE", "DUNKA", "DUNKE", "DUNSA", "DUNSE", "DUNST", "DUNTE",
-  "DUOEN", "DUOER", "DUPER", "DUPLO", "DUPPA", "DUPPE", "DUREN", "DURER", "DURES", "DURET",
-  "DURRA", "DURTE", "DUSEN", "DUSER", "DUSES", "DUSIN", "DUSJA", "DUSJE", "DUSKA", "DUSKE",
-  "DUSNE", "DUSTA", "DUSTE", "DUSØR", "DUTTA", "DUTTE", "DUVDE", "DUVER", "DUVES", "DUVET",
-  "DVALE", "DVASK", "DVEIL", "DVELE", "DVELT", "DVERG", "DYADE", "DYBDE", "DYDDE", "DYDEN",
-  "DYDER", "DYDIG", "DYENE", "DYGDA", "DYING", "DYKKA", "DYKKE", "DYLLA", "DYLLE", "DYNEN",
-  "DYNER", "DYNGA", "DYNGE", "DYNKA", "DYNKE", "DYNNA", "DYPET", "DYPPA", "DYPPE", "DYRET",
-  "DYRKA", "DYRKE", "DYRØY", "DYSEN", "DYSER", "DYSSA", "DYSSE", "DYSTA", "DYSTE", "DYTTA",
-  "DYTTE", "DYVÅT", "DÅDEN", "DÅDER", "DÅDYR", "DÅENE", "DÅMEN", "DÅMER", "DÅNER", "DÅNES",
-  "DÅNET", "DÅNTE", "DÅPEN", "DÅPER", "DÅREN", "DÅRER", "DÅRES", "DÅRET", "DÅSEN", "DÅSER",
-  "DÅSET", "DÆVEN", "DØDDE", "DØDEN", "DØDER", "DØDES", "DØDET", "DØGNA", "DØING", "DØLEN",
-  "DØLER", "DØLGE", "DØLSK", "DØMER", "DØMET", "DØMME", "DØMTE", "DØNNA", "DØNNE", "DØNTE",
-  "DØPER", "DØPES", "DØPTE", "DØREN", "DØRER", "DØSEN", "DØSER", "DØSES", "DØSET", "DØSIG",
-  "DØSNE", "DØSTE", "DØTRE", "DØVDE", "DØVER", "DØVES", "DØVET", "DØYDE", "DØYER", "DØYES",
-  "DØYET", "DØYVA", "DØYVD", "DØYVE", "EAGLE", "EBBEN", "EBBER", "EBBES", "EBBET", "ECUEN",
-  "EDDEN", "EDDER", "EDDIK", "EDELT", "EDENE", "EDERS", "EDIKT", "EDRUE", "EFUGL", "EGALE",
-  "EGALT", "EGDAL", "EGDEN", "EGDER", "EGDSK", "EGENT", "EGGEN", "EGGER", "EGGES", "EGGET",
-  "EGLER", "EGLES", "EGLET", "EGNEN", "EGNER", "EGNES", "EGNET", "EGNTE", "EGOET", "EGYPT",
-  "EIDEM", "EIDER", "EIDET", "EIEDE", "EIENE", "EIERE", "EIETE", "EIGEN", "EIGNA", "EIGNE",
-  "EIING", "EIKEN", "EIKER", "EILAT", "EIMEN", "EIMER", "EIMES", "EIMET", "EINAR", "EINER",
-  "EIRER", "EIRES", "EIRET", "EIRIK", "EITEL", "EITER", "EITRA", "EITRE", "EKALL", "EKKEL",
-  "EKKOA", "EKORN", "EKREN", "EKRER", "EKSEM", "EKSIL", "EKSIS", "EKSOS", "EKTER", "EKTES",
-  "EKTET", "ELAND", "ELBIL", "ELDAR", "ELDEN", "ELDER", "ELDES", "ELDET", "ELDRE", "ELDST",
-  "ELEDE", "ELEGI", "ELENE", "ELETE", "ELGEN", "ELGER", "ELGES", "ELGET", "ELGKU", "ELIAS",
-  "ELING", "ELITE", "ELKEM", "ELLEF", "ELLEN", "ELLER", "ELLES", "ELLET", "ELLOK", "ELOGE",
-  "ELSKA", "ELSKE", "ELTEN", "ELTER", "ELTES", "ELTET", "ELVEN", "ELVER", "ELVIS", "EMMEN",
-  "EMNER", "EMNES", "EMNET", "EMOJI", "EMUEN", "EMUER", "ENARE", "ENDEN", "ENDER", "ENDES",
-  "ENDIV", "ENDOG", "ENDRA", "ENDRE", "ENDTE", "ENERE", "ENGAN", "ENGEL", "ENGEN", "ENGER",
-  "ENGST", "ENHET", "ENIGE", "ENING", "ENKEL", "ENKEN", "ENKER", "ENKET", "ENKLE", "ENKOM",
-  "ENKÉT", "ENORM", "ENROM", "ENSER", "ENSES", "ENSET", "ENSJØ", "ENSKE", "ENSOM", "ENSTE",
-  "ENTEN", "ENTES", "ENTRA", "ENTRE", "ENTRÉ", "ENVIS", "ENZYM", "ENØRE", "ENØYD", "EOCEN",
-  "EPIKK", "EPISK", "EPLER", "EPLET", "EPOKE", "EPOSA", "ERDAL", "ERFAR", "ERGEN", "ERGRA",
-  "ERGRE", "ERIKA", "ERLEN", "ERLER", "ERMER", "ERMET", "ERNÆR", "EROBR", "ERTEN", "ERTER",
-  "ERTES", "ERTET", "ERTNE", "ERTOG", "ERVIK", "ESING", "ESKEN", "ESKER", "ESKES", "ESKET",
-  "ESLER", "ESLES", "ESLET", "ESPEN", "ESPOO", "ESPRI", "ESSAY", "ESSEN", "ESSER", "ESSET",
-  "ESSEX", "ESTER", "ESTET", "ETANA", "ETERE", "ETIKK", "ETING", "ETISK", "ETLER", "ETLES",
-  "ETLET", "ETSER", "ETSES", "ETSET", "ETTER", "ETTID", "ETUIA", "ETYDE", "ETYLA", "ETYNA",
-  "EVAEN", "EVAER", "EVDØL", "EVEDE", "EVETE", "EVIGE", "EVJEN", "EVJER", "EVNEN", "EVNER",
-  "EVNES", "EVNET", "EXEDE", "EXETE", "FABEL", "FABLA", "FABLE", "FACTS", "FADER", "FADES",
-  "FADET", "FAENS", "FAGER", "FAGET", "FAGNA", "FAGNE", "FAGRE", "FAITA", "FAITE", "FAKIR",
-  "FAKKA", "FAKKE", "FAKLA", "FAKLE", "FAKSA", "FAKSE", "FAKTA", "FAKTE", "FALBY", "FALCH",
-  "FALDA", "FALDE", "FALLA", "FALLE", "FALMA", "FALME", "FALNE", "FALSA", "FALSE", "FALSK",
-  "FALTE", "FALUN", "FAMLA", "FAMLE", "FAMØS", "FANCY", "FANEN", "FANER", "FANES", "FANET",
-  "FANGA", "FANGE", "FARAD", "FARAO", "FAREN", "FARER", "FARES", "FARET", "FARGA", "FARGE",
-  "FARIN", "FARKA", "FARKE", "FARNE", "FARSE", "FARSI", "FARTA", "FARTE", "FARVA", "FARVE",
-  "FASAN", "FASEN", "FASER", "FASES", "FASET", "FASIT", "FASLA", "FASLE", "FASTA", "FASTE",
-  "FASTN", "FATAL", "FATER", "FATES", "FATET", "FATLA", "FATLE", "FATTA", "FATTE", "FATUM",
-  "FATWA", "FATØL", "FAUKA", "FAUKE", "FAUNA", "FAVNA", "FAVNE", "FAVØR", "FAXEN", "FAXER",
-  "FEALA", "FEAVL", "FEBER", "FEBRE", "FECIT", "FEDDA", "FEDDE", "FEDJE", "FEDME", "FEDRE",
-  "FEENE", "FEFOT", "FEIDA", "FEIDE", "FEIER", "FEIES", "FEIET", "FEIGE", "FEIGT", "FEILA",
-  "FEILE", "FEILT", "FEIRA", "FEIRE", "FEITA", "FEITE", "FEITN", "FEITT", "FEKAR", "FEKTA",
-  "FEKTE", "FELEN", "FELER", "FELGA", "FELGE", "FELLA", "FELLE", "FELTA", "FELTE", "FELÅS",
-  "FEMTE", "FEMTI", "FENAD", "FENDR", "FENGA", "FENGE", "FENGT", "FENOL", "FERDA", "FERDE",
-  "FERGA", "FERGE", "FERIE", "FERJA", "FERJE", "FERMA", "FERME", "FERMT", "FERSK", "FERTA",
-  "FERTE", "FESEN", "FESET", "FESJÅ", "FESNE", "FESTA", "FESTE", "FESTN", "FETER", "FETES",
-  "FETET", "FETNA", "FETNE", "FETTA", "FEVIK", "FIANE", "FIBER", "FIBRE", "FIDUS", "FIFFA",
-  "FIFFE", "FIFLA", "FIFLE", "FIGHT", "FIGUR", "FIKEN", "FIKER", "FIKES", "FIKET", "FIKLA",
-  "FIKLE", "FIKNE", "FIKSA", "FIKSE", "FIKST", "FIKTA", "FIKTE", "FILEN", "FILER", "FILES",
-  "FILET", "FILLA", "FILLE", "FILMA", "FILME", "FILTE", "FILTR", "FILTS", "FILUR", "FINAL",
-  "FINER", "FINGR", "FINIS", "FINKE", "FINNE", "FINSE", "FINSK", "FINTA", "FINTE", "FIRER",
-  "FIRES", "FIRET", "FIRMA", "FIRTE", "FISEN", "FISER", "FISES", "FISKA", "FISKE", "FISKÅ",
-  "FISLA", "FISLE", "FISNE", "FISTA", "FISTE", "FISTL", "FITTA", "FITTE", "FJAMS", "FJASA",
-  "FJASE", "FJAST", "FJEDA", "FJELA", "FJELD", "FJELG", "FJELL", "FJERN", "FJERT", "FJESA",
-  "FJESK", "FJETR", "FJOLL", "FJOLS", "FJOMP", "FJONA", "FJONG", "FJORD", "FJOTT", "FJUNA",
-  "FJUSK", "FJÅGE", "FJÅGT", "FJÆRA", "FJÆRE", "FJØLA", "FJØRA", "FJØRE", "FJØSA", "FLABB",
-  "FLAET", "FLAGA", "FLAGE", "FLAGG", "FLAGR", "FLAKA", "FLAKE", "FLAKK", "FLAKN", "FLAKS",
-  "FLAKT", "FLANA", "FLANE", "FLANT", "FLAPS", "FLARA", "FLARE", "FLART", "FLASH", "FLASK",
-  "FLASS", "FLATA", "FLATE", "FLATN", "FLATT", "FLAUA", "FLAUE", "FLAUT", "FLEIP", "FLEIS",
-  "FLEKK", "FLEKS", "FLEKT", "FLENG", "FLENS", "FLERE", "FLERR", "FLESA", "FLESK", "FLEST",
-  "FLETT", "FLIDD", "FLIKK", "FLIMR", "FLINK", "FLINT", "FLIPP", "FLIRA", "FLIRE", "FLIRT",
-  "FLISA", "FLISE", "FLIST", "FLODA", "FLODD", "FLOEN", "FLOER", "FLOES", "FLOET", "FLOGA",
-  "FLOKA", "FLOKE", "FLOKK", "FLOKS", "FLOPP", "FLORA", "FLORØ", "FLOSS", "FLOTT", "FLUDD",
-  "FLUEN", "FLUER", "FLUID", "FLUKS", "FLUKT", "FLUOR", "FLUSH", "FLUSK", "FLUSS", "FLUST",
-  "FLYDD", "FLYEN", "FLYER", "FLYET", "FLYGE", "FLYKT", "FLYSS", "FLYST", "FLYTE", "FLYTT",
-  "FLYVE", "FLÅDD", "FLÅEN", "FLÅER", "FLÅSE", "FLÅST", "FLÅTE", "FLÅTT", "FLÆDD", "FLÆER",
-  "FLÆET", "FLÆRA", "FLÆRE", "FLØDD", "FLØET", "FLØKA", "FLØKE", "FLØKT", "FLØMT", "FLØRT",
-  "FLØTA", "FLØTE", "FLØTT", "FLØYA", "FLØYT", "FNATT", "FNISA", "FNISE", "FNIST", "FNOKK",
-  "FNUGG", "FNYSA", "FNYSE", "FNYST", "FOAJE", "FOAJÉ", "FOKAL", "FOKKA", "FOKUS", "FOLDA",
-  "FOLDE", "FOLEN", "FOLER", "FOLES", "FOLET", "FOLIE", "FOLIO", "FOLKA", "FOLKE", "FOLLA",
-  "FOLLE", "FOLLO", "FOLNA", "FOLNE", "FOMLA", "FOMLE", "FONDA", "FONDS", "FONDY", "FONEM",
-  "FONEN", "FONER", "FONNA", "FONNE", "FOODS", "FORAN", "FORBI", "FORBY", "FORCE", "FORDI",
-  "FORDR", "FOREN", "FORER", "FORES", "FORET", "FORGA", "FORGI", "FORGÅ", "FORKU", "FORLA",
-  "FORMA", "FORME", "FORMÅ", "FORNE", "FORNT", "FORNY", "FORRE", "FORRÅ", "FORSE", "FORSK",
-  "FORST", "FORSÅ", "FORTA", "FORTE", "FORTI", "FORTN", "FORUM", "FORUS", "FORUT", "FORÅR",
-  "FORÆR", "FORØD", "FORØK", "FORØV", "FOSLI", "FOSNA", "FOSSA", "FOSSE", "FOSTR", "FOTEN",
-  "FOTER", "FOTES", "FOTET", "FOTGÅ", "FOTOA", "FOTON", "FRABA", "FRABE", "FRAGÅ", "FRAKK",
-  "FRAKT", "FRALA", "FRAMT", "FRANC", "FRANK", "FRANS", "FRANZ", "FRARÅ", "FRASA", "FRASE",
-  "FRASI", "FRAST", "FRATA", "FRAUA", "FREDA", "FREDE", "FREGA", "FREGE", "FREIA", "FREKK",
-  "FREKT", "FRELS", "FREMT", "FREON", "FRESA", "FRESE", "FREST", "FRETT", "FREUD", "FRIDD",
-  "FRIER", "FRIGA", "FRIGG", "FRIGI", "FRISE", "FRISK", "FRIST", "FRITA", "FRITT", "FRIÅR",
-  "FRODE", "FROGN", "FROMT", "FRONT", "FROSK", "FROST", "FRUEN", "FRUER", "FRUKT", "FRYDA",
-  "FRYDE", "FRYKT", "FRYNS", "FRYSE", "FRYST", "FRÅDA", "FRÅDE", "FRÅSS", "FRÅTS", "FRÆNA",
-  "FRØDD", "FRØET", "FRØSE", "FRØST", "FRØYA", "FRØYS", "FUENE", "FUGEN", "FUGER", "FUGES",
-  "FUGET", "FUKTA", "FUKTE", "FULGT", "FULLE", "FULLT", "FUNKA", "FUNKE", "FUNKL", "FUNNA",
-  "FUNNE", "FUREN", "FURER", "FURES", "FURET", "FURIA", "FURIE", "FURTA", "FURTE", "FURUA",
-  "FUSEL", "FUSEN", "FUSER", "FUSES", "FUSKA", "FUSKE", "FUSSE", "FUSTE", "FUTEN", "FUTER",
-  "FUTIL", "FUTTA", "FUTTE", "FYEDE", "FYETE", "FYING", "FYKEN", "FYKER", "FYKES", "FYKET",
-  "FYLDE", "FYLKA", "FYLKE", "FYLKT", "FYLLA", "FYLLE", "FYLTE", "FYMAT", "FYNDA", "FYORD",
-  "FYREN", "FYRER", "FYRES", "FYRET", "FYRIG", "FYROP", "FYRST", "FYRTE", "FYSAK", "FYSEN",
-  "FYSER", "FYSES", "FYSNE", "FYSTE", "FÅENE", "FÅENT", "FÅING", "FÅREN", "FÅRER", "FÅRET",
-  "FÅTTE", "FÆLEN", "FÆLER", "FÆLES", "FÆLNA", "FÆLNE", "FÆLTE", "FÆRRE", "FÔRER", "FÔRES",
-  "FÔRET", "FÔRTE", "FØDDE", "FØDEN", "FØDER", "FØDES", "FØDTE", "FØING", "FØKEN", "FØKET",
-  "FØKNE", "FØLER", "FØLES", "FØLGA", "FØLGE", "FØLLA", "FØLLE", "FØLTE", "FØNEN", "FØNER",
-  "FØNES", "FØNET", "FØNTE", "FØRDE", "FØRER", "FØRES", "FØRET", "FØRST", "FØRTE", "FØRTI",
-  "FØYDE", "FØYER", "FØYES", "FØYET", "FØYKA", "FØYKE", "FØYKT", "FØYSE", "FØYST", "GABON",
-  "GAFLA", "GAFLE", "GAGEN", "GAGER", "GAGNA", "GAGNE", "GAGNS", "GAIDA", "GAIDE", "GAKKA",
-  "GAKKE", "GALAN", "GALDR", "GALEI", "GALEN", "GALER", "GALES", "GALET", "GALGE", "GALLA",
-  "GALLE", "GALNE", "GALON", "GALTE", "GAMAN", "GAMBE", "GAMBL", "GAMET", "GAMIN", "GAMLA",
-  "GAMLE", "GAMMA", "GAMME", "GAMPA", "GAMPE", "GANDA", "GANDE", "GANEN", "GANER", "GANES",
-  "GANET", "GANGA", "GANGE", "GANTA", "GANTE", "GAPEN", "GAPER", "GAPES", "GAPET", "GAPLE",
-  "GAPLO", "GAPNE", "GAPTE", "GARDE", "GARMO", "GARNA", "GARNE", "GARNI", "GARPA", "GARPE",
-  "GARVA", "GARVE", "GASEN", "GASER", "GASJE", "GASSA", "GASSE", "GASTA", "GATEN", "GATER",
-  "GATTA", "GAUDA", "GAUGE", "GAUKA", "GAUKE", "GAULA", "GAULE", "GAULT", "GAUMA", "GAUME",
-  "GAUPA", "GAUPE", "GAUSS", "GAVEN", "GAVER", "GEARA", "GEBET", "GEBYR", "GEHØR", "GEILA",
-  "GEILE", "GEILO", "GEILT", "GEINA", "GEINE", "GEINT", "GEIPA", "GEIPE", "GEIPT", "GEIRA",
-  "GEIRE", "GEIRT", "GEIST", "GEITA", "GEITE", "GEKKO", "GELEN", "GELER", "GEMAL", "GEMEN",
-  "GEMME", "GEMSE", "GENEN", "GENER", "GENET", "GENIA", "GENOM", "GENRE", "GENUS", "GEODE",
-  "GEORG", "GERDA", "GERER", "GERÅD", "GETTO", "GEVIR", "GEVÆR", "GHANA", "GIDDE", "GIDNE",
-  "GIFTA", "GIFTE", "GIGGA", "GIGGE", "GIKTA", "GILDA", "GILDE", "GILDR", "GILDT", "GILJE",
-  "GIMPA", "GIMPE", "GIMRA", "GIMRE", "GIMSE", "GINEN", "GINER", "GINES", "GINET", "GINNE",
-  "GINTE", "GIPSA", "GIPSE", "GIPST", "GIREN", "GIRER", "GIRES", "GIRET", "GIRTE", "GISKE",
-  "GISLA", "GISLE", "GISNA", "GISNE", "GISPA", "GISPE", "GISSA", "GISSE", "GITAR", "GITRA",
-  "GITRE", "GITTE", "GIVEN", "GIVER", "GJALL", "GJEIP", "GJEKK", "GJELA", "GJELD", "GJELL",
-  "GJELT", "GJEMT", "GJENE", "GJENG", "GJENT", "GJEPE", "GJEPT", "GJERD", "GJERT", "GJESP",
-  "GJESS", "GJEST", "GJETA", "GJETE", "GJETT", "GJEVE", "GJEVT", "GJORD", "GJORS", "GJORT",
-  "GJURA", "GJURE", "GJURT", "GJÆRA", "GJÆRE", "GJÆRT", "GJØDD", "GJØDE", "GJØEN", "GJØER",
-  "GJØET", "GJØGL", "GJØLE", "GJØLT", "GJØMT", "GJØNA", "GJØNE", "GJØNT", "GJØRE", "GJØRM",
-  "GJØRS", "GLACE", "GLACÉ", "GLADA", "GLADD", "GLADE", "GLAFS", "GLANE", "GLANS", "GLANT",
-  "GLAPP", "GLASA", "GLASS", "GLATT", "GLEDA", "GLEDD", "GLEDE", "GLEFS", "GLEMT", "GLENN",
-  "GLEPP", "GLETT", "GLIDA", "GLIDD", "GLIDE", "GLIMA", "GLIME", "GLIMR", "GLIMT", "GLINS",
-  "GLIOM", "GLIPA", "GLIPE", "GLIPP", "GLIPT", "GLIRE", "GLIRT", "GLISA", "GLISE", "GLISN",
-  "GLIST", "GLITR", "GLITT", "GLODD", "GLOEN", "GLORA", "GLORE", "GLORT", "GLOSA", "GLOSE",
-  "GLOVA", "GLOVE", "GLUGG", "GLUPE", "GLUPT", "GLØDA", "GLØDD", "GLØDE", "GLØGG", "GLØGT",
-  "GLØMT", "GLØSE", "GLØST", "GLØTT", "GNAFS", "GNAGA", "GNAGD", "GNAGE", "GNALL", "GNASK",
-  "GNAVA", "GNAVL", "GNEIS", "GNELL", "GNELT", "GNIDD", "GNIDR", "GNIER", "GNIKK", "GNIKS",
-  "GNIRK", "GNISL", "GNISS", "GNIST", "GNOME", "GNUBB", "GNUDD", "GNUEN", "GNUER", "GNUGG",
-  "GNUKK", "GNURA", "GNURE", "GNURT", "GNUSL", "GNUSS", "GNYDD", "GNYET", "GNÅLA", "GNÅLE",
-  "GNÅLT", "GODEN", "GODER", "GODET", "GODSA", "GODTA", "GODTE", "GODØY", "GOGNA", "GOJIM",
-  "GOLDE", "GOLDT", "GOLVA", "GOMLA", "GOMLE", "GOMME", "GONEN", "GOOGL", "GOPLA", "GOPLE",
-  "GOROA", "GORRA", "GOTER", "GOUDA", "GOVEN", "GOVER", "GOVES", "GOVET", "GRABB", "GRACE",
-  "GRADA", "GRADE", "GRAFS", "GRAMS", "GRAMT", "GRANA", "GRAND", "GRANE", "GRANN", "GRANT",
-  "GRAPS", "GRASA", "GRASE", "GRAUT", "GRAVA", "GRAVD", "GRAVE", "GREAT", "GREDD", "GREEN",
-  "GREIA", "GREID", "GREIE", "GREIN", "GREIP", "GREIT", "GRELL", "GRELT", "GREMT", "GRENA",
-  "GREND", "GRENE", "GRENS", "GRENT", "GREPA", "GREPP", "GRESK", "GRESS", "GRETA", "GRETE",
-  "GREVA", "GREVE", "GRIBB", "GRIDA", "GRIEG", "GRIFF", "GRILL", "GRIMA", "GRIME", "GRIMT",
-  "GRINA", "GRIND", "GRINE", "GRINI", "GRINT", "GRIPE", "GRISA", "GRISE", "GRISK", "GRISL",
-  "GRISN", "GRIST", "GRJOT", "GRODD", "GROEN", "GROER", "GROGG", "GROMT", "GRONG", "GROPA",
-  "GROPE", "GROSS", "GROVE", "GROVT", "GRUBL", "GRUDD", "GRUEN", "GRUER", "GRUES", "GRUET",
-  "GRUFF", "GRUGG", "GRUKK", "GRUMS", "GRUMT", "GRUNK", "GRUNN", "GRUNT", "GRUSA", "GRUSE",
-  "GRUSK", "GRUVA", "GRUVE", "GRYDD", "GRYET", "GRYNA", "GRYNE", "GRYNT", "GRYTA", "GRYTE",
-  "GRÅEN", "GRÅER", "GRÅLE", "GRÅLT", "GRÅNA", "GRÅNE", "GRÅOR", "GRÅTE", "GRÅTT", "GRØDA",
-  "GRØDD", "GRØDE", "GRØFT", "GRØNK", "GRØNN", "GRØNT", "GRØPP", "GRØPT", "GRØSS", "GRØST",
-  "GUANO", "GUBBE", "GUDEN", "GUDER", "GUFFA", "GUFFE", "GUFNE", "GUFSA", "GUFSE", "GUGGA",
-  "GUGGE", "GUIDA", "GUIDE", "GULEN", "GULER", "GULES", "GULET", "GULKA", "GULKE", "GULLA",
-  "GULNA", "GULNE", "GULPA", "GULPE", "GULVA", "GUMMI", "GUNST", "GURGL", "GURID", "GURPA",
-  "GURPE", "GUSTA", "GUSTE", "GUSTN", "GUTEN", "GUTER", "GUTUA", "GVARV", "GYDJA", "GYDJE",
-  "GYGER", "GYGRA", "GYGRE", "GYLLE", "GYLNA", "GYLNE", "GYLTA", "GYLTE", "GYMMA", "GYMME",
-  "GYNGA", "GYNGE", "GYSER", "GYSES", "GYSET", "GYSJA", "GYSJE", "GYSTE", "GYTEN", "GYTER",
-  "GYTES", "GYTJA", "GYTJE", "GYTTE", "GYVDE", "GYVEL", "GYVER", "GYVES", "GYVET", "GÅENE",
-  "GÅENT", "GÅING", "GÅREN", "GÅRER", "GÅRES", "GÅRET", "GÅSEN", "GÅTEN", "GÅTER", "GÅTTE",
-  "GÆLER", "GÆREN", "GÆRNA", "GÆRNE", "GÆÆRN", "GÊNEN", "GÊNER", "GÖRAN", "GÖSTA", "GØLVA",
-  "GØRAN", "GØRIL", "GØRRA", "GØRRE", "GØSTA", "GØYAL", "GØYER", "GØYES", "GØYET", "GØYSE",
-  "GØYST", "HAAVE", "HABIL", "HACKA", "HACKE", "HADDE", "HADSJ", "HAGEL", "HAGEN", "HAGER",
-  "HAGLA", "HAGLE", "HAIEN", "HAIER", "HAIES", "HAIET", "HAIFA", "HAIKA", "HAIKE", "HAIKU",
-  "HAING", "HAITI", "HAKEN", "HAKER", "HAKES", "HAKET", "HAKKA", "HAKKE", "HAKTE", "HALAL",
-  "HALDA", "HALEN", "HALER", "HALES", "HALET", "HALLA", "HALLE", "HALLO", "HALMA", "HALON",
-  "HALSA", "HALSE", "HALTA", "HALTE", "HALVA", "HALVE", "HALVT", "HAMAR", "HAMBO", "HAMLA",
-  "HAMLE", "HAMNA", "HAMNE", "HAMRA", "HAMRE", "HAMSA", "HAMSE", "HANDA", "HANDL", "HANDS",
-  "HANEN", "HANER", "HANGL", "HANKA", "HANKE", "HANNA", "HANNE", "HANOI", "HANSA", "HANSE",
-  "HAPPY", "HARAM", "HARDE", "HARDN", "HARDT", "HAREM", "HAREN", "HARER", "HARKA", "HARKE",
-  "HARMA", "HARME", "HARMT", "HARPA", "HARPE", "HARPY", "HARRY", "HARSK", "HARVA", "HARVE",
-  "HASEN", "HASER", "HASJA", "HASJE", "HASPA", "HASPE", "HASPL", "HASTA", "HASTE", "HATER",
-  "HATES", "HATET", "HATIG", "HATSK", "HAUGA", "HAUGE", "HAUKA", "HAUKE", "HAULD", "HAUSA",
-  "HAUSS", "HAVET", "HAVIS", "HAVNA", "HAVNE", "HAVRE", "HAVÅL", "HEADA", "HEADE", "HEATA",
-  "HEDDA", "HEDDE", "HEDEN", "HEDER", "HEDRA", "HEDRE", "HEDØL", "HEFTA", "HEFTE", "HEGDA",
-  "HEGDE", "HEGEL", "HEGEM", "HEGGE", "HEGNA", "HEGNE", "HEGRA", "HEGRE", "HEIDI", "HEIEN",
-  "HEIER", "HEIES", "HEIET", "HEILE", "HEILO", "HEILT", "HEIMA", "HEIME", "HEIML", "HEINE",
-  "HEINT", "HEISA", "HEISE", "HEIST", "HEITE", "HEITI", "HEITN", "HEITT", "HEKKA", "HEKKE",
-  "HEKLA", "HEKLE", "HEKSA", "HEKSE", "HEKTA", "HEKTE", "HEKTO", "HELDA", "HELDE", "HELEN",
-  "HELER", "HELES", "HELET", "HELGA", "HELGE", "HELLA", "HELLE", "HELLY", "HELOT", "HELSA",
-  "HELSE", "HELST", "HELTE", "HELVT", "HEMMA", "HEMME", "HEMNE", "HEMPA", "HEMPE", "HENAD",
-  "HENDA", "HENDE", "HENDT", "HENGA", "HENGE", "HENGI", "HENGT", "HENLA", "HENNA", "HENNE",
-  "HENRY", "HENTA", "HENTE", "HEPNE", "HEPPA", "HEPPE", "HERAV", "HERDA", "HERDE", "HERDN",
-  "HERJA", "HERJE", "HERKA", "HERKE", "HERKT", "HERMA", "HERME", "HERMT", "HEROM", "HEROS",
-  "HERPA", "HERPE", "HERPÅ", "HERRE", "HERSA", "HERSE", "HERSK", "HERTZ", "HERØY", "HESJA",
-  "HESJE", "HESPA", "HESPE", "HESPL", "HETEN", "HETER", "HETES", "HETET", "HETNA", "HETNE",
-  "HETSA", "HETSE", "HETTA", "HETTE", "HEVDA", "HEVDE", "HEVEN", "HEVER", "HEVES", "HEVET",
-  "HEVLA", "HEVLE", "HEVNA", "HEVNE", "HIEDE", "HIENE", "HIETE", "HIGEN", "HIGER", "HIGES",
-  "HIGET", "HIJAB", "HIKKA", "HIKKE", "HIKST", "HILDA", "HILDE", "HILDR", "HILSE", "HILST",
-  "HIMEN", "HIMER", "HIMLA", "HIMLE", "HINDA", "HINDI", "HINDR", "HINDU", "HINKA", "HINKE",
-  "HINNA", "HINNE", "HINTA", "HINTE", "HIPER", "HIPES", "HIPET", "HIPNE", "HIPPA", "HIPPE",
-  "HIPTE", "HIRDA", "HIREN", "HIRER", "HIRES", "HIRNE", "HIRSE", "HIRTE", "HISSA", "HISSE",
-  "HISØY", "HITEN", "HITER", "HITRA", "HITRE", "HITTA", "HITTE", "HIVDE", "HIVEN", "HIVER",
-  "HIVES", "HIVET", "HJALP", "HJALT", "HJELL", "HJELM", "HJELP", "HJEML", "HJONA", "HJORD",
-  "HJORT", "HJULA", "HJULE", "HJUPA", "HJUPE", "HJÅMA", "HOBBY", "HOBØL", "HOCKE", "HODDA",
-  "HODDE", "HODER", "HODET", "HODNE", "HODØL", "HOFFA", "HOFTA", "HOFTE", "HOGDE", "HOGGA",
-  "HOGGE", "HOGST", "HOIER", "HOIES", "HOIET", "HOKKA", "HOLDA", "HOLDE", "HOLDT", "HOLEN",
-  "HOLER", "HOLES", "HOLET", "HOLKA", "HOLKE", "HOLME", "HOLNA", "HOLNE", "HOLST", "HOLTA",
-  "HOLTE", "HOLTH", "HOLUM", "HOMMA", "HOMME", "HOMSE", "HONDA", "HONEN", "HONER", "HOPEN",
-  "HOPER", "HOPES", "HOPET", "HOPPA", "HOPPE", "HORDE", "HOREN", "HORER", "HORES", "HORET",
-  "HORGA", "HORKA", "HORNA", "HORSA", "HORSE", "HORST", "HORTE", "HOSEN", "HOSER", "HOSTA",
-  "HOSTE", "HOTEN", "HOTER", "HOTES", "HOTET", "HOUSE", "HOVDA", "HOVDE", "HOVEL", "HOVEN",
-  "HOVER", "HOVET", "HOVIN", "HOVNA", "HOVNE", "HUBRO", "HUDEN", "HUDER", "HUENE", "HUFFA",
-  "HUFSA", "HUFSE", "HUGAL", "HUGAV", "HUGDE", "HUGEN", "HUGER", "HUGES", "HUGET", "HUGGA",
-  "HUGGE", "HUGST", "HUGTA", "HUHEI", "HUIER", "HUIES", "HUIET", "HUKEN", "HUKER", "HUKES",
-  "HUKET", "HUKKA", "HUKRA", "HUKRE", "HUKTE", "HULAG", "HULEN", "HULER", "HULES", "HULET",
-  "HULKA", "HULKE", "HULLA", "HULLE", "HULTE", "HUMAN", "HUMID", "HUMLA", "HUMLE", "HUMOR",
-  "HUMPA", "HUMPE", "HUMRA", "HUMRE", "HUMUL", "HUMUS", "HUMØR", "HUNDS", "HUNEN", "HUNER",
-  "HUNGR", "HURON", "HURPA", "HURPE", "HURRA", "HURRE", "HURUM", "HUSAR", "HUSER", "HUSES",
-  "HUSET", "HUSKA", "HUSKE", "HUSKY", "HUSKØ", "HUSLY", "HUSTE", "HUSTR", "HUTER", "HUTES",
-  "HUTET", "HUTLA", "HUTLE", "HUTRA", "HUTRE", "HVALP", "HVASS", "HVAST", "HVELV", "HVERT",
-  "HVESA", "HVESE", "HVESS", "HVEST", "HVETE", "HVILA", "HVILE", "HVILT", "HVINA", "HVINE",
-  "HVINT", "HVISK", "HVISL", "HVITE", "HVITN", "HVITT", "HVORI", "HYBEL", "HYDRA", "HYDRO",
-  "HYENE", "HYERE", "HYETE", "HYFEN", "HYFER", "HYGDE", "HYGEA", "HYGGA", "HYGGE", "HYKLA",
-  "HYKLE", "HYLER", "HYLES", "HYLET", "HYLLA", "HYLLE", "HYLSA", "HYLSE", "HYLTE", "HYMEN",
-  "HYMNE", "HYNDA", "HYNDE", "HYNNA", "HYNNE", "HYPPA", "HYPPE", "HYRDE", "HYREN", "HYRER",
-  "HYRES", "HYRET", "HYRTE", "HYSEN", "HYSER", "HYSJA", "HYSJE", "HYSSA", "HYSSE", "HYTTA",
-  "HYTTE", "HÅENE", "HÅGEN", "HÅKON", "HÅLKA", "HÅLKE", "HÅNDA", "HÅNEN", "HÅNER", "HÅNES",
-  "HÅNET", "HÅNLE", "HÅNLO", "HÅNSK", "HÅNTE", "HÅPER", "HÅPES", "HÅPET", "HÅPTE", "HÅRDE",
-  "HÅRDT", "HÅREK", "HÅRET", "HÅVEN", "HÅVER", "HÅVES", "HÅVET", "HÅVIK", "HÆLEN", "HÆLER",
-  "HÆLES", "HÆLET", "HÆLTE", "HÆREN", "HÆRER", "HÆRTA", "HØEGH", "HØENE", "HØGDA", "HØGDE",
-  "HØGRA", "HØGRE", "HØIBY", "HØKER", "HØKRA", "HØKRE", "HØLEN", "HØLER", "HØLES", "HØLJA",
-  "HØLJE", "HØLKA", "HØLKE", "HØLTE", "HØNEN", "HØNER", "HØNSA", "HØNSE", "HØRER", "HØRES",
-  "HØRTE", "HØSTA", "HØSTE", "HØVDE", "HØVEL", "HØVER", "HØVES", "HØVET", "HØVIK", "HØVLA",
-  "HØVLE", "HØVÅG", "HØYDE", "HØYER", "HØYES", "HØYET", "HØYMO", "HØYNA", "HØYNE", "HØYRA",
-  "HØYRE", "HØYST", "HØYÅR", "IBIZA", "IBOEN", "IBOER", "IBSEN", "ICING", "IDAHO", "IDEAL",
-  "IDEEN", "IDEER", "IDENE", "IDENT", "IDEST", "IDIGE", "IDIOM", "IDIOT", "IDKEN", "IDKER",
-  "IDKES", "IDKET", "IDOEN", "IDOER", "IDOLA", "IDYLL", "IDÉEN", "IDÉER", "IDØMT", "IFJOR",
-  "IFYLL", "IFYLT", "IFØRE", "IFØRT", "IGDEN", "IGDER", "IGJEN", "IGLEN", "IGLER", "IGLES",
-  "IGLET", "IGUAN", "IHUGA", "IKKEN", "IKKER", "IKLER", "IKLES", "IKONA", "IKTEN", "IKTER",
-  "IKTUS", "ILAGT", "ILAND", "ILBUD", "ILDEN", "ILDER", "ILDES", "ILDET", "ILDNA", "ILDNE",
-  "ILDRE", "ILEGG", "ILENE", "ILIGN", "ILIKN", "ILING", "ILKEN", "ILKER", "ILSKA", "ILSKE",
-  "ILSKN", "ILSOM", "ILTER", "ILTOG", "ILTRE", "IMAGA", "IMAGE", "IMAGO", "IMENS", "IMMUN",
-  "IMØTE", "INARI", "INATT", "INDER", "INDIA", "INDRE", "INERT", "INFAM", "INFUS", "INGAR",
-  "INGEN", "INGER", "INGRI", "INGUN", "INNAD", "INNBA", "INNBE", "INNBO", "INNBU", "INNBY",
-  "INNEN", "INNGA", "INNGI", "INNGÅ", "INNLA", "INNOM", "INNPÅ", "INNSE", "INNSÅ", "INNTA",
-  "INNVI", "INNÅT", "INNØV", "INPUT", "INTET", "INTIM", "IONER", "IONET", "IRENE", "IRING",
-  "IRISK", "IRONI", "IRRER", "IRRES", "IRRET", "IRSKE", "ISAND", "ISBAR", "ISBIT", "ISBLÅ",
-  "ISBOR", "ISBRE", "ISEDE", "ISENE", "ISETE", "ISFOT", "ISFRI", "ISHAV", "ISHUD", "ISHUS",
-  "ISING", "ISLAG", "ISLAM", "ISLOM", "ISMEN", "ISMER", "ISNER", "ISNES", "ISNET", "ISNÅL",
-  "ISPER", "ISPES", "ISPIL", "ISRES", "ISSEN", "ISSER", "ISTEM", "ISTER", "ISTID", "ISTRA",
-  "ISTRE", "ISØDA", "ISØDE", "ISØKS", "ITLEN", "ITLER", "IVALO", "IVDØL", "IVERE", "IVEVD",
-  "IVRER", "IVRES", "IVRET", "IVRIG", "IZMIR", "JABBA", "JABBE", "JACOB", "JADEN", "JADER",
-  "JAENE", "JAFFA", "JAFSA", "JAFSE", "JAGDE", "JAGER", "JAGES", "JAGET", "JAGGU", "JAHRE",
-  "JAHVE", "JAKEN", "JAKER", "JAKKA", "JAKKE", "JAKKU", "JAKOB", "JAKTA", "JAKTE", "JALMA",
-  "JALME", "JALTA", "JAMBE", "JAMEN", "JAMMA", "JAMME", "JAMNA", "JAMNE", "JAMRA", "JAMRE",
-  "JAMTE", "JANEN", "JANER", "JANUS", "JAORD", "JAPAN", "JAREN", "JARER", "JARES", "JARET",
-  "JARLE", "JASKA", "JASKE", "JASSA", "JASSE", "JATTA", "JATTE", "JAVEL", "JAZZA", "JAZZE",
-  "JEANS", "JEGER", "JEGET", "JEKKA", "JEKKE", "JEKTA", "JELKA", "JELKE", "JELSA", "JEMTE",
-  "JENKA", "JENKE", "JENNY", "JENTA", "JENTE", "JERNA", "JERPA", "JERPE", "JESUS", "JETEN",
-  "JETER", "JETTE", "JEVNA", "JEVNE", "JEVNT", "JIBBA", "JIBBE", "JIDDA", "JINGO", "JIPPO",
-  "JIVEN", "JIVER", "JOBBA", "JOBBE", "JODEN", "JODER", "JODET", "JODID", "JODLA", "JODLE",
-  "JOENE", "JOGGA", "JOGGE", "JOGGU", "JOHAN", "JOIKA", "JOIKE", "JOKER", "JOLEN", "JOLER",
-  "JOLLA", "JOLLE", "JONAS", "JONER", "JORDA", "JORDE", "JORTA", "JORTE", "JORUN", "JOSEF",
-  "JOTUN", "JOULE", "JUBEL", "JUBLA", "JUBLE", "JUDAS", "JUGDE", "JUGER", "JUGES", "JUGET",
-  "JUGLA", "JUGLE", "JUICE", "JUKSA", "JUKSE", "JULEN", "JULER", "JULES", "JULIA", "JULLA",
-  "JULLE", "JULTE", "JUMBO", "JUMPA", "JUMPE", "JUNGE", "JUNKA", "JUNKE", "JUNTA", "JURET",
-  "JURIS", "JUSEN", "JUSER", "JUTEN", "JUTER", "JUTUL", "JUVEL", "JUVET", "JYDEN", "JYDER",
-  "JYSKE", "JÅLEN", "JÅLER", "JÅLES", "JÅLET", "JÅLTE", "JÆKEL", "JÆKLA", "JÆRBU", "JÆREN",
-  "JÆRSK", "JÆVEL", "JÆVLA", "JÆVLI", "JØDEN", "JØDER", "JØGLA", "JØGLE", "JØKEL", "JØMNA",
-  "JØYER", "JØYES", "JØYET", "KAARE", "KAASA", "KABAL", "KABBA", "KABBE", "KABEL", "KABIN",
-  "KABLA", "KABLE", "KABUL", "KABYL", "KADER", "KADRE", "KAFFE", "KAFIR", "KAFKA", "KAGGA",
-  "KAGGE", "KAIEN", "KAIER", "KAIES", "KAIET", "KAIRO", "KAJAL", "KAKAO", "KAKEN", "KAKER",
-  "KAKES", "KAKET", "KAKKA", "KAKKE", "KAKLA", "KAKLE", "KAKSA", "KAKSE", "KALAS", "KALDE",
-  "KALDT", "KALEN", "KALER", "KALIA", "KALIF", "KALKA", "KALKE", "KALLA", "KALLE", "KALTE",
-  "KALUN", "KALVA", "KALVE", "KAMBO", "KAMEL", "KAMIN", "KAMMA", "KAMME", "KAMRA", "KAMRE",
-  "KAMSA", "KAMSE", "KANAK", "KANAL", "KANEL", "KANEN", "KANER", "KANIN", "KANNA", "KANNE",
-  "KANON", "KANTA", "KANTE", "KANTR", "KAOSA", "KAPER", "KAPOK", "KAPPA", "KAPPE", "KAPRA",
-  "KAPRE", "KAPSL", "KAPUN", "KARAT", "KARDA", "KARDE", "KAREN", "KARER", "KARES", "KARET",
-  "KARGO", "KARIB", "KARIN", "KARMA", "KARPE", "KARRA", "KARRE", "KARRI", "KARRÉ", "KARSE",
-  "KARSK", "KARTA", "KARTE", "KARVA", "KARVE", "KASEN", "KASER", "KASES", "KASET", "KASKO",
-  "KASSA", "KASSE", "KASTA", "KASTE", "KASUS", "KATAR", "KATEN", "KATER", "KATET", "KATTA",
-  "KATTE", "KAUER", "KAUES", "KAUET", "KAUKA", "KAUKE", "KAUPA", "KAUSE", "KAUTE", "KAVAI",
-  "KAVDE", "KAVEN", "KAVER", "KAVES", "KAVET", "KAVLA", "KAVLE", "KEBAB", "KEDIV", "KEENE",
-  "KEFIR", "KEIER", "KEIES", "KEIET", "KEIKA", "KEIKE", "KEIKT", "KEITA", "KEITE", "KEIVA",
-  "KEIVE", "KEIVL", "KEIVT", "KELAT", "KELIM", "KENDO", "KENYA", "KERAM", "KETON", "KHMER",
-  "KIBBA", "KIBBE", "KICKA", "KIDET", "KIJEV", "KIKEN", "KIKER", "KIKES", "KIKET", "KIKKA",
-  "KIKKE", "KIKNA", "KIKNE", "KIKRA", "KIKRE", "KIKSA", "KIKSE", "KIKTE", "KIKUT", "KILDE",
-  "KILDR", "KILEN", "KILER", "KILES", "KILET", "KILLA", "KILLE", "KILNE", "KILOA", "KILTE",
-  "KIMEN", "KIMER", "KIMES", "KIMET", "KIMSA", "KIMSE", "KIMTE", "KINGA", "KINGE", "KINGS",
-  "KININ", "KINKA", "KINKE", "KINKS", "KINNA", "KINNE", "KIOSK", "KIPEN", "KIPER", "KIPNE",
-  "KIPPA", "KIPPE", "KIPTE", "KIRKA", "KIRKE", "KIROV", "KISEL", "KISEN", "KISER", "KISES",
-  "KISET", "KISLA", "KISLE", "KISTA", "KISTE", "KITIN", "KITLA", "KITLE", "KITTA", "KITTE",
-  "KIVDE", "KIVER", "KIVES", "KIVET", "KJAKA", "KJAKE", "KJAKS", "KJAPP", "KJAPT", "KJASA",
-  "KJASE", "KJAST", "KJAVA", "KJAVD", "KJAVE", "KJEDA", "KJEDE", "KJEDT", "KJEER", "KJEES",
-  "KJEET", "KJEFT", "KJEIA", "KJEKK", "KJEKL", "KJEKS", "KJEKT", "KJELD", "KJELE", "KJELL",
-  "KJEMI", "KJEMP", "KJEMT", "KJENG", "KJENN", "KJENT", "KJEPP", "KJERA", "KJERN", "KJERR",
-  "KJERV", "KJESE", "KJESK", "KJEST", "KJEVE", "KJEVL", "KJIPE", "KJIPT", "KJOKS", "KJOLE",
-  "KJONA", "KJONE", "KJUKA", "KJUKE", "KJÆLE", "KJÆLT", "KJÆRE", "KJÆRT", "KJÆTA", "KJÆTE",
-  "KJÆTT", "KJØDA", "KJØEN", "KJØER", "KJØLD", "KJØLE", "KJØLN", "KJØLT", "KJØMD", "KJØNE",
-  "KJØNN", "KJØNT", "KJØPA", "KJØPE", "KJØPT", "KJØRA", "KJØRE", "KJØRN", "KJØRT", "KJØTT",
-  "KJØVA", "KJØVD", "KJØVE", "KLABB", "KLADD", "KLAFF", "KLAGA", "KLAGD", "KLAGE", "KLAKA",
-  "KLAKE", "KLAKK", "KLAMP", "KLAMR", "KLAMT", "KLANG", "KLANT", "KLAPP", "KLAPR", "KLAPS",
-  "KLARA", "KLARE", "KLARN", "KLART", "KLASA", "KLASE", "KLASK", "KLASS", "KLAST", "KLATR",
-  "KLATT", "KLAUS", "KLAUV", "KLAVA", "KLAVD", "KLAVE", "KLEBA", "KLEBE", "KLEBT", "KLEDA",
-  "KLEDD", "KLEDE", "KLEGG", "KLEIA", "KLEID", "KLEIE", "KLEIM", "KLEIN", "KLEIP", "KLEIS",
-  "KLEIV", "KLEKK", "KLEKT", "KLEMT", "KLENE", "KLENG", "KLENT", "KLEPP", "KLERK", "KLESS",
-  "KLEST", "KLETT", "KLEVE", "KLIEN", "KLIET", "KLIKK", "KLIMA", "KLINA", "KLINE", "KLING",
-  "KLINK", "KLINT", "KLIPA", "KLIPE", "KLIPP", "KLIPS", "KLIPT", "KLIRR", "KLISS", "KLIVD",
-  "KLIVE", "KLODE", "KLOEN", "KLOKE", "KLOKK", "KLOKT", "KLONA", "KLONE", "KLOPP", "KLORA",
-  "KLORE", "KLORT", "KLOSS", "KLOVA", "KLOVE", "KLOVN", "KLUBB", "KLUDR", "KLUFT", "KLUKK",
-  "KLUKT", "KLUMP", "KLUMS", "KLUNK", "KLUNS", "KLUSS", "KLYNG", "KLYNK", "KLYPA", "KLYPE",
-  "KLYPT", "KLYSA", "KLYSE", "KLYSS", "KLYVA", "KLYVD", "KLYVE", "KLÅDD", "KLÅEN", "KLÅER",
-  "KLÅTA", "KLÅTE", "KLÆBU", "KLØDD", "KLØEN", "KLØER", "KLØFT", "KLØKK", "KLØKT", "KLØNA",
-  "KLØNE", "KLØNT", "KLØVA", "KLØVD", "KLØVE", "KLØVJ", "KLØVN", "KLØVT", "KLØYV", "KNABB",
-  "KNADD", "KNAGG", "KNAKA", "KNAKE", "KNAKK", "KNAKT", "KNALL", "KNAPP", "KNAPT", "KNARK",
-  "KNARR", "KNART", "KNASA", "KNASE", "KNASK", "KNAST", "KNATR", "KNATT", "KNAUS", "KNEBL",
-  "KNEER", "KNEES", "KNEET", "KNEGA", "KNEGD", "KNEGE", "KNEGG", "KNEGÅ", "KNEIK", "KNEIP",
-  "KNEIS", "KNEKK", "KNEKT", "KNELE", "KNELT", "KNEPA", "KNEPP", "KNEPR", "KNEPT", "KNERT",
-  "KNEST", "KNETT", "KNIKS", "KNIPA", "KNIPE", "KNIPL", "KNIPP", "KNIPS", "KNIRK", "KNISA",
-  "KNISE", "KNISL", "KNIST", "KNITR", "KNIVA", "KNIVE", "KNOCK", "KNODD", "KNODE", "KNOGA",
-  "KNOGE", "KNOKE", "KNOLL", "KNOPA", "KNOPE", "KNOPP", "KNORT", "KNOTA", "KNOTE", "KNOTT",
-  "KNUBB", "KNUEN", "KNUER", "KNUFF", "KNUGA", "KNUGE", "KNULL", "KNULT", "KNUPP", "KNUPS",
-  "KNURK", "KNURP", "KNURR", "KNURV", "KNUSE", "KNUSK", "KNUSL", "KNUSP", "KNUST", "KNUTA",
-  "KNUTE", "KNUTT", "KNUVL", "KNYDD", "KNYET", "KNYST", "KNYTE", "KNYTT", "KNØEN", "KNØTT",
-  "KOAKS", "KOALA", "KOBBE", "KOBLA", "KOBLE", "KOBRA", "KODAK", "KODDE", "KODEN", "KODER",
-  "KODES", "KODET", "KOFTA", "KOFTE", "KOGGE", "KOGLA", "KOGLE", "KOGRA", "KOGRE", "KOIEN",
-  "KOIER", "KOKEN", "KOKER", "KOKES", "KOKET", "KOKKA", "KOKKE", "KOKOS", "KOKRA", "KOKRE",
-  "KOKSA", "KOKSE", "KOKTE", "KOLBE", "KOLBU", "KOLDE", "KOLDT", "KOLEN", "KOLER", "KOLES",
-  "KOLET", "KOLIN", "KOLJA", "KOLJE", "KOLLA", "KOLLE", "KOLLI", "KOLON", "KOLOS", "KOMET",
-  "KOMMA", "KOMME", "KOMNE", "KOMPA", "KOMPE", "KOMSA", "KOMSE", "KONEN", "KONER", "KONES",
-  "KONET", "KONGE", "KONGO", "KONKA", "KONKE", "KONTA", "KONTE", "KONTI", "KONTO", "KONTR",
-  "KONUS", "KOPAL", "KOPEK", "KOPEN", "KOPER", "KOPES", "KOPLA", "KOPLE", "KOPNE", "KOPPA",
-  "KOPPE", "KOPRA", "KOPTE", "KORAL", "KORAN", "KORDE", "KOREA", "KORER", "KORES", "KORET",
-  "KORFU", "KORGA", "KORKA", "KORKE", "KORNA", "KORNE", "KORNY", "KORPS", "KORSA", "KORSE",
-  "KORTA", "KORTE", "KORTN", "KOSEN", "KOSER", "KOSES", "KOSET", "KOSSA", "KOSTA", "KOSTE",
-  "KOTEN", "KOTER", "KOTTA", "KOVEN", "KOVER", "KOVET", "KOVNA", "KOVNE", "KRAAL", "KRABB",
-  "KRAET", "KRAFS", "KRAFT", "KRAGA", "KRAGE", "KRAGG", "KRAKA", "KRAKE", "KRAKK", "KRAKS",
-  "KRAMS", "KRAMT", "KRANA", "KRANE", "KRANK", "KRANS", "KRAPP", "KRAPT", "KRASA", "KRASE",
-  "KRASJ", "KRASL", "KRASS", "KRAST", "KRATA", "KRATT", "KRAUL", "KRAUM", "KRAVA", "KRAVE",
-  "KRAVL", "KREER", "KREET", "KREFT", "KREKA", "KREKE", "KREKT", "KREML", "KREMT", "KRENG",
-  "KRENK", "KREOL", "KREPP", "KREPS", "KREPT", "KRETA", "KRETI", "KRETS", "KREVD", "KREVE",
-  "KRIBL", "KRIET", "KRIGA", "KRIGE", "KRIKL", "KRILL", "KRIMA", "KRIME", "KRING", "KRINK",
-  "KRINS", "KRISA", "KRISE", "KRISL", "KRIST", "KRITA", "KRITE", "KRITL", "KRITT", "KROAT",
-  "KRODD", "KROEN", "KROER", "KROGH", "KROHN", "KROKA", "KROKE", "KROKI", "KROKN", "KRONA",
-  "KRONE", "KRONT", "KROON", "KROPP", "KROTA", "KROTE", "KRUGG", "KRUGT", "KRUKE", "KRUKS",
-  "KRUKT", "KRULL", "KRUMT", "KRUPP", "KRUSA", "KRUSE", "KRUSL", "KRUST", "KRUTT", "KRYDD",
-  "KRYDR", "KRYER", "KRYES", "KRYET", "KRYMP", "KRYNE", "KRYNT", "KRYPA", "KRYPE", "KRYPT",
-  "KRYSS", "KRYST", "KRÅEN", "KRÅKA", "KRÅKE", "KRÅLA", "KRÅLE", "KRÅLT", "KRÆSJ", "KRØKA",
-  "KRØKE", "KRØKN", "KRØKT", "KRØLL", "KRØPL", "KRØSA", "KRØSS", "KRØYP", "KUALA", "KUBBA",
-  "KUBBE", "KUBEN", "KUBER", "KUBES", "KUBET", "KUBUS", "KUDOS", "KUEDE", "KUENE", "KUETE",
-  "KUFOR", "KUFTA", "KUFTE", "KUFÔR", "KUING", "KUJON", "KUKEN", "KUKER", "KULDA", "KULDE",
-  "KULEN", "KULER", "KULES", "KULET", "KULLA", "KULLE", "KULSA", "KULSE", "KULSK", "KULSN",
-  "KULTA", "KULTE", "KULØR", "KUMLA", "KUMLE", "KUMME", "KUMPA", "KUMPE", "KUNDE", "KUNKA",
-  "KUNKE", "KUNNE", "KUNST", "KUPEN", "KUPER", "KUPLA", "KUPLE", "KUPPA", "KUPPE", "KUREN",
-  "KURER", "KURES", "KURET", "KURIE", "KURLA", "KURLE", "KURRA", "KURRE", "KURSA", "KURSE",
-  "KURTE", "KURVA", "KURVE", "KUSEN", "KUSER", "KUSKA", "KUSKE", "KUSMA", "KUSTA", "KUSTE",
-  "KUTEN", "KUTER", "KUTES", "KUTET", "KUTTA", "KUTTE", "KUVDE", "KUVEN", "KUVER", "KUVES",
-  "KUVET", "KUVNE", "KUØYA", "KUØYE", "KVABB", "KVADA", "KVAEN", "KVAER", "KVAKK", "KVALE",
-  "KVALM", "KVALT", "KVAMN", "KVANN", "KVANT", "KVAPP", "KVAPS", "KVARA", "KVARE", "KVARG",
-  "KVARK", "KVART", "KVARV", "KVASA", "KVASE", "KVASS", "KVAST", "KVATE", "KVATT", "KVAVA",
-  "KVEDA", "KVEDE", "KVEEN", "KVEER", "KVEES", "KVEET", "KVEGA", "KVEGE", "KVEIK", "KVEIL",
-  "KVEIN", "KVEIS", "KVEKA", "KVEKE", "KVEKK", "KVEKT", "KVELD", "KVELE", "KVELL", "KVELT",
-  "KVELV", "KVEPP", "KVEPT", "KVERK", "KVERN", "KVERV", "KVESA", "KVESE", "KVESS", "KVEST",
-  "KVIDD", "KVIDE", "KVIER", "KVIES", "KVIET", "KVIGA", "KVIGE", "KVIKE", "KVIKK", "KVIKN",
-  "KVIKT", "KVILA", "KVILE", "KVILT", "KVINA", "KVINE", "KVINK", "KVINN", "KVINT", "KVISA",
-  "KVISE", "KVISL", "KVISS", "KVIST", "KVITA", "KVITE", "KVITN", "KVITR", "KVITT", "KVOTE",
-  "KVÅLE", "KVÆVD", "KVÆVE", "KYLER", "KYLES", "KYLLE", "KYLNA", "KYLNE", "KYLTE", "KYNDA",
-  "KYNDE", "KYNNA", "KYNNE", "KYOTO", "KYRIA", "KYRIE", "KYRNE", "KYRRE", "KYSEN", "KYSER",
-  "KYSKE", "KYSKT", "KYSSA", "KYSSE", "KYSST", "KYTEN", "KYTER", "KYTES", "KYTET", "KYTTE",
-  "KÅDDE", "KÅKEN", "KÅKER", "KÅLEN", "KÅLER", "KÅLES", "KÅLET", "KÅPEN", "KÅPER", "KÅRDE",
-  "KÅREN", "KÅRER", "KÅRES", "KÅRET", "KÅRNE", "KÅSER", "KÅSØR", "KÅTEN", "KÅTER", "KÅTES",
-  "KÅTET", "KØDDA", "KØDDE", "KØEDE", "KØENE", "KØETE", "KØFRI", "KØING", "KØLET", "KØLLA",
-  "KØLLE", "KØYEN", "KØYER", "KØYES", "KØYET", "LABAN", "LABBA", "LABBE", "LABEN", "LABER",
-  "LABIL", "LABRE", "LADDA", "LADDE", "LADEN", "LADER", "LADES", "LADET", "LAFTA", "LAFTE",
-  "LAGDE", "LAGER", "LAGES", "LAGET", "LAGGA", "LAGGE", "LAGJA", "LAGJE", "LAGOM", "LAGOS",
-  "LAGRA", "LAGRE", "LAGTE", "LAHTI", "LAILA", "LAING", "LAKEI", "LAKEN", "LAKER", "LAKES",
-  "LAKET", "LAKKA", "LAKKE", "LALER", "LALES", "LALET", "LALLA", "LALLE", "LAMMA", "LAMME",
-  "LAMPA", "LAMPE", "LANDA", "LANDE", "LANGA", "LANGE", "LANGS", "LANGT", "LANKA", "LANKE",
-  "LANSA", "LANSE", "LAOEN", "LAOER", "LAPIS", "LAPPA", "LAPPE", "LARGO", "LARMA", "LARME",
-  "LARVA", "LARVE", "LASEN", "LASER", "LASET", "LASKA", "LASKE", "LASSA", "LASSE", "LASSO",
-  "LASTA", "LASTE", "LASUR", "LATEN", "LATER", "LATES", "LATET", "LATIN", "LATTE", "LAUEN",
-  "LAUER", "LAUGA", "LAUGE", "LAURE", "LAUSE", "LAUST", "LAUVA", "LAUVE", "LAVDE", "LAVEN",
-  "LAVER", "LAVES", "LAVET", "LAVIK", "LAVVO", "LEASA", "LEASE", "LEDDA", "LEDDE", "LEDEN",
-  "LEDER", "LEDES", "LEDET", "LEDIG", "LEEDE", "LEEDS", "LEENE", "LEETE", "LEFLA", "LEFLE",
-  "LEFSA", "LEFSE", "LEGAL", "LEGAT", "LEGDA", "LEGDE", "LEGEN", "LEGER", "LEGES", "LEGET",
-  "LEGGA", "LEGGE", "LEGIO", "LEGTE", "LEIDA", "LEIDE", "LEIEN", "LEIER", "LEIES", "LEIET",
-  "LEIGH", "LEIKA", "LEIKE", "LEIKT", "LEING", "LEIRA", "LEIRE", "LEITA", "LEITE", "LEITT",
-  "LEIVD", "LEIVE", "LEKEN", "LEKER", "LEKES", "LEKKA", "LEKKE", "LEKNE", "LEKRA", "LEKRE",
-  "LEKSA", "LEKSE", "LEKTA", "LEKTE", "LEMEN", "LEMMA", "LEMME", "LEMPA", "LEMPE", "LEMUR",
-  "LEMUS", "LENDA", "LENDE", "LENER", "LENES", "LENET", "LENGA", "LENGE", "LENGT", "LENIN",
-  "LENKA", "LENKE", "LENSA", "LENSE", "LENTE", "LEONE", "LEPEN", "LEPER", "LEPES", "LEPJA",
-  "LEPJE", "LEPPA", "LEPPE", "LEPRA", "LEPTE", "LERKA", "LERKE", "LESBA", "LESBE", "LESER",
-  "LESES", "LESJA", "LESKA", "LESKE", "LESPA", "LESPE", "LESPT", "LESSA", "LESSE", "LESST",
-  "LESTA", "LESTE", "LESTO", "LETEN", "LETER", "LETES", "LETNA", "LETNE", "LETTA", "LETTE",
-  "LEUEN", "LEUER", "LEUGE", "LEVDE", "LEVEN", "LEVER", "LEVES", "LEVNA", "LEVNE", "LEVRA",
-  "LEVRE", "LHASA", "LIBYA", "LIDDE", "LIDER", "LIDES", "LIDTE", "LIENE", "LIGGA", "LIGGE",
-  "LIGHT", "LIGNA", "LIGNE", "LIING", "LIKEN", "LIKER", "LIKES", "LIKET", "LIKNA", "LIKNE",
-  "LIKSÅ", "LIKTE", "LIKTÅ", "LIKØR", "LILJA", "LILJE", "LILLA", "LILLE", "LIMBO", "LIMEN",
-  "LIMER", "LIMES", "LIMET", "LIMTE", "LINDA", "LINDE", "LINDR", "LINEN", "LINER", "LINET",
-  "LINGO", "LINJA", "LINJE", "LINKA", "LINKE", "LINKS", "LINNA", "LINNE", "LINON", "LINSA",
-  "LINSE", "LIPID", "LIREN", "LIRER", "LIRES", "LIRET", "LIRKA", "LIRKE", "LIRTE", "LISEN",
-  "LISER", "LISSA", "LISSE", "LISTA", "LISTE", "LITAS", "LITEN", "LITER", "LITES", "LITOT",
-  "LITTE", "LIUNG", "LIVAT", "LIVDA", "LIVDE", "LIVER", "LIVES", "LIVET", "LIVNA", "LIVNE",
-  "LIVRE", "LIVRÉ", "LJOMA", "LJOME", "LJORE", "LJOTE", "LJOTT", "LJUGA", "LJUGE", "LJÅEN",
-  "LJÅER", "LOBBA", "LOBBE", "LOBBY", "LODDA", "LODDE", "LODEN", "LODJE", "LODNE", "LOEDE",
-  "LOENE", "LOETE", "LOFFA", "LOFFE", "LOFTA", "LOGEN", "LOGER", "LOGES", "LOGET", "LOGGA",
-  "LOGGE", "LOGNA", "LOGNE", "LOGNT", "LOGRA", "LOGRE", "LOHNE", "LOING", "LOIRE", "LOJAL",
-  "LOKAL", "LOKET", "LOKKA", "LOKKE", "LOMMA", "LOMME", "LOMPA", "LOMPE", "LOMRA", "LOMRE",
-  "LOMVI", "LONEN", "LONER", "LONGA", "LONGE", "LONGS", "LOOPA", "LOOPE", "LOPPA", "LOPPE",
-  "LORAN", "LORJA", "LORJE", "LOSEN", "LOSER", "LOSES", "LOSET", "LOSJE", "LOSJI", "LOSSA",
-  "LOSSE", "LOSTE", "LOTHE", "LOTTA", "LOTTE", "LOTTO", "LOTUS", "LOUIS", "LOVDE", "LOVEN",
-  "LOVER", "LOVES", "LOVET", "LOVTE", "LUBBA", "LUBBE", "LUBNE", "LUCIA", "LUEDE", "LUENE",
-  "LUETE", "LUFFE", "LUFTA", "LUFTE", "LUGAR", "LUGGA", "LUGGE", "LUGNA", "LUGNE", "LUGNT",
-  "LUGOM", "LUGUM", "LUING", "LUKAS", "LUKEN", "LUKER", "LUKES", "LUKET", "LUKKA", "LUKKE",
-  "LUKTA", "LUKTE", "LULEÅ", "LULLA", "LULLE", "LUMEN", "LUMPA", "LUMPE", "LUMRE", "LUMSK",
-  "LUNCH", "LUNDE", "LUNER", "LUNES", "LUNET", "LUNGA", "LUNGE", "LUNKA", "LUNKE", "LUNNA",
-  "LUNNE", "LUNSJ", "LUNTA", "LUNTE", "LUPEN", "LUPER", "LUPIN", "LUPUS", "LUREN", "LURER",
-  "LURES", "LURET", "LURKA", "LURKE", "LURTE", "LURVA", "LURVE", "LURØY", "LUSEN", "LUSER",
-  "LUSES", "LUSET", "LUSKA", "LUSKE", "LUSNE", "LUSTE", "LUTEN", "LUTER", "LUTES", "LUTET",
-  "LUTNE", "LUTRA", "LUTRE", "LUTTE", "LUVEN", "LUVER", "LUXEN", "LUXOR", "LYBSK", "LYCEA",
-  "LYCÉA", "LYDDE", "LYDEN", "LYDER", "LYDES", "LYDIG", "LYDTE", "LYEDE", "LYENE", "LYETE",
-  "LYGER", "LYGES", "LYING", "LYKKA", "LYKKE", "LYKTA", "LYKTE", "LYMFE", "LYNER", "LYNES",
-  "LYNET", "LYNNA", "LYNNE", "LYNOL", "LYNSJ", "LYNTE", "LYREN", "LYRER", "LYSEN", "LYSER",
-  "LYSES", "LYSET", "LYSKA", "LYSKE", "LYSNA", "LYSNE", "LYSOL", "LYSTA", "LYSTE", "LYSTR",
-  "LYSÅR", "LYTER", "LYTES", "LYTET", "LYTTA", "LYTTE", "LYVER", "LYVES", "LÅGEN", "LÅGER",
-  "LÅMEN", "LÅMER", "LÅNEN", "LÅNER", "LÅNES", "LÅNET", "LÅNTA", "LÅNTE", "LÅRER", "LÅRES",
-  "LÅRET", "LÅRTE", "LÅSEN", "LÅSER", "LÅSES", "LÅSET", "LÅSTE", "LÅTEN", "LÅTER", "LÅTES",
-  "LÅTTE", "LÅVEN", "LÅVER", "LÆGDA", "LÆGER", "LÆGRA", "LÆGRE", "LÆRDE", "LÆREN", "LÆRER",
-  "LÆRES", "LÆRET", "LÆRTE", "LÆTER", "LÆTET", "LØDDE", "LØDEN", "LØDER", "LØDIG", "LØENE",
-  "LØENT", "LØFTA", "LØFTE", "LØGNA", "LØGST", "LØING", "LØKEN", "LØKER", "LØKKA", "LØKKE",
-  "LØNNA", "LØNNE", "LØNSK", "LØNTE", "LØPER", "LØPES", "LØPET", "LØPSK", "LØPTE", "LØRJA",
-  "LØRJE", "LØSEN", "LØSER", "LØSES", "LØSGA", "LØSGI", "LØSNA", "LØSNE", "LØSTE", "LØTEN",
-  "LØVEN", "LØVER", "LØVET", "LØVIK", "LØYEN", "LØYER", "LØYES", "LØYET", "LØYND", "LØYNE",
-  "LØYNT", "LØYPA", "LØYPE", "LØYPT", "LØYSE", "LØYST", "LØYVA", "LØYVD", "LØYVE", "MACAO",
-  "MACHO", "MADAM", "MADET", "MADLA", "MAFIA", "MAGDA", "MAGEN", "MAGER", "MAGES", "MAGET",
-  "MAGGA", "MAGGE", "MAGMA", "MAGNE", "MAGNI", "MAGRA", "MAGRE", "MAHDI", "MAIER", "MAIES",
-  "MAIET", "MAILA", "MAILE", "MAINE", "MAINZ", "MAJOR", "MAKAK", "MAKEN", "MAKER", "MAKES",
-  "MAKET", "MAKKA", "MAKKE", "MAKKO", "MAKNE", "MAKRO", "MAKSI", "MAKSL", "MAKTA", "MAKTE",
-  "MALAY", "MALEN", "MALER", "MALES", "MALJA", "MALJE", "MALLE", "MALME", "MALMÖ", "MALTA",
-  "MALTE", "MAMBA", "MAMBO", "MAMMA", "MANEN", "MANER", "MANES", "MANET", "MANGE", "MANGL",
-  "MANGO", "MANKE", "MANKO", "MANNA", "MANNE", "MANSK", "MANTE", "MANUS", "MAORI", "MAPPA",
-  "MAPPE", "MAREN", "MARER", "MARIA", "MARIE", "MARIN", "MARIT", "MARKA", "MARKI", "MARMA",
-  "MARME", "MARSJ", "MARSK", "MARTA", "MARTR", "MASAI", "MASEN", "MASER", "MASES", "MASET",
-  "MASKA", "MASKE", "MASNE", "MASSE", "MASTA", "MASTE", "MATBU", "MATCH", "MATEN", "MATER",
-  "MATES", "MATET", "MATKØ", "MATOS", "MATRE", "MATRO", "MATTA", "MATTE", "MAULA", "MAULE",
-  "MAURA", "MAURE", "MAVEN", "MAVER", "MAYEN", "MAZDA", "MEDED", "MEDEN", "MEDER", "MEDET",
-  "MEDGA", "MEDGI", "MEDGÅ", "MEDIA", "MEDIO", "MEDOC", "MEGEN", "MEGET", "MEGGA", "MEGGE",
-  "MEGLA", "MEGLE", "MEGNE", "MEHEA", "MEIDE", "MEIEN", "MEIER", "MEIES", "MEIET", "MEINA",
-  "MEINE", "MEINT", "MEISA", "MEISE", "MEISL", "MEITA", "MEITE", "MEKKA", "MEKKE", "MEKLA",
-  "MEKLE", "MEKRA", "MEKRE", "MELBU", "MELBY", "MELDE", "MELDT", "MELEN", "MELER", "MELES",
-  "MELET", "MELIS", "MELKA", "MELKE", "MELLA", "MELLE", "MELNE", "MELON", "MELTA", "MELTE",
-  "MELØY", "MEMER", "MEMET", "MEMOA", "MENED", "MENER", "MENES", "MENET", "MENGA", "MENGE",
-  "MENGT", "MENIG", "MENTE", "MERGL", "MERKA", "MERKE", "MERLA", "MERLE", "MERRA", "MERSA",
-  "MESAN", "MESEN", "MESKA", "MESKE", "MESON", "MESSA", "MESSE", "MESTE", "MESTR", "METAN",
-  "METEN", "METER", "METRA", "METRO", "METTA", "METTE", "METYL", "MEYER", "MEZZO", "MIAMI",
-  "MIDJA", "MIDJE", "MIDLA", "MIDLE", "MIDTE", "MIGER", "MIGES", "MIGET", "MIKAL", "MIKSA",
-  "MIKSE", "MILDE", "MILDN", "MILDT", "MILEN", "MILER", "MILES", "MILJØ", "MILLE", "MIMEN",
-  "MIMER", "MIMES", "MIMET", "MIMRA", "MIMRE", "MINDE", "MINEN", "MINER", "MINES", "MINET",
-  "MINGL", "MINKA", "MINKE", "MINNA", "MINNE", "MINSK", "MINST", "MINTE", "MINUS", "MISEN",
-  "MISER", "MISSA", "MISSE", "MISTA", "MISTE", "MITRA", "MIXEN", "MIXER", "MJAUA", "MJAUE",
-  "MJELE", "MJUKA", "MJUKE", "MJUKN", "MJUKT", "MJÅTT", "MJØDM", "MJØLA", "MJØLE", "MJØLK",
-  "MJØLL", "MJØLT", "MJØSA", "MOAEN", "MOAER", "MOARE", "MOARÉ", "MOBBA", "MOBBE", "MOBIL",
-  "MODAL", "MODEM", "MODEN", "MODER", "MODIG", "MODNA", "MODNE", "MODUL", "MODUM", "MODUS",
-  "MODØL", "MOELV", "MOENE", "MOGOP", "MOGUL", "MOING", "MOKKA", "MOLBO", "MOLDA", "MOLDE",
-  "MOLEN", "MOLER", "MOLET", "MOLOK", "MOLTA", "MOLTE", "MOLTO", "MOMPA", "MOMPE", "MONNA",
-  "MONNE", "MONOM", "MOPED", "MOPPA", "MOPPE", "MORAL", "MORDA", "MOREN", "MORER", "MORES",
-  "MORET", "MORGN", "MORIN", "MORKN", "MORNA", "MOROA", "MORSA", "MORSE", "MORSK", "MORTE",
-  "MOSEL", "MOSEN", "MOSER", "MOSES", "MOSET", "MOSKE", "MOSKÉ", "MOSTE", "MOTEN", "MOTER",
-  "MOTET", "MOTIV", "MOTOR", "MOTSA", "MOTSI", "MOTTA", "MOTTO", "MOUNT", "MOVER", "MTBEN",
-  "MTBER", "MUDRA", "MUDRE", "MUFFA", "MUFFE", "MUFTI", "MUGEN", "MUGER", "MUGES", "MUGET",
-  "MUGGA", "MUGGE", "MUGNA", "MUGNE", "MUKKA", "MUKKE", "MULDA", "MULDE", "MULEN", "MULER",
-  "MULES", "MULIG", "MULKT", "MULLA", "MULLE", "MULMA", "MULNA", "MULNE", "MULRA", "MULRE",
-  "MULTA", "MULTE", "MUMIE", "MUMLA", "MUMLE", "MUMSA", "MUMSE", "MUNCH", "MUNKA", "MUNKE",
-  "MUNNA", "MUNNE", "MUNTR", "MUREN", "MURER", "MURES", "MURET", "MURRA", "MURRE", "MURTE",
-  "MUSAK", "MUSEA", "MUSEN", "MUSER", "MUSES", "MUSET", "MUSSA", "MUSSE", "MUSTA", "MUSTE",
-  "MUSÉA", "MUTEN", "MUTER", "MUTES", "MUTET", "MUTRE", "MUTTE", "MYCEL", "MYENE", "MYGLA",
-  "MYGLE", "MYHRE", "MYKEN", "MYKER", "MYKES", "MYKET", "MYKIS", "MYKNA", "MYKNE", "MYKTE",
-  "MYLDR", "MYNDE", "MYNTA", "MYNTE", "MYONA", "MYOPI", "MYOSE", "MYRAN", "MYRDA", "MYRDE",
-  "MYREN", "MYRER", "MYRET", "MYRRA", "MYSEN", "MYSER", "MYSES", "MYSKA", "MYSKE", "MYSLI",
-  "MYSTE", "MYTEN", "MYTER", "MYTES", "MYTET", "MYTTE", "MÄRTA", "MÅGEN", "MÅGER", "MÅKEN",
-  "MÅKER", "MÅKES", "MÅKET", "MÅKTE", "MÅLER", "MÅLES", "MÅLET", "MÅLTE", "MÅNED", "MÅNEN",
-  "MÅNER", "MÅPER", "MÅPES", "MÅPTE", "MÅREN", "MÅRER", "MÅSEN", "MÅSER", "MÅSØY", "MÅTEN",
-  "MÅTER", "MÅTES", "MÅTET", "MÅTTE", "MÆLEN", "MÆLER", "MÆLES", "MÆLET", "MÆLTE", "MÆTER",
-  "MÆTES", "MÆTTE", "MØBEL", "MØBLA", "MØDEN", "MØDER", "MØDIG", "MØDOM", "MØDRE", "MØENE",
-  "MØKKA", "MØKKE", "MØLET", "MØLJA", "MØLJE", "MØLLA", "MØLLE", "MØLNE", "MØNER", "MØNES",
-  "MØNET", "MØNJA", "MØNJE", "MØNTE", "MØRCH", "MØRJA", "MØRJE", "MØRKA", "MØRKE", "MØRKN",
-  "MØRKT", "MØRNA", "MØRNE", "MØTER", "MØTES", "MØTET", "MØTTE", "MØYEN", "MØYER", "NABBA",
-  "NABBE", "NABOB", "NADIR", "NAFTA", "NAGDE", "NAGER", "NAGES", "NAGET", "NAGLA", "NAGLE",
-  "NAIVE", "NAIVT", "NAKEN", "NAKKA", "NAKKE", "NAKNE", "NALEN", "NALER", "NAMNÅ", "NANEN",
-  "NANER", "NAPPA", "NAPPE", "NARKO", "NARRA", "NARRE", "NARVE", "NASAL", "NASKA", "NASKE",
-  "NASKT", "NATAL", "NATEN", "NATER", "NATES", "NATET", "NATTA", "NATTE", "NATUR", "NAUBA",
-  "NAUBE", "NAUDE", "NAUER", "NAUES", "NAUET", "NAUST", "NAUTA", "NAVAR", "NAVET", "NAVLA",
-  "NAVLE", "NAVNA", "NAVNE", "NEBBA", "NEBBE", "NEDAD", "NEDLA", "NEDOM", "NEDPÅ", "NEDRE",
-  "NEENE", "NEGER", "NEGLA", "NEGLE", "NEGRE", "NEIDA", "NEIDE", "NEIER", "NEIES", "NEIET",
-  "NEIGU", "NEKET", "NEKTA", "NEKTE", "NEMKO", "NEMMA", "NEMME", "NEMND", "NENNA", "NENNE",
-  "NENTE", "NEONA", "NEPAL", "NEPEN", "NEPER", "NEPNE", "NEPPE", "NERTS", "NERVE", "NESBU",
-  "NESEN", "NESER", "NESET", "NESLA", "NESLE", "NESNA", "NESSE", "NESTA", "NESTE", "NETTA",
-  "NETTE", "NETTO", "NEVEN", "NEVER", "NEVNE", "NEVNT", "NEVRA", "NEVRE", "NIBAD", "NIBBA",
-  "NIBBE", "NIBER", "NIBES", "NIDEL", "NIDER", "NIDES", "NIDET", "NIDSK", "NIELS", "NIERE",
-  "NIESA", "NIESE", "NIFSE", "NIFST", "NIGER", "NIKAB", "NIKKA", "NIKKE", "NIKSA", "NIKSE",
-  "NILEN", "NILES", "NIOBA", "NIPEN", "NIPER", "NIPPA", "NIPPE", "NISEN", "NISER", "NISJE",
-  "NISSA", "NISSE", "NISTA", "NISTE", "NITEN", "NITER", "NITID", "NITNE", "NITTA", "NITTE",
-  "NITTI", "NIVÅA", "NIÅRS", "NIØYE", "NOBEL", "NOBLE", "NODEN", "NODER", "NODUL", "NOGEN",
-  "NOKIA", "NOKKE", "NOKSÅ", "NOMEN", "NONEN", "NONER", "NONET", "NONNA", "NONNE", "NORAD",
-  "NORDI", "NORET", "NORGE", "NORNA", "NORNE", "NOROL", "NORSK", "NORTH", "NORUM", "NOSEN",
-  "NOSER", "NOSSA", "NOTAR", "NOTAT", "NOTEN", "NOTER", "NOTIS", "NOVEN", "NOVER", "NUBBA",
-  "NUBBE", "NUBNE", "NUDDA", "NUDDE", "NUDEL", "NUENE", "NUFSA", "NUFSE", "NUFST", "NUGAT",
-  "NUGDE", "NUGGA", "NUGGE", "NULLA", "NULLE", "NULTE", "NUMNE", "NUMRA", "NUMRE", "NUPEN",
-  "NUPER", "NUPPA", "NUPPE", "NUPRA", "NUPRE", "NURKA", "NUSKA", "NUSKE", "NUSLA", "NUSLE",
-  "NUSSA", "NUSSE", "NUTEN", "NUTER", "NUVEN", "NUVER", "NUVET", "NYBÆR", "NYEDE", "NYENE",
-  "NYERE", "NYEST", "NYETE", "NYGLA", "NYGLE", "NYHET", "NYING", "NYKKA", "NYKKE", "NYKTE",
-  "NYLIG", "NYLON", "NYMFA", "NYMFE", "NYNNA", "NYNNE", "NYORD", "NYPEN", "NYPER", "NYPES",
-  "NYPET", "NYPTE", "NYREN", "NYRER", "NYRET", "NYRIK", "NYSEN", "NYSER", "NYSES", "NYSET",
-  "NYSNØ", "NYSSA", "NYSTE", "NYTER", "NYTES", "NYTID", "NYTTA", "NYTTE", "NYVDE", "NYVEG",
-  "NYVEI", "NYVEN", "NYVER", "NYVES", "NYVLE", "NYÅRA", "NÅDDE", "NÅDEN", "NÅDER", "NÅDIG",
-  "NÅENE", "NÅENT", "NÅING", "NÅLEN", "NÅLER", "NÅLYS", "NÅMET", "NÅTID", "NÅTLA", "NÅTLE",
-  "NÅVEL", "NÆRBØ", "NÆRER", "NÆRES", "NÆRET", "NÆRIG", "NÆRMA", "NÆRME", "NÆRTE", "NÆRØY",
-  "NØDDE", "NØDEN", "NØDER", "NØDES", "NØDET", "NØDIG", "NØDÅR", "NØFFA", "NØFFE", "NØGDA",
-  "NØGDE", "NØING", "NØKKA", "NØKKE", "NØKTE", "NØLEN", "NØLER", "NØLES", "NØLTE", "NØREN",
-  "NØRER", "NØRES", "NØRET", "NØRTE", "NØSER", "NØSET", "NØSTA", "NØSTE", "NØTER", "NØTTA",
-  "NØYDE", "NØYEN", "NØYER", "NØYES", "NØYTE", "NØYTT", "OASEN", "OASER", "OASIS", "OBLAT",
-  "OBLIK", "OBOEN", "OBOER", "ODDEN", "ODDER", "ODENE", "ODERE", "ODEST", "ODIØS", "ODLER",
-  "ODLES", "ODLET", "ODVAR", "OFFER", "OFRER", "OFRES", "OFRET", "OFSEN", "OFSER", "OHMEN",
-  "OHMSK", "OIEDE", "OIETE", "OIING", "OKAPI", "OKERE", "OKKER", "OKKES", "OKKET", "OKRER",
-  "OKSEN", "OKSER", "OKSID", "OKSYD", "OKTAN", "OKTAV", "OLAUG", "OLAUS", "OLDEN", "OLDER",
-  "OLDIS", "OLDRA", "OLDRE", "OLENE", "OLJEN", "OLJER", "OLJES", "OLJET", "OLLEN", "OLLER",
-  "OLMER", "OLMES", "OLMET", "OLSEN", "OLSOK", "OLSON", "OMAHA", "OMBAR", "OMBOT", "OMBUD",
-  "OMBÆR", "OMDAL", "OMDEL", "OMDÅP", "OMDØP", "OMEGA", "OMEGN", "OMENA", "OMENE", "OMFAR",
-  "OMGAV", "OMGIR", "OMGIS", "OMGÅR", "OMGÅS", "OMHUG", "OMINA", "OMKOM", "OMLAG", "OMLYD",
-  "OMLØP", "OMPOD", "OMRAM", "OMRÅR", "OMRÅS", "OMRØM", "OMSEN", "OMSER", "OMSUT", "OMSYN",
-  "OMSYR", "OMSYS", "OMSØM", "OMTAL", "OMVEG", "OMVEI", "OMVØL", "ONANI", "ONDER", "ONDET",
-  "ONING", "ONKEL", "ONKOS", "ONNEN", "ONNER", "ONNES", "ONNET", "ONSØY", "ONYKS", "OPAKE",
-  "OPAKT", "OPART", "OPDAL", "OPENE", "OPERA", "OPIAT", "OPIUM", "OPPAD", "OPPAL", "OPPBY",
-  "OPPER", "OPPES", "OPPET", "OPPGA", "OPPGI", "OPPNÅ", "OPPOM", "OPPSA", "OPPSI", "OPPTA",
-  "OPPØV", "OPTER", "OPUSA", "ORALE", "ORALT", "ORDEN", "ORDER", "ORDES", "ORDET", "ORDLA",
-  "ORDNA", "ORDNE", "ORDRA", "ORDRE", "ORENE", "ORGAN", "ORGEL", "ORGER", "ORGES", "ORGET",
-  "ORGIE", "ORGLA", "ORIGO", "ORKAN", "ORKER", "ORKES", "ORKET", "ORKLA", "ORLOG", "ORLON",
-  "ORLOV", "ORMEN", "ORMER", "ORMES", "ORMET", "ORNAT", "ORREN", "ORRER", "ORTEN", "ORTER",
-  "ORVET", "OSAKA", "OSCAR", "OSEAN", "OSENE", "OSING", "OSKAR", "OSMAN", "OSPEN", "OSPER",
-  "OSTEN", "OSTER", "OSTES", "OSTET", "OTERE", "OTIER", "OTIET", "OTIUM", "OTRER", "OTRES",
-  "OTRET", "OTTEN", "OTTER", "OTTES", "OUNCE", "OVALE", "OVALT", "OVAPÅ", "OVERS", "OVNEN",
-  "OVNER", "OVRER", "OVRES", "OVRET", "OZONA", "PACEN", "PACER", "PACES", "PACET", "PACTE",
-  "PADDA", "PADDE", "PADLA", "PADLE", "PADRE", "PAFFA", "PAFFE", "PAGAI", "PAGAN", "PAIEN",
-  "PAIER", "PAKKA", "PAKKE", "PAKTA", "PAKTE", "PALEA", "PALEN", "PALER", "PALES", "PALLA",
-  "PALMA", "PALME", "PALTE", "PALÉA", "PAMPA", "PAMPE", "PANDA", "PANEL", "PANER", "PANGA",
-  "PANIR", "PANNA", "PANNE", "PANSR", "PANTA", "PANTE", "PANTY", "PAPIR", "PAPPA", "PAPPE",
-  "PAPUA", "PARAT", "PARER", "PARES", "PARET", "PARIA", "PARIS", "PARRA", "PARRE", "PARTI",
-  "PARTY", "PASET", "PASJA", "PASJE", "PASSA", "PASSE", "PASSÉ", "PASTA", "PATER", "PATOS",
-  "PATRE", "PATTA", "PATTE", "PAUKE", "PAULI", "PAULO", "PAUSE", "PAVEN", "PAVER", "PAVET",
-  "PEDAL", "PEDER", "PEDRO", "PEERS", "PEGEN", "PEGER", "PEILA", "PEILE", "PEILT", "PEISA",
-  "PEISE", "PEIST", "PEKER", "PEKES", "PEKET", "PEKTE", "PELEN", "PELER", "PELES", "PELET",
-  "PELLA", "PELLE", "PELSA", "PELSE", "PELTE", "PENCE", "PENDL", "PENGE", "PENIS", "PENNA",
-  "PENNE", "PENNI", "PENNY", "PENSA", "PENSE", "PENSL", "PEPEN", "PEPER", "PEPET", "PEPNE",
-  "PEPRA", "PEPRE", "PEREN", "PERER", "PERLA", "PERLE", "PERSA", "PERSE", "PERTH", "PESEN",
-  "PESER", "PESES", "PESET", "PESOS", "PESTA", "PESTE", "PESTO", "PETER", "PETIT", "PETUM",
-  "PHNOM", "PIANO", "PIDEN", "PIDER", "PIECE", "PIENE", "PIERC", "PIFFA", "PIFFE", "PIGGA",
-  "PIGGE", "PIKEN", "PIKER", "PIKET", "PIKKA", "PIKKE", "PILAR", "PILEN", "PILER", "PILES",
-  "PILKA", "PILKE", "PILLA", "PILLE", "PILNE", "PILOT", "PILTA", "PILTE", "PIMPA", "PIMPE",
-  "PINEN", "PINER", "PINES", "PINJE", "PINKA", "PINKE", "PINNA", "PINNE", "PINSA", "PINSE",
-  "PINTE", "PINTS", "PINUP", "PIPEN", "PIPER", "PIPES", "PIPET", "PIPLA", "PIPLE", "PIPPA",
-  "PIPPE", "PIPPI", "PIRAT", "PIREN", "PIRER", "PIRKA", "PIRKE", "PIRNE", "PIROG", "PIROL",
-  "PIRRA", "PIRRE", "PIRSA", "PIRSE", "PIRUM", "PIRÅL", "PISKA", "PISKE", "PISSA", "PISSE",
-  "PISTA", "PISTE", "PISTR", "PITEÅ", "PITLA", "PITLE", "PIVOT", "PIZZA", "PJALL", "PJALT",
-  "PJANK", "PJATT", "PJOKK", "PJUSK", "PJUTR", "PLAFF", "PLAGA", "PLAGD", "PLAGE", "PLAGG",
-  "PLAKK", "PLANA", "PLANE", "PLANK", "PLANT", "PLAPR", "PLASK", "PLASS", "PLAST", "PLATA",
-  "PLATE", "PLATT", "PLATÅ", "PLEBS", "PLEDD", "PLEIA", "PLEID", "PLEIE", "PLENA", "PLENT",
-  "PLETI", "PLETT", "PLIEN", "PLIER", "PLIKT", "PLING", "PLINT", "PLIRA", "PLIRE", "PLIRT",
-  "PLITT", "PLOGA", "PLOGE", "PLOPP", "PLOTA", "PLOTT", "PLUDR", "PLUGG", "PLUKK", "PLUMP",
-  "PLUSS", "PLYSJ", "PLØSA", "PLØSE", "PLØST", "PLØYA", "PLØYD", "PLØYE", "PODEN", "PODER",
-  "PODES", "PODET", "PODIA", "POEMA", "POENG", "POESI", "POKAL", "POKER", "POKKA", "POKRA",
-  "POKRE", "POLAR", "POLEN", "POLER", "POLES", "POLET", "POLIO", "POLIS", "POLKA", "POLKØ",
-  "POLSK", "POLTE", "POLÆR", "POMOR", "PONDA", "PONER", "PONNI", "POPEN", "POPER", "POPPA",
-  "POPPE", "POREN", "PORER", "PORET", "PORNO", "PORTO", "PORØS", "POSEN", "POSER", "POSES",
-  "POSET", "POSNE", "POSTA", "POSTE", "POSØR", "POTEN", "POTER", "POTET", "POTTA", "POTTE",
-  "PRAHA", "PRAIA", "PRAIE", "PRAKK", "PRAKT", "PRALA", "PRALE", "PRALT", "PRANG", "PRASL",
-  "PRATA", "PRATE", "PREET", "PREGA", "PREGE", "PREKA", "PREKE", "PREKT", "PRELL", "PRENT",
-  "PREPP", "PRESS", "PREST", "PRETT", "PRIAR", "PRIDE", "PRIKK", "PRIKL", "PRILL", "PRIMA",
-  "PRIME", "PRIMO", "PRIMT", "PRINS", "PRINT", "PRIOR", "PRISA", "PRISE", "PRIST", "PROER",
-  "PROES", "PROET", "PROFF", "PROFT", "PROMP", "PROPP", "PROPS", "PROSA", "PROST", "PROTT",
-  "PROVA", "PROVE", "PROVO", "PRUDE", "PRUNK", "PRUPP", "PRUST", "PRUTA", "PRUTE", "PRYDA",
-  "PRYDE", "PRYLA", "PRYLE", "PRYLT", "PRØVA", "PRØVD", "PRØVE", "PSYKA", "PSYKE", "PTROA",
-  "PTROE", "PUBEN", "PUBER", "PUBES", "PUDLA", "PUDLE", "PUDRA", "PUDRE", "PUFFA", "PUFFE",
-  "PUGER", "PUGES", "PUGET", "PUGGA", "PUGGE", "PUKEN", "PUKER", "PUKKA", "PUKKE", "PULDR",
-  "PULER", "PULES", "PULJE", "PULPA", "PULSA", "PULSE", "PULTE", "PUMPA", "PUMPE", "PUMPS",
-  "PUNCH", "PUNDA", "PUNER", "PUNGA", "PUNGE", "PUNKT", "PUNSJ", "PUPPA", "PUPPE", "PURDA",
-  "PURIN", "PURKA", "PURKE", "PURLA", "PURLE", "PURRA", "PURRE", "PUSEN", "PUSER", "PUSET",
-  "PUSHA", "PUSHE", "PUSLA", "PUSLE", "PUSSA", "PUSSE", "PUSTA", "PUSTE", "PUTEN", "PUTER",
-  "PUTLA", "PUTLE", "PUTRA", "PUTRE", "PUTTA", "PUTTE", "PUTTI", "PUTTO", "PYGME", "PYGMÉ",
-  "PYNTA", "PYNTE", "PYORE", "PYORÉ", "PYREN", "PYRER", "PYSEN", "PYSER", "PYSET", "PYSNE",
-  "PYTON", "PÅAKT", "PÅANK", "PÅBUD", "PÅBYR", "PÅBYS", "PÅBØD", "PÅBØY", "PÅDRA", "PÅDRO",
-  "PÅDØM", "PÅFØR", "PÅGÅR", "PÅGÅS", "PÅHØR", "PÅKEN", "PÅKER", "PÅLEN", "PÅLER", "PÅLØP",
-  "PÅPEK", "PÅSER", "PÅSES", "PÅSKA", "PÅSKE", "PÅSTO", "PÅSTÅ", "PÅSYN", "PÅTAL", "PÅTAR",
-  "PÅTAS", "PÅTOK", "PÅTÅR", "PÅVER", "PÅVIS", "PÅVRE", "PÆLEN", "PÆLER", "PÆLES", "PÆLET",
-  "PÆLMA", "PÆLME", "PÆLTE", "PÆREN", "PÆRER", "PØBEL", "PØBLA", "PØBLE", "PØLEN", "PØLER",
-  "PØLLA", "PØLLE", "PØLSA", "PØLSE", "PØNAL", "PØNSA", "PØNSE", "PØNSK", "PØSEN", "PØSER",
-  "PØSES", "PØSTE", "QATAR", "QUART", "QUILT", "QUIPU", "QUITO", "RABBE", "RABBI", "RABID",
-  "RABLA", "RABLE", "RACER", "RACET", "RACKA", "RADAR", "RADDA", "RADDE", "RADEN", "RADER",
-  "RADES", "RADET", "RADIG", "RADIO", "RADOM", "RADON", "RADØY", "RAENE", "RAFFE", "RAFSA",
-  "RAFSE", "RAFTA", "RAFTE", "RAGER", "RAGES", "RAGET", "RAGGA", "RAGGE", "RAGNA", "RAIDA",
-  "RAIDE", "RAJEN", "RAJER", "RAKEN", "RAKER", "RAKES", "RAKET", "RAKKA", "RAKKE", "RAKLA",
-  "RAKLE", "RAKNA", "RAKNE", "RAKST", "RAKTE", "RALLA", "RALLE", "RALLY", "RAMLA", "RAMLE",
-  "RAMMA", "RAMME", "RAMPA", "RAMPE", "RAMSA", "RAMSE", "RANCH", "RANDA", "RANDE", "RANDI",
-  "RANER", "RANES", "RANET", "RANGA", "RANGE", "RANGL", "RANGT", "RANKA", "RANKE", "RANKT",
-  "RANTE", "RAPEN", "RAPER", "RAPES", "RAPET", "RAPID", "RAPPA", "RAPPE", "RAPSA", "RAPSE",
-  "RAPTE", "RASEN", "RASER", "RASES", "RASET", "RASKA", "RASKE", "RASKT", "RASLA", "RASLE",
-  "RASPA", "RASPE", "RASTA", "RASTE", "RATEN", "RATER", "RATET", "RATIO", "RATLA", "RATLE",
-  "RATON", "RATSJ", "RATTA", "RATTE", "RAUDA", "RAUKA", "RAUKE", "RAUMA", "RAUSA", "RAUSE",
-  "RAUST", "RAUTA", "RAUTE", "RAVEN", "RAVER", "RAVES", "RAVET", "RAYON", "REALE", "REALT",
-  "REBUS", "REDDA", "REDDE", "REDEN", "REDER", "REDES", "REDET", "REDIG", "REELL", "REELT",
-  "REFSA", "REFSE", "REFST", "REGAL", "REGEL", "REGLA", "REGLE", "REGNA", "REGNE", "REGNT",
-  "REIDE", "REIEN", "REIER", "REIES", "REIKA", "REIKE", "REIKT", "REILE", "REIMA", "REINA",
-  "REINE", "REING", "REINT", "REIPA", "REIPE", "REIRA", "REISA", "REISE", "REIST", "REITA",
-  "REIVA", "REIVD", "REIVE", "REKEL", "REKEN", "REKER", "REKES", "REKET", "REKKA", "REKKE",
-  "REKKT", "REKLA", "REKST", "REKTE", "REKYL", "RELEA", "RELÉA", "REMEN", "REMIS", "REMJA",
-  "REMJE", "REMMA", "REMSA", "REMSE", "RENKE", "RENNA", "RENNE", "RENSA", "RENSE", "RENSK",
-  "RENTA", "RENTE", "REPEN", "REPER", "REPET", "REPOS", "REPRO", "RESER", "RESET", "RESIN",
-  "RETOR", "RETTA", "RETTE", "RETUR", "REVAL", "REVDE", "REVEN", "REVER", "REVES", "REVET",
-  "REVIR", "REVLE", "REVNA", "REVNE", "RHODE", "RHÔNE", "RIBBA", "RIBBE", "RIDDE", "RIDER",
-  "RIDES", "RIENE", "RIERE", "RIFFA", "RIFLA", "RIFLE", "RIFTA", "RIGEL", "RIGGA", "RIGGE",
-  "RIGID", "RIGOR", "RIING", "RIISE", "RIJAL", "RIKER", "RIKES", "RIKET", "RIKKA", "RIKKE",
-  "RIKLA", "RIKLE", "RIKSA", "RIKSE", "RIKTA", "RIKTE", "RILEN", "RILER", "RILLE", "RIMEN",
-  "RIMER", "RIMES", "RIMET", "RIMTE", "RINER", "RINES", "RINET", "RINGA", "RINGE", "RINGL",
-  "RINGT", "RINNE", "RINTE", "RIPEN", "RIPER", "RIPES", "RIPET", "RIPPA", "RIPPE", "RIPTE",
-  "RISEN", "RISER", "RISES", "RISET", "RISKA", "RISKE", "RISLA", "RISLE", "RISPA", "RISPE",
-  "RISSA", "RISSE", "RISTA", "RISTE", "RISØR", "RITEN", "RITER", "RITES", "RITET", "RITSJ",
-  "RITTA", "RITUS", "RIVAL", "RIVEN", "RIVER", "RIVES", "RIVET", "RNAET", "ROALD", "ROBBA",
-  "ROBBE", "ROBEN", "ROBER", "ROBOT", "ROBÅT", "ROCKA", "ROCKE", "ROCKY", "RODAL", "RODDE",
-  "RODEL", "RODEN", "RODEO", "RODER", "RODOS", "ROEDE", "ROENE", "ROERE", "ROETE", "ROGER",
-  "ROGNA", "ROGNE", "ROING", "ROKER", "ROKKA", "ROKKE", "ROKSA", "ROLEX", "ROLIG", "ROLLA",
-  "ROLLE", "ROMAN", "ROMBE", "ROMEN", "ROMEO", "ROMER", "ROMMA", "ROMME", "ROMPA", "ROMPE",
-  "RONDO", "RONGA", "ROPER", "ROPES", "ROPET", "ROPTE", "RORBU", "ROREN", "RORER", "RORET",
-  "ROSEN", "ROSER", "ROSES", "ROSET", "ROSIN", "ROSSA", "ROSSE", "ROSTA", "ROSTE", "ROTEN",
-  "ROTER", "ROTES", "ROTET", "ROTOR", "ROTTA", "ROTTE", "ROTUR", "ROUEN", "ROUGE", "ROUGH",
-  "ROVEN", "ROVER", "ROVET", "RUBBA", "RUBBE", "RUBEL", "RUBIN", "RUBNE", "RUEDE", "RUENE",
-  "RUERE", "RUEST", "RUETE", "RUFFA", "RUFFE", "RUFSA", "RUFSE", "RUGBY", "RUGDA", "RUGDE",
-  "RUGEN", "RUGER", "RUGES", "RUGET", "RUGGA", "RUGGE", "RUGLA", "RUGLE", "RUING", "RUKEN",
-  "RUKER", "RUKES", "RUKET", "RUKKA", "RUKKE", "RUKLA", "RUKLE", "RUKNE", "RULLA", "RULLE",
-  "RULTA", "RULTE", "RUMBA", "RUMLA", "RUMLE", "RUMPA", "RUMPE", "RUNAR", "RUNDA", "RUNDE",
-  "RUNDT", "RUNEN", "RUNER", "RUNES", "RUNET", "RUNGA", "RUNGE", "RUNKA", "RUNKE", "RUNNE",
-  "RUNSA", "RUNSE", "RURAL", "RUREN", "RURER", "RURES", "RURET", "RUSEN", "RUSER", "RUSES",
-  "RUSET", "RUSHA", "RUSHE", "RUSKA", "RUSKE", "RUSLA", "RUSLE", "RUSTA", "RUSTE", "RUSTN",
-  "RUTEN", "RUTER", "RUTES", "RUTET", "RUTLA", "RUTLE", "RUTSJ", "RUTTA", "RUTTE", "RUVDE",
-  "RUVEN", "RUVER", "RUVES", "RUVET", "RVERE", "RYDDA", "RYDDE", "RYENE", "RYENT", "RYGER",
-  "RYGGA", "RYGGE", "RYING", "RYKER", "RYKES", "RYKKA", "RYKKE", "RYKTA", "RYKTE", "RYNKA",
-  "RYNKE", "RYPEN", "RYPER", "RYSJA", "RYSJE", "RYSTA", "RYSTE", "RYTER", "RYTES", "RYTME",
-  "RYTTE", "RÅDDE", "RÅDEN", "RÅDER", "RÅDES", "RÅDET", "RÅDGA", "RÅDGI", "RÅDIG", "RÅDLA",
-  "RÅDYR", "RÅENE", "RÅERE", "RÅEST", "RÅHET", "RÅING", "RÅKEN", "RÅKER", "RÅKES", "RÅKET",
-  "RÅKTE", "RÅLER", "RÅLES", "RÅLET", "RÅLTE", "RÅMEN", "RÅMER", "RÅMNE", "RÅNEN", "RÅNER",
-  "RÅNES", "RÅNET", "RÅNTE", "RÅSEN", "RÅSER", "RÅSKE", "RÅTEN", "RÅTER", "RÅTEV", "RÅTNA",
-  "RÅTNE", "RÅVÆR", "RÆLET", "RÆRNE", "RÆVEN", "RÆVER", "RØDDE", "RØDEN", "RØDER", "RØDES",
-  "RØDMA", "RØDME", "RØDNA", "RØDNE", "RØDÅT", "RØDØY", "RØFFE", "RØFLA", "RØFLE", "RØFTA",
-  "RØFTE", "RØKEN", "RØKER", "RØKES", "RØKET", "RØKJE", "RØKLA", "RØKNE", "RØKTA", "RØKTE",
-  "RØLER", "RØLES", "RØLET", "RØLPA", "RØLPE", "RØLTE", "RØMMA", "RØMME", "RØMTE", "RØNNA",
-  "RØNNE", "RØPER", "RØPES", "RØPET", "RØPTE", "RØREN", "RØRER", "RØRES", "RØRET", "RØRIG",
-  "RØRNE", "RØROS", "RØRTE", "RØSKA", "RØSKE", "RØSTA", "RØSTE", "RØTER", "RØTET", "RØVDE",
-  "RØVER", "RØVES", "RØVET", "RØYEN", "RØYER", "RØYKA", "RØYKE", "RØYKT", "RØYNA", "RØYND",
-  "RØYNE", "RØYNT", "RØYRA", "RØYSA", "RØYSE", "RØYST", "RØYTA", "RØYTE", "RÜGEN", "SAANA",
-  "SABAH", "SABBA", "SABBE", "SABEL", "SABLA", "SABLE", "SABRA", "SADEL", "SADLA", "SADLE",
-  "SAFEN", "SAFER", "SAFES", "SAFET", "SAFIR", "SAFTA", "SAFTE", "SAGAN", "SAGDE", "SAGEN",
-  "SAGER", "SAGES", "SAGET", "SAGMO", "SAGNA", "SAGTE", "SAHIB", "SAIGA", "SAIMA", "SAINT",
-  "SAKEN", "SAKER", "SAKES", "SAKET", "SAKKA", "SAKKE", "SAKNA", "SAKNE", "SAKSA", "SAKSE",
-  "SAKTA", "SAKTE", "SAKTN", "SALAT", "SALDO", "SALEN", "SALER", "SALES", "SALET", "SALGA",
-  "SALIG", "SALME", "SALSA", "SALTA", "SALTE", "SALTO", "SALVA", "SALVE", "SALVO", "SALÆR",
-  "SAMBA", "SAMBO", "SAMBU", "SAMDE", "SAMEN", "SAMER", "SAMLA", "SAMLE", "SAMME", "SAMOA",
-  "SAMOS", "SAMPL", "SAMRÅ", "SAMSA", "SAMSE", "SANDE", "SANER", "SANGR", "SANKA", "SANKE",
-  "SANKT", "SANNA", "SANNE", "SANSA", "SANSE", "SANTA", "SANTO", "SAPPE", "SARAH", "SARTE",
-  "SARVA", "SATAN", "SATSA", "SATSE", "SATTE", "SATYR", "SAUAL", "SAUDA", "SAUDI", "SAUEN",
-  "SAUER", "SAUES", "SAUET", "SAUNA", "SAUPA", "SAUSA", "SAUSE", "SAUTE", "SAUTÉ", "SAVEN",
-  "SAVER", "SAVET", "SAVLA", "SAVLE", "SAVNA", "SAVNE", "SCANN", "SCENE", "SCHAU", "SCHEI",
-  "SCOOP", "SCORA", "SCORE", "SCOTT", "SEATO", "SEBRA", "SEDAN", "SEDAT", "SEDEN", "SEDER",
-  "SEDRE", "SEEDA", "SEEDE", "SEERE", "SEFYR", "SEGEN", "SEGET", "SEGLA", "SEGLE", "SEGNA",
-  "SEGNE", "SEIDA", "SEIDE", "SEIEN", "SEIER", "SEIFA", "SEIFE", "SEIGE", "SEIGT", "SEILA",
-  "SEILE", "SEILT", "SEINE", "SEING", "SEINT", "SEIPA", "SEIPE", "SEIRA", "SEIRE", "SEISA",
-  "SEISE", "SEIST", "SEKEL", "SEKLA", "SEKSA", "SEKST", "SEKTA", "SELBU", "SELEN", "SELER",
-  "SELES", "SELET", "SELGE", "SELJA", "SELJE", "SELLA", "SELLE", "SELMA", "SELOT", "SELTE",
-  "SELVA", "SELVE", "SEMIN", "SEMJA", "SEMJE", "SEMRE", "SEMSK", "SENAT", "SENDE", "SENDT",
-  "SENEN", "SENER", "SENET", "SENGA", "SENIL", "SENIT", "SENJA", "SENKA", "SENKE", "SENNA",
-  "SENSA", "SENSE", "SENTR", "SEOUL", "SEPIA", "SEPOY", "SERAF", "SERAI", "SERIE", "SERUM",
-  "SERVA", "SERVE", "SERØS", "SESAM", "SESSA", "SESSE", "SETER", "SETET", "SETRA", "SETRE",
-  "SETTA", "SETTE", "SETTL", "SEVJA", "SEVJE", "SEXEN", "SEXER", "SEXUS", "SEÑOR", "SFÆRE",
-  "SHAKA", "SHAKE", "SHELF", "SHELL", "SHOPP", "SHORT", "SHOWA", "SHOWE", "SHUNT", "SIALA",
-  "SIBIR", "SIDDA", "SIDDE", "SIDEN", "SIDER", "SIDRE", "SIFRA", "SIFRE", "SIGAR", "SIGEN",
-  "SIGER", "SIGES", "SIGET", "SIGGA", "SIGGE", "SIGMA", "SIGNA", "SIGNE", "SIGRI", "SIING",
-  "SIKEN", "SIKER", "SIKES", "SIKET", "SIKLA", "SIKLE", "SIKRA", "SIKRE", "SIKTA", "SIKTE",
-  "SILDA", "SILDE", "SILDR", "SILEN", "SILER", "SILES", "SILJE", "SILKE", "SILTE", "SILUR",
-  "SIMAA", "SIMEN", "SIMLA", "SIMLE", "SIMON", "SIMPA", "SIMPE", "SINAI", "SINDR", "SINER",
-  "SINES", "SINET", "SINGL", "SINKA", "SINKE", "SINNA", "SINNE", "SINTE", "SINTR", "SINUS",
-  "SIOUX", "SIPER", "SIPES", "SIPET", "SIPPA", "SIPPE", "SIPTE", "SIRAT", "SIREN", "SIRER",
-  "SIRES", "SIRET", "SIRKA", "SIRKL", "SIRTE", "SIRUP", "SISAL", "SISEL", "SISIK", "SISLA",
-  "SISLE", "SISTE", "SITAR", "SITAT", "SITER", "SITNE", "SITRA", "SITRE", "SITTE", "SITUP",
-  "SIVER", "SIVES", "SIVET", "SIVIL", "SIVÅT", "SJABB", "SJAKK", "SJAKL", "SJAKO", "SJAKR",
-  "SJAKT", "SJALA", "SJALT", "SJALU", "SJANS", "SJAPP", "SJARK", "SJARM", "SJASK", "SJAUA",
-  "SJAUE", "SJEFA", "SJEFE", "SJEID", "SJEIK", "SJEKK", "SJELA", "SJETE", "SJETÉ", "SJEVR",
-  "SJIKT", "SJOFL", "SJOGA", "SJOGE", "SJOGS", "SJOKK", "SJUER", "SJUKE", "SJUKN", "SJUKT",
-  "SJUSK", "SJYEN", "SJYER", "SJÅET", "SJÅKA", "SJÅKE", "SJØBU", "SJØEN", "SJØER", "SJØIS",
-  "SJØKU", "SKAAR", "SKABB", "SKADA", "SKADD", "SKADE", "SKAFF", "SKAFT", "SKAGA", "SKAGE",
-  "SKAKA", "SKAKE", "SKAKK", "SKAKT", "SKALA", "SKALD", "SKALK", "SKALL", "SKALP", "SKALT",
-  "SKALV", "SKANK", "SKANN", "SKANT", "SKAPA", "SKAPE", "SKAPT", "SKARA", "SKARE", "SKARK",
-  "SKARN", "SKARP", "SKARR", "SKARV", "SKATA", "SKATE", "SKATT", "SKAUG", "SKAUN", "SKAUT",
-  "SKAVA", "SKAVE", "SKAVL", "SKEET", "SKEIA", "SKEID", "SKEIE", "SKEIN", "SKEIS", "SKEIT",
-  "SKEIV", "SKIEN", "SKIER", "SKIFT", "SKIKK", "SKILL", "SKILS", "SKILT", "SKIML", "SKIMR",
-  "SKIMT", "SKINN", "SKINT", "SKIPA", "SKIPE", "SKIPL", "SKIPP", "SKIRA", "SKIRE", "SKIRT",
-  "SKITA", "SKITE", "SKITN", "SKITT", "SKIVA", "SKIVE", "SKJEA", "SKJEL", "SKJEM", "SKJEN",
-  "SKJER", "SKJES", "SKJET", "SKJEV", "SKJOR", "SKJUL", "SKJÅK", "SKJÆR", "SKJØD", "SKJØR",
-  "SKJØT", "SKJØV", "SKLED", "SKLEI", "SKLIA", "SKLIE", "SKLIR", "SKLIS", "SKODA", "SKODD",
-  "SKOEN", "SKOFT", "SKOGN", "SKOGR", "SKOKK", "SKOLD", "SKOLE", "SKOLL", "SKOLM", "SKOLP",
-  "SKOLT", "SKOPA", "SKORD", "SKORP", "SKORT", "SKOSA", "SKOSE", "SKOST", "SKOTT", "SKOVA",
-  "SKOVE", "SKOVL", "SKRAL", "SKRAP", "SKRED", "SKREI", "SKREK", "SKREM", "SKRER", "SKRES",
-  "SKREV", "SKRIA", "SKRID", "SKRIE", "SKRIK", "SKRIN", "SKRIR", "SKRIS", "SKRIV", "SKROG",
-  "SKROT", "SKROV", "SKRUD", "SKRUE", "SKRUR", "SKRUS", "SKRUV", "SKRYT", "SKRÅA", "SKRÅE",
-  "SKRÅL", "SKRÅN", "SKRÅR", "SKRÅS", "SKRØN", "SKRØR", "SKRØS", "SKRØT", "SKUBB", "SKUDD",
-  "SKUER", "SKUES", "SKUET", "SKUFF", "SKUFL", "SKULE", "SKULK", "SKULS", "SKULT", "SKUME",
-  "SKUML", "SKUMP", "SKUMR", "SKUMT", "SKUNK", "SKUPA", "SKURA", "SKURD", "SKURE", "SKURK",
-  "SKURR", "SKURT", "SKURV", "SKUSL", "SKUTA", "SKUTE", "SKUTL", "SKUTT", "SKVAL", "SKVIP",
-  "SKVIS", "SKVÆR", "SKYDD", "SKYEN", "SKYER", "SKYES", "SKYET", "SKYFL", "SKYGD", "SKYGG",
-  "SKYGT", "SKYLD", "SKYLL", "SKYLT", "SKYMT", "SKYND", "SKYRU", "SKYSS", "SKYTE", "SKYTS",
-  "SKYVA", "SKYVE", "SKÅKA", "SKÅLA", "SKÅLD", "SKÅLE", "SKÅLT", "SKÅNA", "SKÅNE", "SKÅNT",
-  "SKÅRA", "SKÅRE", "SKÅTA", "SKÅTE", "SKØYA", "SKØYE", "SKØYT", "SKØYV", "SLABB", "SLADD",
-  "SLADR", "SLAFS", "SLAGA", "SLAGE", "SLAGG", "SLAGS", "SLAKE", "SLAKK", "SLAKN", "SLAKT",
-  "SLAMP", "SLAMR", "SLAMS", "SLANG", "SLANK", "SLANT", "SLAPN", "SLAPP", "SLAPS", "SLAPT",
-  "SLARK", "SLARV", "SLASK", "SLAUR", "SLAVA", "SLAVE", "SLEDE", "SLEGG", "SLEID", "SLEIK",
-  "SLEIP", "SLEIS", "SLEIT", "SLEIV", "SLEKT", "SLEMT", "SLENG", "SLEPA", "SLEPE", "SLEPP",
-  "SLEPT", "SLESK", "SLETN", "SLETT", "SLEVA", "SLEVD", "SLEVE", "SLIDE", "SLIET", "SLIKE",
-  "SLIKK", "SLIKT", "SLIMA", "SLIME", "SLIND", "SLIPE", "SLIPP", "SLIPS", "SLIPT", "SLIRA",
-  "SLIRE", "SLISK", "SLISS", "SLITA", "SLITE", "SLITN", "SLITT", "SLIUL", "SLODD", "SLOEN",
-  "SLOER", "SLOET", "SLOKA", "SLOKK", "SLOKN", "SLOKT", "SLOSS", "SLOTT", "SLUBB", "SLUBR",
-  "SLUDD", "SLUDR", "SLUFF", "SLUFS", "SLUKA", "SLUKE", "SLUKK", "SLUKN", "SLUKT", "SLUMP",
-  "SLUMR", "SLUMS", "SLUNK", "SLUNT", "SLUPP", "SLUPS", "SLURA", "SLURE", "SLURK", "SLURP",
-  "SLURT", "SLURV", "SLUSA", "SLUSE", "SLUSK", "SLUTE", "SLUTT", "SLYET", "SLYNG", "SLÅEN",
-  "SLÅER", "SLÅES", "SLÅPA", "SLÅPE", "SLÅSS", "SLÅTT", "SLØEN", "SLØER", "SLØKA", "SLØKE",
-  "SLØRA", "SLØRE", "SLØRT", "SLØSA", "SLØSE", "SLØST", "SLØVA", "SLØVE", "SLØVN", "SLØVT",
-  "SLØYA", "SLØYD", "SLØYE", "SLØYF", "SLØYT", "SMADR", "SMAKE", "SMAKT", "SMALA", "SMALE",
-  "SMALK", "SMALN", "SMALT", "SMART", "SMASH", "SMASK", "SMATR", "SMATT", "SMAUA", "SMEDA",
-  "SMEDE", "SMEIK", "SMEIS", "SMEKK", "SMEKT", "SMELL", "SMELT", "SMERT", "SMETT", "SMIDD",
-  "SMIEN", "SMIER", "SMIGR", "SMIKK", "SMILA", "SMILE", "SMILT", "SMINK", "SMISK", "SMITH",
-  "SMITT", "SMOKK", "SMOLT", "SMUDI", "SMUGA", "SMUGL", "SMUKK", "SMUKT", "SMULA", "SMULE",
-  "SMULN", "SMULT", "SMURF", "SMURT", "SMUSK", "SMUSS", "SMUTT", "SMYGA", "SMYGE", "SMYKK",
-  "SMYLA", "SMYLE", "SMÅBY", "SMÅEN", "SMÅFE", "SMÅIS", "SMÅTT", "SMÆSJ", "SMØLA", "SMØRA",
-  "SMØRE", "SMØYD", "SMØYE", "SMØYG", "SNABB", "SNADD", "SNADR", "SNAFS", "SNAKA", "SNAKE",
-  "SNAKK", "SNAKS", "SNAKT", "SNAPP", "SNAPS", "SNAPT", "SNARA", "SNARE", "SNARP", "SNART",
-  "SNASK", "SNAUA", "SNAUE", "SNAUT", "SNAVL", "SNEGL", "SNEIA", "SNEID", "SNEIE", "SNEIK",
-  "SNEIP", "SNEIS", "SNEKA", "SNEKE", "SNEKR", "SNELL", "SNELT", "SNERK", "SNERP", "SNERR",
-  "SNERT", "SNESA", "SNEVA", "SNEVR", "SNIFF", "SNIKE", "SNIKT", "SNILE", "SNILL", "SNILT",
-  "SNIPA", "SNIPE", "SNIPP", "SNITT", "SNIVA", "SNIVE", "SNOBB", "SNODD", "SNOEN", "SNOER",
-  "SNOKA", "SNOKE", "SNOKT", "SNOPA", "SNOPE", "SNOPT", "SNORA", "SNORK", "SNOTT", "SNUBB",
-  "SNUBL", "SNUDD", "SNUEN", "SNUER", "SNUFS", "SNUFT", "SNUPP", "SNUPT", "SNURP", "SNURR",
-  "SNURT", "SNUSE", "SNUSK", "SNUST", "SNUTA", "SNUTE", "SNUTT", "SNYLT", "SNYTA", "SNYTE",
-  "SNYTT", "SNÅLE", "SNÅLT", "SNÅPE", "SNÅPT", "SNÅSA", "SNÅVA", "SNÅVE", "SNØDD", "SNØEN",
-  "SNØER", "SNØET", "SNØFL", "SNØFT", "SNØGG", "SNØGT", "SNØIS", "SNØRA", "SNØRE", "SNØRR",
-  "SNØRT", "SNØSE", "SNØST", "SNØVL", "SNØYD", "SNØYE", "SNØÅR", "SOARE", "SOARÉ", "SOBEL",
-  "SOBER", "SOBRE", "SODDA", "SOFIA", "SOFIE", "SOFTE", "SOGEN", "SOGER", "SOGNA", "SOGNE",
-  "SOKKA", "SOKKE", "SOKNA", "SOKNE", "SOLAR", "SOLEM", "SOLEN", "SOLER", "SOLES", "SOLET",
-  "SOLGT", "SOLID", "SOLLA", "SOLTE", "SOLUM", "SOLUR", "SOLÅR", "SOLØR", "SOMLA", "SOMLE",
-  "SOMME", "SOMRE", "SONAR", "SONDE", "SONDR", "SONEN", "SONER", "SONES", "SONET", "SONJA",
-  "SONOR", "SONTE", "SOPEN", "SOPER", "SOPES", "SOPET", "SOPNE", "SOPPA", "SOPPE", "SOPTE",
-  "SORBE", "SORBÉ", "SORGA", "SORIA", "SORRY", "SORTE", "SORTI", "SOSER", "SOSES", "SOSET",
-  "SOSTE", "SOTEN", "SOTER", "SOTES", "SOTET", "SOTRA", "SOTTA", "SOUEN", "SOUND", "SOUTH",
-  "SOVEN", "SOVER", "SOVES", "SOVET", "SOVNA", "SOVNE", "SPADA", "SPADD", "SPADE", "SPAET",
-  "SPAIN", "SPAKE", "SPAKN", "SPAKT", "SPALT", "SPANA", "SPANE", "SPANK", "SPANN", "SPANT",
-  "SPARE", "SPARK", "SPARR", "SPART", "SPASA", "SPASE", "SPAST", "SPATL", "SPATT", "SPEDD",
-  "SPEDE", "SPEDT", "SPEED", "SPEID", "SPEIL", "SPEKE", "SPEKK", "SPEKN", "SPEKS", "SPEKT",
-  "SPELL", "SPELT", "SPEND", "SPENE", "SPENN", "SPENT", "SPERR", "SPETT", "SPIDD", "SPIKA",
-  "SPIKE", "SPIKK", "SPIKR", "SPIKT", "SPILA", "SPILE", "SPILL", "SPILT", "SPINK", "SPINN",
-  "SPION", "SPIRA", "SPIRE", "SPIRT", "SPISE", "SPISK", "SPISS", "SPIST", "SPITA", "SPJÅK",
-  "SPJÆR", "SPLID", "SPOLE", "SPOLT", "SPONG", "SPONS", "SPORA", "SPORD", "SPORE", "SPORT",
-  "SPOTT", "SPOVE", "SPRAD", "SPRAK", "SPRAY", "SPRED", "SPREK", "SPRER", "SPRES", "SPRIA",
-  "SPRIK", "SPRIR", "SPRIS", "SPRIT", "SPROG", "SPRUT", "SPRYD", "SPRÅK", "SPRØA", "SPRØE",
-  "SPRØR", "SPRØS", "SPUNS", "SPURT", "SPURV", "SPYDA", "SPYDD", "SPYET", "SPYLE", "SPYLT",
-  "SPYTT", "SPÅDD", "SPØKE", "SPØKT", "SPØLE", "SPØLT", "SPØRS", "SPØTA", "SPØTE", "SPØTT",
-  "SQUAW", "STABB", "STABL", "STADA", "STADE", "STAGA", "STAGE", "STAGG", "STAIL", "STAKA",
-  "STAKE", "STAKK", "STALL", "STAMP", "STAMT", "STANA", "STAND", "STANE", "STANG", "STANK",
-  "STANS", "STANT", "STAPL", "STAPP", "STARE", "STARR", "START", "STASA", "STASE", "STASI",
-  "STAST", "STAUP", "STAUR", "STAUT", "STAVA", "STAVE", "STAVN", "STAVR", "STEAM", "STEDD",
-  "STEDE", "STEDT", "STEEN", "STEET", "STEGA", "STEGE", "STEGG", "STEIG", "STEIK", "STEIL",
-  "STEIN", "STEKA", "STEKE", "STEKK", "STEKT", "STELE", "STELL", "STELT", "STEMT", "STENE",
-  "STENG", "STENK", "STEPP", "STERK", "STERT", "STETT", "STEVA", "STEVJ", "STEVN", "STIAN",
-  "STIEN", "STIER", "STIES", "STIET", "STIFT", "STIGE", "STIKK", "STIKL", "STILE", "STILK",
-  "STILL", "STILN", "STILT", "STIMA", "STIME", "STIML", "STIMT", "STINE", "STING", "STINK",
-  "STINN", "STINT", "STIPL", "STIRR", "STIVA", "STIVE", "STIVN", "STIVT", "STJAL", "STJEL",
-  "STODA", "STODE", "STOET", "STOFF", "STOGG", "STOKK", "STOLA", "STOLE", "STOLL", "STOLP",
-  "STOLT", "STOML", "STOMP", "STOPP", "STORA", "STORD", "STORE", "STORK", "STORM", "STORT",
-  "STORY", "STOTR", "STOVA", "STOVE", "STRAK", "STRAM", "STREB", "STRED", "STREI", "STREK",
-  "STREN", "STREV", "STRIA", "STRID", "STRIE", "STRIL", "STRIP", "STRIR", "STRIS", "STRUP",
-  "STRUT", "STRYA", "STRYK", "STRYN", "STRYP", "STRÅA", "STRÅL", "STRØA", "STRØK", "STRØM",
-  "STRØR", "STRØS", "STUBB", "STUEN", "STUER", "STUES", "STUET", "STUKA", "STUKE", "STUKK",
-  "STUKT", "STULL", "STUMP", "STUMT", "STUND", "STUNT", "STUPA", "STUPE", "STUPT", "STURA",
-  "STURE", "STURT", "STUSS", "STUST", "STUTN", "STUTT", "STYGG", "STYGT", "STYKK", "STYKT",
-  "STYLA", "STYLE", "STYLT", "STYRA", "STYRE", "STYRK", "STYRT", "STÅEN", "STÅER", "STÅKA",
-  "STÅKE", "STÅLA", "STÅTT", "STØDD", "STØEN", "STØER", "STØES", "STØET", "STØKK", "STØKT",
-  "STØLA", "STØLE", "STØLN", "STØLT", "STØNN", "STØNT", "STØPA", "STØPE", "STØPT", "STØTA",
-  "STØTE", "STØTT", "STØVA", "STØVE", "STØYA", "STØYD", "STØYE", "STØYP", "STØYT", "SUBBA",
-  "SUBBE", "SUBUS", "SUDAN", "SUENE", "SUGDE", "SUGEN", "SUGER", "SUGES", "SUGET", "SUGGA",
-  "SUGGE", "SUGNE", "SUITE", "SUKAT", "SUKKA", "SUKKE", "SUKLA", "SUKLE", "SUKRA", "SUKRE",
-  "SULEN", "SULER", "SULES", "SULET", "SULKA", "SULKE", "SULKY", "SULLA", "SULLE", "SULRA",
-  "SULRE", "SULTA", "SULTE", "SUMAK", "SUMMA", "SUMME", "SUNDA", "SUNDE", "SUNDT", "SUNNA",
-  "SUNNE", "SUNNI", "SUOMI", "SUPEN", "SUPER", "SUPES", "SUPPA", "SUPPE", "SUPRE", "SUPTE",
-  "SURFA", "SURFE", "SURKL", "SURLA", "SURLE", "SURNA", "SURNE", "SURRA", "SURRE", "SUSEN",
-  "SUSER", "SUSES", "SUSET", "SUSHI", "SUSLA", "SUSLE", "SUSSA", "SUSSE", "SUSTE", "SUTEN",
-  "SUTER", "SUTRA", "SUTRE", "SUTTA", "SUTTE", "SUTUR", "SUVLA", "SVABR", "SVADA", "SVADD",
-  "SVAET", "SVAGA", "SVAGE", "SVAIA", "SVAIE", "SVAIT", "SVAKE", "SVAKT", "SVALA", "SVALE",
-  "SVALN", "SVALT", "SVAMP", "SVANA", "SVANE", "SVANG", "SVANS", "SVANT", "SVARA", "SVARE",
-  "SVART", "SVARV", "SVASS", "SVEAR", "SVEEN", "SVEER", "SVEIG", "SVEIK", "SVEIN", "SVEIO",
-  "SVEIP", "SVEIS", "SVEIT", "SVEIV", "SVEKK", "SVEKT", "SVELA", "SVELE", "SVELG", "SVELL",
-  "SVELT", "SVEND", "SVENN", "SVEPA", "SVEPE", "SVERD", "SVERE", "SVERG", "SVERM", "SVERT",
-  "SVETT", "SVEUM", "SVEVA", "SVEVD", "SVEVE", "SVIDD", "SVIEN", "SVIER", "SVIKA", "SVIKE",
-  "SVIKT", "SVILL", "SVIMA", "SVIME", "SVIML", "SVIMR", "SVIMT", "SVINA", "SVINE", "SVING",
-  "SVINN", "SVINS", "SVINT", "SVIPA", "SVIPE", "SVIPP", "SVIRA", "SVIRE", "SVIRR", "SVIRT",
-  "SVIVA", "SVIVD", "SVIVE", "SVOLK", "SVOVL", "SVULL", "SVULM", "SVULN", "SVUPP", "SVÆRE",
-  "SVÆRT", "SVÆVA", "SVÆVD", "SVÆVE", "SVØMT", "SVØPA", "SVØPE", "SVØPT", "SWAZI", "SWING",
-  "SYDDE", "SYDEN", "SYDER", "SYDES", "SYDET", "SYDPÅ", "SYERE", "SYING", "SYKEN", "SYKER",
-  "SYKLA", "SYKLE", "SYKNA", "SYKNE", "SYLEN", "SYLER", "SYLFE", "SYLLA", "SYLTA", "SYLTE",
-  "SYMRA", "SYMRE", "SYNDA", "SYNDE", "SYNER", "SYNES", "SYNET", "SYNGE", "SYNKE", "SYNNE",
-  "SYNSA", "SYNSE", "SYNSK", "SYNTE", "SYNÅL", "SYREN", "SYRER", "SYRES", "SYRET", "SYRIA",
-  "SYRIN", "SYRNA", "SYRNE", "SYRTE", "SYSLA", "SYSLE", "SYTEN", "SYTER", "SYTES", "SYTET",
-  "SYTNE", "SYTTE", "SYTTI", "SYTØY", "SYVER", "SÄLEN", "SÅDAN", "SÅDDE", "SÅENE", "SÅFRØ",
-  "SÅGAR", "SÅING", "SÅLDA", "SÅLDE", "SÅLEN", "SÅLER", "SÅLES", "SÅLET", "SÅLTE", "SÅNNE",
-  "SÅPEN", "SÅPER", "SÅPES", "SÅPET", "SÅPTE", "SÅRER", "SÅRES", "SÅRET", "SÅTEN", "SÅTER",
-  "SÅTES", "SÅTET", "SÅTID", "SÅVEL", "SÆDEN", "SÆDER", "SÆDET", "SÆLDA", "SÆLDE", "SÆLEN",
-  "SÆLER", "SÆRBO", "SÆRBU", "SÆTER", "SÆTES", "SÆTRE", "SÆTTE", "SØDME", "SØENE", "SØGNE",
-  "SØKEN", "SØKER", "SØKES", "SØKET", "SØKKA", "SØKKE", "SØKKT", "SØKNA", "SØKNE", "SØKTE",
-  "SØLEN", "SØLER", "SØLES", "SØLET", "SØLJA", "SØLJE", "SØLTE", "SØLVA", "SØLVI", "SØMDA",
-  "SØMMA", "SØMME", "SØMNA", "SØMTE", "SØNNA", "SØPLA", "SØPLE", "SØREN", "SØRGA", "SØRGD",
-  "SØRGE", "SØRPA", "SØRPE", "SØRPÅ", "SØRUM", "SØRVA", "SØRVE", "SØTEN", "SØTER", "SØTES",
-  "SØTET", "SØVIK", "SØVNE", "SØYEN", "SØYER", "SØYLA", "SØYLE", "TABBA", "TABBE", "TABLÅ",
-  "TABUA", "TAFLA", "TAFSA", "TAFSE", "TAFTA", "TAGAL", "TAGGA", "TAGGE", "TAGLA", "TAGNA",
-  "TAGNE", "TAIGA", "TAIMA", "TAIME", "TAJER", "TAJET", "TAKET", "TAKKA", "TAKKE", "TAKLA",
-  "TAKLE", "TAKSA", "TAKSE", "TAKST", "TAKTA", "TAKÅS", "TALEN", "TALER", "TALES", "TALGA",
-  "TALGE", "TALJA", "TALJE", "TALLA", "TALLE", "TALLY", "TALTE", "TAMEN", "TAMER", "TAMIL",
-  "TAMME", "TAMPA", "TAMPE", "TAMSA", "TAMSE", "TANDR", "TANEN", "TANER", "TANES", "TANET",
-  "TANGA", "TANGE", "TANGO", "TANKA", "TANKE", "TANKS", "TANNA", "TANNE", "TANTA", "TANTE",
-  "TANTR", "TAPAS", "TAPEN", "TAPER", "TAPES", "TAPET", "TAPIR", "TAPPA", "TAPPE", "TAPRE",
-  "TAPTE", "TAREN", "TARER", "TARVA", "TARVE", "TASAL", "TASEN", "TASER", "TASET", "TASKA",
-  "TASKE", "TASLA", "TASLE", "TASNE", "TASSA", "TASSE", "TASTA", "TASTE", "TATAR", "TATER",
-  "TATLA", "TATLE", "TATRA", "TATTE", "TAUBE", "TAUER", "TAUES", "TAUET", "TAUSA", "TAUSE",
-  "TAUST", "TAVEN", "TAVER", "TAVES", "TAVET", "TAVLA", "TAVLE", "TCHAD", "TEAMA", "TEDDE",
-  "TEDDY", "TEENE", "TEFAT", "TEFTA", "TEFTE", "TEGEN", "TEGER", "TEGLA", "TEGNA", "TEGNE",
-  "TEHUS", "TEINA", "TEINE", "TEING", "TEINT", "TEIPA", "TEIPE", "TEIST", "TEITA", "TEITE",
-  "TEKEN", "TEKER", "TEKKA", "TEKKE", "TEKNO", "TEKST", "TEKTE", "TELEN", "TELER", "TELES",
-  "TELET", "TELGD", "TELGJ", "TELLA", "TELLE", "TELNA", "TELNE", "TELTA", "TELTE", "TELYS",
-  "TEMMA", "TEMME", "TEMPI", "TEMPO", "TEMTE", "TENAR", "TENKE", "TENKT", "TENNE", "TENOR",
-  "TENTE", "TENÅR", "TEORI", "TEPPA", "TEPPE", "TEPTE", "TERGA", "TERGE", "TERJE", "TERME",
-  "TERNA", "TERNE", "TERPA", "TERPE", "TERRA", "TERSA", "TERSE", "TERSK", "TERTA", "TERTE",
-  "TESEN", "TESER", "TESES", "TESET", "TESIL", "TESLA", "TESTA", "TESTE", "TETEN", "TETER",
-  "TETNA", "TETNE", "TETTA", "TETTE", "TEVEN", "TEVER", "TEVES", "TEVET", "TEVLA", "TEVLE",
-  "TEXAS", "TEXEN", "THORA", "THORE", "THORN", "THUNE", "TIARA", "TIBET", "TIDDE", "TIDEL",
-  "TIDEN", "TIDER", "TIDIG", "TIEDE", "TIENE", "TIENT", "TIERE", "TIERN", "TIEST", "TIETE",
-  "TIGDE", "TIGER", "TIGGA", "TIGGE", "TIGRE", "TIING", "TIKEN", "TIKER", "TIKKA", "TIKKE",
-  "TILBA", "TILBE", "TILBY", "TILDE", "TILER", "TILET", "TILGA", "TILGI", "TILGÅ", "TILJA",
-  "TILJE", "TILLA", "TILLE", "TILLÅ", "TILRÅ", "TILSA", "TILSE", "TILSI", "TILSÅ", "TILTA",
-  "TILTE", "TIMEN", "TIMER", "TIMES", "TIMET", "TIMID", "TINDA", "TINDE", "TINDR", "TINEN",
-  "TINER", "TINES", "TINET", "TINGA", "TINGE", "TINKL", "TINNA", "TINNE", "TINTE", "TIPLA",
-  "TIPLE", "TIPPA", "TIPPE", "TIPSA", "TIPSE", "TIREN", "TIRER", "TIRRA", "TIRRE", "TISKA",
-  "TISKE", "TISLA", "TISLE", "TISPA", "TISPE", "TISSA", "TISSE", "TITAN", "TITEN", "TITER",
-  "TITID", "TITTA", "TITTE", "TIÅRA", "TIÅRS", "TIØRE", "TJADR", "TJAET", "TJAFS", "TJALK",
-  "TJATR", "TJATT", "TJAUA", "TJELD", "TJENE", "TJENT", "TJERN", "TJOER", "TJOES", "TJOET",
-  "TJONA", "TJONE", "TJORA", "TJORE", "TJORT", "TJUGA", "TJUKK", "TJUKN", "TJUKT", "TJUVA",
-  "TJUVD", "TJUVE", "TJÅKA", "TJÅKE", "TJÆRA", "TJÆRE", "TJØME", "TOAST", "TOBBE", "TOBIS",
-  "TODDI", "TODDY", "TODEL", "TOEDE", "TOENE", "TOERE", "TOETE", "TOFTA", "TOFTE", "TOGER",
-  "TOGES", "TOGET", "TOING", "TOKAR", "TOKKA", "TOKKE", "TOKTA", "TOKTE", "TOKYO", "TOLAR",
-  "TOLGA", "TOLKA", "TOLKE", "TOLLA", "TOLLE", "TOMAS", "TOMAT", "TOMME", "TOMSA", "TOMSE",
-  "TOMTA", "TOMTE", "TONAL", "TONEM", "TONEN", "TONER", "TONES", "TONET", "TONNA", "TONTE",
-  "TONUS", "TOPAS", "TOPPA", "TOPPE", "TORDE", "TORDN", "TOREN", "TORER", "TORGA", "TORIL",
-  "TORPA", "TORPO", "TORSK", "TORSO", "TORUN", "TORVA", "TORVE", "TOSSA", "TOSSE", "TOTAL",
-  "TOTEM", "TOTEN", "TOTID", "TOUCH", "TOVEN", "TOVER", "TOVES", "TOVET", "TOVNE", "TOÅRS",
-  "TOØRE", "TRABI", "TRACA", "TRACE", "TRADA", "TRADE", "TRAFF", "TRAFO", "TRAKE", "TRAKK",
-  "TRAKT", "TRAKÉ", "TRALA", "TRALE", "TRALL", "TRALT", "TRAMP", "TRANA", "TRANE", "TRANG",
-  "TRANT", "TRAPP", "TRASA", "TRASE", "TRASK", "TRASL", "TRASS", "TRASÉ", "TRAUA", "TRAUD",
-  "TRAUT", "TRAVA", "TRAVD", "TRAVE", "TREAK", "TREDA", "TREDD", "TREDE", "TREEN", "TREER",
-  "TREET", "TREFF", "TREGA", "TREGE", "TREGT", "TREIG", "TREIV", "TREKK", "TRELL", "TREMA",
-  "TRENA", "TREND", "TRENE", "TRENG", "TRENT", "TRESK", "TRESS", "TRETN", "TRETT", "TREVA",
-  "TREVE", "TREVL", "TRIAL", "TRIAS", "TRIGG", "TRIKK", "TRIKS", "TRILL", "TRINE", "TRINN",
-  "TRINS", "TRINT", "TRIOL", "TRIPP", "TRIPS", "TRISA", "TRISE", "TRIST", "TRITT", "TRIVD",
-  "TRIVE", "TRIVL", "TRIVS", "TRODD", "TROEN", "TROER", "TROFE", "TROFÉ", "TROKE", "TROKÉ",
-  "TROLL", "TROML", "TROMS", "TRONA", "TROND", "TRONE", "TRONN", "TROPE", "TROPP", "TROSS",
-  "TROST", "TRUCK", "TRUDD", "TRUDE", "TRUEN", "TRUER", "TRUES", "TRUET", "TRUGA", "TRUGE",
-  "TRULS", "TRULT", "TRUMF", "TRUMP", "TRUNK", "TRUPP", "TRUSA", "TRUSE", "TRUST", "TRUTN",
-  "TRUTT", "TRYGD", "TRYGG", "TRYGL", "TRYGT", "TRYKK", "TRYKT", "TRYLL", "TRYNA", "TRYNE",
-  "TRYTA", "TRYTE", "TRYTT", "TRÅDA", "TRÅDD", "TRÅDE", "TRÅDT", "TRÅEN", "TRÅER", "TRÅKK",
-  "TRÅKL", "TRÅLA", "TRÅLE", "TRÅLT", "TRÅTT", "TRÆDD", "TRÆLA", "TRÆLE", "TRÆNA", "TRØBL",
-  "TRØDD", "TRØEN", "TRØER", "TRØET", "TRØKK", "TRØSK", "TRØST", "TRØTN", "TRØTT", "TRØYA",
-  "TRØYE", "TRØYT", "TUBEN", "TUBER", "TUENE", "TUETE", "TUFSA", "TUFSE", "TUFST", "TUFTA",
-  "TUFTE", "TUGGA", "TUGGE", "TUKAN", "TUKLA", "TUKLE", "TUKTA", "TUKTE", "TULLA", "TULLE",
-  "TULSA", "TUMLA", "TUMLE", "TUMOR", "TUNER", "TUNES", "TUNET", "TUNGA", "TUNGE", "TUNGT",
-  "TUNIS", "TUPER", "TUPPA", "TUPPE", "TURBO", "TUREN", "TURER", "TURES", "TURET", "TURID",
-  "TURKU", "TURNA", "TURNE", "TURNÉ", "TURTA", "TURTE", "TURVE", "TURVT", "TUSEN", "TUSJA",
-  "TUSJE", "TUSKA", "TUSKE", "TUSLA", "TUSLE", "TUSSA", "TUSSE", "TUSTA", "TUSTE", "TUTEL",
-  "TUTEN", "TUTER", "TUTES", "TUTET", "TUTLA", "TUTLE", "TUTOR", "TUTSI", "TUTTA", "TUTTE",
-  "TUTTI", "TVANG", "TVARA", "TVARE", "TVEBO", "TVEBU", "TVEDT", "TVEIT", "TVERR", "TVERS",
-  "TVERT", "TVETT", "TVILE", "TVILL", "TVILT", "TVING", "TVINN", "TVIST", "TVÆRA", "TVÆRE",
-  "TWEED", "TWIST", "TYDAL", "TYDDE", "TYDER", "TYDES", "TYDET", "TYFON", "TYFUS", "TYFØS",
-  "TYGDE", "TYGGA", "TYGGE", "TYING", "TYKKA", "TYKKE", "TYKNA", "TYKNE", "TYKTE", "TYLFT",
-  "TYLLA", "TYLLE", "TYMIN", "TYMUS", "TYNER", "TYNES", "TYNGA", "TYNGD", "TYNGE", "TYNNA",
-  "TYNNE", "TYNTE", "TYPEN", "TYPER", "TYPES", "TYPET", "TYPUS", "TYREN", "TYRER", "TYROL",
-  "TYSKE", "TYSSA", "TYSSE", "TYSTA", "TYSTE", "TYSTN", "TYTEN", "TYTER", "TYTES", "TYTET",
-  "TYTTA", "TYTTE", "TYVED", "TYVEN", "TYVER", "TYVJO", "TÅENE", "TÅENT", "TÅFIS", "TÅGEN",
-  "TÅGET", "TÅKEN", "TÅKER", "TÅKES", "TÅKET", "TÅLER", "TÅLES", "TÅLIG", "TÅLTE", "TÅPEN",
-  "TÅPER", "TÅPNE", "TÅREN", "TÅRER", "TÅRES", "TÅRET", "TÅRNA", "TÅRNE", "TÅTEN", "TÅTER",
-  "TÅTES", "TÅTET", "TÆGER", "TÆLEN", "TÆLER", "TÆRER", "TÆRES", "TÆRET", "TÆRNE", "TÆRTE",
-  "TØDDE", "TØENE", "TØFFA", "TØFFE", "TØFLA", "TØFLE", "TØING", "TØLER", "TØMME", "TØMRA",
-  "TØMRE", "TØMTE", "TØNNA", "TØNNE", "TØRKA", "TØRKE", "TØRNA", "TØRNE", "TØRRA", "TØRRE",
-  "TØRST", "TØSEN", "TØSER", "TØSET", "TØTSJ", "TØTTA", "TØTTE", "TØVDE", "TØVER", "TØVES",
-  "TØVET", "TØVÆR", "TØYDE", "TØYEN", "TØYER", "TØYES", "TØYET", "TØYLA", "TØYLE", "TØYSA",
-  "TØYSE", "TØYST", "TØYTA", "TØYTE", "UANET", "UANTE", "UBEDT", "UBEST", "UBLID", "UBLUE",
-  "UBLYG", "UBONA", "UBONT", "UBYGD", "UBØYD", "UDEKT", "UDELT", "UDRYG", "UDRØY", "UDYRA",
-  "UDØPT", "UEDEL", "UEDLE", "UEFNE", "UEGNA", "UEKTE", "UENIG", "UEREN", "UERNE", "UFFER",
-  "UFFES", "UFFET", "UFIKS", "UFINE", "UFINT", "UFISK", "UFOEN", "UFOER", "UFORA", "UFRED",
-  "UFRIE", "UFSEN", "UFSER", "UFSET", "UFYSA", "UFYSE", "UFÔRA", "UFØDT", "UFØRA", "UFØRE",
-  "UFØRT", "UGAGN", "UGGEN", "UGGER", "UGGES", "UGGET", "UGIFT", "UGILD", "UGLAD", "UGLEN",
-  "UGLER", "UGLES", "UGLET", "UGRAS", "UGREI", "UGRER", "UHEIL", "UHELE", "UHELL", "UHELT",
-  "UHENE", "UHUGA", "UHYRA", "UHYRE", "UHØRT", "UJAMN", "UJAMT", "UJEVN", "UKENE", "UKLAR",
-  "UKLOK", "UKOKT", "UKYSK", "ULADA", "ULADD", "ULAGE", "ULENE", "ULEST", "ULEVD", "ULIKE",
-  "ULIKT", "ULING", "ULKEN", "ULKER", "ULKES", "ULKET", "ULLEN", "ULLER", "ULLUS", "ULMER",
-  "ULMES", "ULMET", "ULNER", "ULNES", "ULNET", "ULRIK", "ULVEN", "ULVER", "ULVIK", "ULYST",
-  "ULÅST", "ULÆRD", "ULÆRT", "ULØNT", "ULØST", "UMAKA", "UMAKE", "UMALT", "UMBRA", "UMIAK",
-  "UMILD", "UMÅLT", "UMÅTE", "UNAVN", "UNDAS", "UNDER", "UNDRA", "UNDRE", "UNETT", "UNGEN",
-  "UNGER", "UNIKE", "UNIKT", "UNION", "UNNBA", "UNNBE", "UNNER", "UNNES", "UNNGÅ", "UNNSA",
-  "UNNSE", "UNNSI", "UNNSÅ", "UNNTA", "UNOTE", "UNSEN", "UNSER", "UNÅDE", "UORDA", "UPARA",
-  "UPOPE", "UPOPP", "UPOPT", "UPRIS", "URAKA", "URANA", "URBAN", "URDYR", "UREDD", "UREDE",
-  "UREID", "UREIN", "UREMI", "URENE", "URENT", "URETE", "URETT", "URGER", "URNEN", "URNER",
-  "URODD", "UROEN", "UROER", "UROES", "UROET", "URTEN", "URTER", "URTID", "URUND", "URVEN",
-  "URVNE", "URYDD", "URØKT", "URØRT", "USAGT", "USAMD", "USAMS", "USANN", "USANT", "USETT",
-  "USEXY", "USKAP", "USMAK", "USONA", "USONT", "USSEL", "USSEN", "USSER", "USSES", "USSET",
-  "USTØE", "USUNN", "USUNT", "USYDD", "USYRA", "USYRT", "USÅDD", "USÅRA", "USÆLA", "USÆLE",
-  "USÆLT", "USØKT", "USØTA", "UTAKK", "UTAKT", "UTALL", "UTAPÅ", "UTARM", "UTART", "UTARV",
-  "UTASA", "UTAST", "UTAUS", "UTBAD", "UTBER", "UTBES", "UTBOR", "UTBRE", "UTBUD", "UTBYR",
-  "UTBYS", "UTBØD", "UTBØY", "UTDEL", "UTDYP", "UTDØR", "UTDØS", "UTEDO", "UTEKK", "UTEKT",
-  "UTEMT", "UTESK", "UTETT", "UTFAS", "UTFOR", "UTFRI", "UTFØR", "UTGAV", "UTGIR", "UTGIS",
-  "UTGYT", "UTGÅR", "UTGÅS", "UTHEV", "UTHOL", "UTHUL", "UTHUS", "UTINA", "UTING", "UTINT",
-  "UTKIK", "UTKOK", "UTKOM", "UTKÅR", "UTLAD", "UTLAT", "UTLED", "UTLEG", "UTLEI", "UTLES",
-  "UTLOT", "UTLOV", "UTLYD", "UTLYS", "UTLÅN", "UTLØA", "UTLØD", "UTLØE", "UTLØP", "UTLØS",
-  "UTMAI", "UTMAL", "UTMED", "UTMÅL", "UTOEN", "UTOPI", "UTPEK", "UTPIN", "UTRED", "UTREV",
-  "UTRIV", "UTROP", "UTROR", "UTRUE", "UTSER", "UTSES", "UTSIG", "UTSON", "UTSTO", "UTSTÅ",
-  "UTSUG", "UTSYN", "UTSÆD", "UTTAK", "UTTAL", "UTTAR", "UTTAS", "UTTOG", "UTTOK", "UTTUR",
-  "UTTYD", "UTTØM", "UTUKT", "UTVED", "UTVEG", "UTVEI", "UTVID", "UTVIS", "UTVÆR", "UTYSK",
-  "UTÅND", "UTØSE", "UTØST", "UTØVA", "UTØVD", "UTØVE", "UTØYA", "UVANE", "UVANT", "UVDAL",
-  "UVDØL", "UVENN", "UVETT", "UVISS", "UVÆRA", "UÅPNA", "UÅRET", "UØVDE", "UØVET", "VAASA",
-  "VABBA", "VABBE", "VABLE", "VADDE", "VADEN", "VADER", "VADES", "VADET", "VADRA", "VADRE",
-  "VADSØ", "VADUZ", "VAFLA", "VAFLE", "VAGGA", "VAGGE", "VAGLA", "VAGLE", "VAIER", "VAIES",
-  "VAIET", "VAING", "VAIRE", "VAKEN", "VAKER", "VAKES", "VAKET", "VAKLA", "VAKLE", "VAKNA",
-  "VAKNE", "VAKRE", "VAKTA", "VAKTE", "VALDA", "VALEN", "VALER", "VALGA", "VALGT", "VALID",
-  "VALKA", "VALKE", "VALLE", "VALMA", "VALME", "VALNA", "VALNE", "VALPA", "VALPE", "VALSA",
-  "VALSE", "VALTA", "VALTE", "VALØR", "VAMLE", "VANDA", "VANDE", "VANDL", "VANDR", "VANDT",
-  "VANEN", "VANER", "VANGE", "VANKA", "VANKE", "VANNA", "VANNE", "VANRY", "VANTA", "VANTE",
-  "VANÆR", "VARDA", "VARDE", "VARDØ", "VAREN", "VARER", "VARES", "VARET", "VARIA", "VARIG",
-  "VARMA", "VARME", "VARMT", "VARPA", "VARPE", "VARSL", "VARTA", "VARTE", "VASEN", "VASER",
-  "VASES", "VASET", "VASKA", "VASKE", "VASLE", "VASNE", "VASSA", "VASSE", "VASTE", "VATER",
-  "VATNA", "VATNE", "VATRA", "VATRE", "VATTA", "VAVRA", "VAVRE", "VEBBA", "VEBBE", "VEDBU",
-  "VEDDA", "VEDDE", "VEDEN", "VEDER", "VEDGÅ", "VEDLA", "VEDRE", "VEDTA", "VEENE", "VEFSN",
-  "VEFTA", "VEFTE", "VEGAN", "VEGAS", "VEGDE", "VEGEN", "VEGER", "VEGES", "VEGNA", "VEGNE",
-  "VEGRA", "VEGRE", "VEIDA", "VEIDD", "VEIDE", "VEIDN", "VEIEN", "VEIER", "VEIES", "VEIKE",
-  "VEIKN", "VEIKT", "VEILA", "VEILE", "VEITA", "VEITE", "VEIVA", "VEIVD", "VEIVE", "VEKEN",
-  "VEKER", "VEKET", "VEKKA", "VEKKE", "VEKNA", "VEKNE", "VEKSL", "VEKST", "VEKTA", "VEKTE",
-  "VELAR", "VELDA", "VELDE", "VELER", "VELET", "VELGE", "VELIN", "VELLA", "VELLE", "VELSK",
-  "VELTA", "VELTE", "VELUM", "VELUR", "VEMOD", "VENDA", "VENDE", "VENDT", "VENEN", "VENER",
-  "VENNE", "VENTA", "VENTE", "VENÅS", "VENØS", "VERBA", "VERDA", "VERDE", "VERDI", "VERDT",
-  "VERFT", "VERGA", "VERGE", "VERKA", "VERKE", "VERKT", "VERNA", "VERNE", "VERPA", "VERPE",
-  "VERPT", "VERRE", "VERSA", "VERSN", "VERST", "VERVA", "VERVE", "VESAL", "VESEL", "VESEN",
-  "VESIR", "VESKA", "VESKE", "VESLA", "VESLE", "VESTA", "VESUV", "VETEN", "VETER", "VETOA",
-  "VETTA", "VETTE", "VEVDE", "VEVEN", "VEVER", "VEVES", "VEVET", "VEVRE", "VICHY", "VIDAR",
-  "VIDDA", "VIDDE", "VIDEN", "VIDEO", "VIDER", "VIDES", "VIDET", "VIDJA", "VIDJE", "VIEDE",
-  "VIERE", "VIETE", "VIFER", "VIFTA", "VIFTE", "VIGDE", "VIGGA", "VIGGE", "VIGGO", "VIGIL",
-  "VIGLA", "VIGLE", "VIGRA", "VIGSL", "VIGØR", "VIING", "VIKAN", "VIKAR", "VIKEN", "VIKER",
-  "VIKES", "VIKJE", "VIKKA", "VIKKE", "VIKLA", "VIKLE", "VIKNA", "VIKSK", "VIKTA", "VIKTE",
-  "VILDR", "VILJE", "VILLA", "VILLE", "VILTA", "VILTR", "VIMEN", "VIMER", "VIMES", "VIMET",
-  "VIMNE", "VIMRA", "VIMRE", "VIMSA", "VIMSE", "VINBY", "VINDA", "VINDE", "VINDT", "VINDU",
-  "VINEN", "VINER", "VINGA", "VINGE", "VINGL", "VINJE", "VINKA", "VINKE", "VINKL", "VINNA",
-  "VINNE", "VINSJ", "VINST", "VINTE", "VINTR", "VINYL", "VINÅR", "VINØS", "VIPEN", "VIPER",
-  "VIPPA", "VIPPE", "VIPSA", "VIPSE", "VIRAK", "VIRAL", "VIRER", "VIRES", "VIRIL", "VIRKA",
-  "VIRKE", "VIRRA", "VIRRE", "VIRTE", "VIRUS", "VIRVL", "VISEN", "VISER", "VISES", "VISET",
-  "VISIR", "VISKA", "VISKE", "VISLA", "VISLE", "VISNA", "VISNE", "VISPA", "VISPE", "VISSA",
-  "VISSE", "VISST", "VISTA", "VISTE", "VISUM", "VITAL", "VITEN", "VITES", "VITJA", "VITJE",
-  "VITNA", "VITNE", "VITRA", "VITRE", "VITSA", "VITSE", "VIVAT", "VIVEN", "VIVET", "VODKA",
-  "VOFFA", "VOFFE", "VOGGA", "VOGGE", "VOGNA", "VOILE", "VOKAL", "VOKKA", "VOKKE", "VOKSA",
-  "VOKSE", "VOKST", "VOKTA", "VOKTE", "VOLDA", "VOLDE", "VOLDT", "VOLEN", "VOLER", "VOLGA",
-  "VOLLA", "VOLLE", "VOLTA", "VOLTE", "VOLUM", "VOLVA", "VOLVE", "VOLVO", "VOMER", "VOMMA",
-  "VONDE", "VONDT", "VONEN", "VONER", "VONES", "VONET", "VONOM", "VONTE", "VORDE", "VOREN",
-  "VORER", "VORMA", "VORTA", "VORTE", "VOTER", "VOTUM", "VOVEN", "VOVER", "VOVES", "VOVET",
-  "VRAKA", "VRAKE", "VRAKT", "VRALT", "VRANG", "VREDE", "VREDT", "VRENG", "VRIDD", "VRIEN",
-  "VRIER", "VRIKK", "VRIKL", "VRIML", "VRIST", "VRÅEN", "VRÅER", "VRÆLA", "VRÆLE", "VRÆLT",
-  "VRØVL", "VUGGA", "VUGGE", "VULKA", "VULKE", "VULST", "VULVA", "VUNNE", "VYENE", "VYRKE",
-  "VYRKT", "VÅDEN", "VÅDER", "VÅENE", "VÅGAL", "VÅGAN", "VÅGDE", "VÅGEN", "VÅGER", "VÅGES",
-  "VÅGET", "VÅKEN", "VÅKER", "VÅKES", "VÅKET", "VÅKNA", "VÅKNE", "VÅKTE", "VÅLER", "VÅLES",
-  "VÅLET", "VÅLTE", "VÅNDA", "VÅNDE", "VÅPEN", "VÅPNA", "VÅREN", "VÅRER", "VÅRES", "VÅRET",
-  "VÅRYR", "VÅSER", "VÅSES", "VÅSET", "VÅSTE", "VÅTNA", "VÅTNE", "VÆPNA", "VÆPNE", "VÆREN",
-  "VÆRER", "VÆRES", "VÆRET", "VÆRØY", "VÆSKA", "VÆSKE", "VÆTEN", "VÆTER", "VÆTES", "VÆTET",
-  "VÆTTE", "VØLEN", "VØLER", "VØLES", "VØLTE", "VØRDE", "VØRDT", "VØRER", "VØRES", "VØRSL",
-  "VØRTE", "WAAGE", "WALES", "WALLE", "WANDA", "WATER", "WATNE", "WEBBA", "WEBBE", "WEBEN",
-  "WEBER", "WHIST", "WHITE", "WIGGO", "WILLY", "WIREN", "WIRER", "WOKEN", "WOKER", "WOKKA",
-  "WOKKE", "WONEN", "WONER", "WORTH", "XENIE", "XENON", "YACHT", "YAKEN", "YAKER", "YATZY",
-  "YDDER", "YDDES", "YDDET", "YDMYK", "YEMEN", "YENEN", "YLENE", "YLING", "YMIST", "YMTEN",
-  "YMTER", "YMTES", "YMTET", "YNDEN", "YNDER", "YNDES", "YNDET", "YNDIG", "YNGEL", "YNGER",
-  "YNGES", "YNGET", "YNGLA", "YNGLE", "YNGRE", "YNGST", "YNGVE", "YNKEN", "YNKER", "YNKES",
-  "YNKET", "YPPAL", "YPPER", "YPPES", "YPPET", "YPPIG", "YREDE", "YRENE", "YRENT", "YRERE",
-  "YREST", "YRETE", "YRHET", "YRING", "YRKEN", "YRKER", "YRKES", "YRKET", "YSTAD", "YSTEL",
-  "YSTER", "YSTES", "YSTET", "YTEDE", "YTENE", "YTERE", "YTETE", "YTING", "YTRER", "YTRES",
-  "YTRET", "YUKON", "ZAIRE", "ZAPPA", "ZAPPE", "ZAÏRE", "ZLOTY", "ZOOEN", "ZOOER", "ZOOMA",
-  "ZOOME", "ÄLAND", "ÅENDE", "ÅGRER", "ÅGRES", "ÅGRET", "ÅKENE", "ÅKERE", "ÅKING", "ÅKLÆR",
-  "ÅKRER", "ÅLAND", "ÅLEDE", "ÅLENE", "ÅLETE", "ÅLING", "ÅMENE", "ÅMOTA", "ÅNDEN", "ÅNDER",
-  "ÅNDES", "ÅNDET", "ÅNDRA", "ÅNDRE", "ÅPENT", "ÅPNER", "ÅPNES", "ÅPNET", "ÅRBOK", "ÅRBUK",
-  "ÅRDAL", "ÅRDØL", "ÅRENE", "ÅRETE", "ÅRHUS", "ÅRING", "ÅRLIG", "ÅRSAK", "ÅRTES", "ÅRTIA",
-  "ÅRVAK", "ÅRVEG", "ÅRVEI", "ÅSABU", "ÅSANE", "ÅSDØL", "ÅSENE", "ÅSETE", "ÅSING", "ÅSNES",
-  "ÅSSEN", "ÅSTAK", "ÅSTED", "ÅSYNA", "ÅTAKA", "ÅTALA", "ÅTENE", "ÅTSEL", "ÅTSLA", "ÅTTER",
-  "ÅVERK", "ÅVIRK", "ÆGIDE", "ÆRAEN", "ÆRAER", "ÆRBAR", "ÆRDUN", "ÆREDE", "ÆREND", "ÆRENE",
-  "ÆRETE", "ÆRING", "ÆRLIG", "ÆSENE", "ÆTTEN", "ÆTTER", "ÆTTES", "ÆTTET", "ÆVENE", "ØDEDE",
-  "ØDELA", "ØDEMA", "ØDENE", "ØDERE", "ØDEST", "ØDETE", "ØDING", "ØDSEL", "ØDSLA", "ØDSLE",
-  "ØGLEN", "ØGLER", "ØKEDE", "ØKENE", "ØKETE", "ØKING", "ØKSEL", "ØKSEN", "ØKSER", "ØKSES",
-  "ØKSET", "ØKSLA", "ØKSLE", "ØKTEN", "ØKTER", "ØKTES", "ØKTET", "ØLENE", "ØLETE", "ØLFAT",
-  "ØLING", "ØLLER", "ØLLES", "ØLLET", "ØLOST", "ØLRIK", "ØLRUS", "ØLSBU", "ØLVOM", "ØMHET",
-  "ØMMER", "ØMMES", "ØMMET", "ØNSKA", "ØNSKE", "ØNSKT", "ØRENE", "ØRENT", "ØRERE", "ØREST",
-  "ØRING", "ØRKEN", "ØRNEN", "ØRNER", "ØRNES", "ØRRET", "ØRSKA", "ØRSKE", "ØRSKT", "ØRSMÅ",
-  "ØRSTA", "ØRTEN", "ØRTER", "ØRTES", "ØRTET", "ØRTUG", "ØSENE", "ØSING", "ØSKJA", "ØSKJE",
-  "ØSTEN", "ØSTPÅ", "ØSTRE", "ØVEDE", "ØVETE", "ØVING", "ØVRIG", "ØYDDE", "ØYDER", "ØYDES",
-  "ØYENE", "ØYING", "ØYKEN", "ØYKER", "ØYMÅL", "ØYNER", "ØYNES", "ØYNET", "ØYREN", "ØYRER",
-  "ØYRES", "ØYRET", "ØYTUR", "ØYVIN",
-];
@@ -1,6 +1,7 @@
-import { VALID_GUESSES } from './valid_words';
+import { ENDPOINTS } from './config';
+
 // A curated list of common Norwegian words
-// Ideally, this should be thousands of words, but this is enough for the prototype.
+// Same list as rod_backend/word_bank/target_words.txt (daily answers); used offline and for replays.
 export const TARGET_WORDS = [
   "AGURK", "ALENE", "ALVOR", "ANDRE", "ANGST", "ANKER", "ANTAR", "APRIL", "AVSLÅ", "AVTAL",
   "BADER", "BAKKE", "BAMSE", "BANAN", "BANKE", "BARNA", "BASIS", "BEDRE", "BEGGE", "BEVIS",
@@ -48,11 +49,36 @@ export const TARGET_WORDS = [
   "ÆRLIG", "ØNSKE", "ØRRET", "ÅPNET", "ÅRSAK"
 ];
 
-// Helper to check valid words
-export function isWordValid(word: string): boolean {
+// Helper to check valid words (the full dictionary lives on the server)
+export async function isWordValid(word: string): Promise<boolean> {
   const w = word.toUpperCase();
-  // It's valid if it's in the Big Dictionary OR the Target List
-  return VALID_GUESSES.includes(w) || TARGET_WORDS.includes(w);
+  if (TARGET_WORDS.includes(w)) return true;
+  try {
+    const response = await fetch(`${ENDPOINTS.WORDS_VALIDATE}?word=${encodeURIComponent(w)}`);
+    // Server-side trouble (e.g. 503 when the word index hasn't been generated): treat like offline
+    if (response.status >= 500) return true;
+    if (!response.ok) return false;
+    const data = await response.json();
+    return data.valid === true;
+  } catch (e) {
+    console.error("Word validation failed", e);
+    // Offline: don't block the player
+    return true;
+  }
+}
+
+// Today's word (same for everyone), falling back to a random one offline
+export async function getDailyWord(): Promise<string> {
+  try {
+    const response = await fetch(ENDPOINTS.WORDS_DAILY);
+    if (response.ok) {
+      const data = await response.json();
+      if (data.word) return data.word.toUpperCase();
+    }
+  } catch (e) {
+    console.error("Failed to fetch daily word", e);
+  }
+  return getRandomWord();
 }
 
 // Get a random Answer
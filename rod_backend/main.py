@@ -1,21 +1,76 @@
 import uvicorn
-from fastapi import FastAPI, UploadFile, File, Request, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, Request, HTTPException, BackgroundTasks, Query
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse, JSONResponse, Response
+from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 from pathlib import Path
-import aiofiles
-import uuid
+import json
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
 # Import our modules
-import src.services.db_service as db
-from src.services.textgen_service import get_rod_response
-from src.services.stt_service import speech_to_text
-from src.services.tts_service import text_to_speech
-from src.services.grammar_check_service import analyze_grammar
-from src.services.media_service import get_cached_news, refresh_news_background
+import src.services.async_db_service as db
+import src.services.metrics_service as metrics
+import src.services.log_service as log
+import src.services.llm_gateway as llm
+from src.services.textgen_service import (
+    get_rod_response, stream_rod_response, choose_chat_model, check_chat_capacity, is_opening_turn, opening_cache,
+)
+from src.services.llm_gateway import LLMOverloaded, check_capacity
+from src.services.stt_service import speech_to_text, AudioTooLarge, TranscodeBusy, MAX_UPLOAD_BYTES, UPLOAD_CHUNK_SIZE
+from src.services.tts_service import text_to_speech, register_stream, stream_registered, audio_cache
+from src.services.grammar_queue_service import run_grammar_workers, save_reply
+from src.services.media_service import get_cached_news, run_news_refresher, close_http_client
+from src.services.lexicon_service import get_lexicon
+import src.services.word_service as words
+from src.services.context_service import load_chat_turn, build_prompt_history, update_rolling_summary, conversation_depth
+
+# JSON logs through a background thread (see log_service); set up before anything logs
+log.configure_logging()
+logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# LIFECYCLE
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup: initialize the Database, map the lexicon and word index, index the audio cache,
+    start the periodic news refresher and the grammar workers.
+    Shutdown: stop the background tasks and close pooled HTTP/database connections.
+    """
+    logger.info("Checking database")
+    await db.init_db()
+    get_lexicon()
+    words.get_word_index()
+    await audio_cache.load()
+    news_refresher = asyncio.create_task(run_news_refresher())
+    grammar_workers = asyncio.create_task(run_grammar_workers())
+    loop_monitor = asyncio.create_task(metrics.run_loop_lag_monitor())
+
+    yield
+
+    for task in (news_refresher, grammar_workers, loop_monitor):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_http_client()
+    await llm.close()
+    db.shutdown()
+    log.shutdown_logging()
+
+app = FastAPI(lifespan=lifespan)
+# Per-route latency + in-flight requests (see /metrics)
+app.add_middleware(metrics.RequestMetricsMiddleware)
+# X-Request-ID on every response and log record (added last = outermost)
+app.add_middleware(log.CorrelationIdMiddleware)
+
+@app.exception_handler(LLMOverloaded)
+async def handle_llm_overloaded(request: Request, exc: LLMOverloaded):
+    """Shed load fast: the client should retry after the advertised delay."""
+    return JSONResponse(status_code=503, content={"detail": "Rod is very busy right now, try again shortly"},
+                        headers={"Retry-After": str(exc.retry_after)})
 
 # Pydantic Models (Defines JSON data shape)
 class LevelUpdate(BaseModel):
@@ -32,18 +87,13 @@ class UserMessage(BaseModel):
 class SynthesisRequest(BaseModel):
     text: str
 
+class StreamSynthesisRequest(BaseModel):
+    text: str = Field(..., min_length=1, max_length=5000)
+
 class TitleUpdate(BaseModel):
     title: str
 
 
-# LIFECYCLE
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the Database when server starts."""
-    print("Checking database...")
-    db.init_db()
-
-
 # STATIC FILES
 AUDIO_DIR = Path.cwd() / "src" / "assets" / "audio"
 # Create if it doesn't exist
@@ -55,115 +105,105 @@ app.mount("/audio", StaticFiles(directory=AUDIO_DIR), name="audio")
 @app.post("/user/activity")
 async def record_activity(data: LevelUpdate):
     """Generic endpoint to update streak from games/media."""
-    db.update_user_streak(data.user_id)
+    await db.update_user_streak(data.user_id)
     return {"status": "updated"}
 
 @app.get("/user/streak/{user_id}")
 async def get_streak(user_id: str):
-    streak = db.get_user_streak(user_id)
+    streak = await db.get_user_streak(user_id)
     return {"streak": streak}
 
 @app.post("/user/level")
 async def update_level(data: LevelUpdate):
     """Updates the user's proficiency level."""
-    print(f"Setting user {data.user_id} to level {data.level}")
-    db.set_user_level(data.user_id, data.level)
+    logger.info("Setting user level", extra={"user_id": data.user_id, "cefr_level": data.level})
+    await db.set_user_level(data.user_id, data.level)
     return {"status": "success", "level": data.level}
 
 @app.get("/feedback/{conversation_id}")
 async def get_conversation_feedback(conversation_id: int):
     """Returns a list of grammar corrections for a specific chat."""
-    return {"feedback": db.get_feedback_for_conversation(conversation_id)}
-
-async def run_grammar_check(msg_id: int, history: List[Dict], user_text: str, ai_response: str, level: str):
-    """
-    Background Task: Checks grammar without blocking the chat.
-    """
-    print(f"🕵️ Checking grammar for: {user_text}")
-    result = await analyze_grammar(history, user_text, ai_response, level)
-    
-    if result and result.get("has_error"):
-        print(f"🚩 Feedback Generated ({level})")
-        # Save to DB so the user can see it later in the feedback menu
-        db.add_feedback(msg_id, user_text, result["correction"], result["explanation"])
-    else:
-        print("✅ Message looks good.")
+    return {"feedback": await db.get_feedback_for_conversation(conversation_id)}
+
+def _schedule_turn_tasks(background_tasks: BackgroundTasks, turn: Dict):
+    """Rolling summary update, after the reply is sent (the grammar check is queued with the reply)."""
+    background_tasks.add_task(update_rolling_summary, turn["conversation_id"], turn["window_start_id"])
+
+async def _load_turn(request: UserMessage, text_input: str) -> Dict:
+    """Steps 1-4 of a chat turn (one DB transaction)."""
+    turn = await load_chat_turn(
+        request.user_id,
+        text_input,
+        conversation_id=request.conversation_id,
+        context_data=request.context_data,
+        force_new=request.force_new,
+    )
+    log.bind_conversation(turn["conversation_id"])
+    logger.debug("Chat turn loaded", extra={
+        "new_conversation": bool(request.force_new or request.context_data),
+        "history_messages": len(turn["history"]),
+        "context_title": turn["context"].get("title") if turn["context"] else None,
+    })
+    return turn
+
+async def _discard_turn(turn: Dict):
+    """The turn was shed after its user message was stored: remove it so the client's retry starts clean."""
+    await db.discard_user_message(turn["conversation_id"], turn["message_id"])
+    logger.info("Shed chat turn discarded", extra={"message_id": turn["message_id"]})
+
+def _log_reply(level: str, model: str, reason: str, latency_ms: int):
+    logger.info("Chat reply generated", extra={**log.SAMPLED, "cefr_level": level, "model": model,
+                                               "reason": reason, "latency_ms": latency_ms})
 
 @app.post("/chat")
 async def handle_chat(request: UserMessage, background_tasks: BackgroundTasks):
     """
     The Main Brain. 
-    1. Ensures user exists.
+    1. Ensures user exists and updates the streak.
     2. Finds/Creates the conversation thread.
     3. Saves user message to DB.
-    4. Generates AI response using full DB history.
-    5. Saves AI response to DB.
+       (Steps 1-3 and the history read are a single DB transaction.)
+    4. Generates AI response using the recent history window (+ rolling summary),
+       with the model picked for this turn (see choose_chat_model).
+       Common openings of context-free conversations are answered from the opening cache.
+    5. Saves AI response to DB, with the model and latency.
     """
-    user_id = request.user_id
+    # Cheap early shed before touching the DB; a turn shed later (slot taken meanwhile) is discarded below
+    check_chat_capacity()
     text_input = request.message.strip()
 
-    # 1. Ensure User Exists
-    db.create_user_if_not_exists(user_id)
-    db.update_user_streak(user_id)
-
-    # 2. Determine Conversation ID
-    if request.force_new or request.context_data:
-        print("Starting NEW conversation")
-        conversation_id = db.start_new_conversation(user_id, request.context_data)
-    elif request.conversation_id:
-        conversation_id = request.conversation_id
-        print(f"Resuming conversation ID: {conversation_id}")
-    else:
-        conversation_id = db.get_latest_conversation_id(user_id)
-        if not conversation_id:
-            conversation_id = db.start_new_conversation(user_id)
-
-    # 3. Save User Message & Trigger Grammar Check
-    msg_id = db.add_message(conversation_id, "user", text_input)
-
-    # 4. Fetch History & Generate Response
-    history_dicts = db.get_chat_history(conversation_id)
-
-    active_context = db.get_conversation_context(conversation_id)
-
-    if active_context:
-        print(f"📖 Found Active Context: {active_context.get('title')}")
-        # Create a "System Note" that Rod sees, but isn't saved to the user's chat log
-        context_injection = {
-            "role": "system",
-            "content": f"""
-            VIKTIG KONTEKST:
-            Brukeren har nettopp lest artikkelen: "{active_context.get('title')}".
-            Sammendrag: "{active_context.get('summary')}".
-            
-            DINE INSTRUKSER FOR DENNE SAMTALEN:
-            1. **FOKUS:** Hele denne samtalen skal handle om denne artikkelen.
-            2. **SVAR PÅ SPØRSMÅL:** 
-            3. **LED SAMTALEN:** Etter at du har svart, still et spørsmål tilbake om hva brukeren mener om saken.
-            """
-        }
-        # Injects it at the BEGINNING of the history sent to AI
-        history_dicts.insert(0, context_injection)
-
-    # 5. Generate Response
-    user_level = db.get_user_level(user_id)
-    print(f"Generating response for level: {user_level}")
-    response_text = await get_rod_response(history_dicts, level=user_level) or "Beklager, jeg forsto ikke det."
+    # 1-4. Upsert user + streak, find/create thread, save message, read history (one transaction)
+    turn = await _load_turn(request, text_input)
+    conversation_id = turn["conversation_id"]
+    user_level = turn["level"]
 
-    # 6. Save AI Response
-    db.add_message(conversation_id, "assistant", response_text)
+    # Recent window + rolling summary + article context (within the token budget)
+    history_dicts = build_prompt_history(turn)
 
-    # 7. Trigger Background Check
-    context_history = history_dicts[:-1] 
-    
-    background_tasks.add_task(
-        run_grammar_check, 
-        msg_id, 
-        context_history, 
-        text_input,     
-        response_text,
-        user_level 
-    )
+    # 5. Generate Response
+    opening = is_opening_turn(turn)
+    cached = opening_cache.get(user_level, text_input) if opening else None
+    if cached:
+        model, reason, response_text, latency_ms = "cache", "opening_cache", cached, 0
+    else:
+        model, reason = choose_chat_model(user_level, text_input, conversation_depth(turn))
+        start = time.perf_counter()
+        try:
+            check_chat_capacity(model)
+            response_text = await get_rod_response(history_dicts, level=user_level, model=model) or "Beklager, jeg forsto ikke det."
+        except LLMOverloaded:
+            await _discard_turn(turn)
+            raise
+        latency_ms = int((time.perf_counter() - start) * 1000)
+        if opening:
+            opening_cache.put(user_level, text_input, response_text)
+    _log_reply(user_level, model, reason, latency_ms)
+
+    # 6. Save AI Response + grammar check of the user message (cached, or queued in the same transaction)
+    await save_reply(conversation_id, response_text, turn, text_input, model=model, latency_ms=latency_ms)
+
+    # 7. Fold old turns into the summary
+    _schedule_turn_tasks(background_tasks, turn)
 
     return {
         "role": "assistant", 
@@ -171,72 +211,289 @@ async def handle_chat(request: UserMessage, background_tasks: BackgroundTasks):
         "conversation_id": conversation_id 
     }
 
+# Detached tasks (replies of interrupted streams), referenced until done so they aren't garbage collected
+_detached_tasks: set = set()
+
+def _detach(coro):
+    task = asyncio.ensure_future(coro)
+    _detached_tasks.add(task)
+    task.add_done_callback(_detached_tasks.discard)
+
+async def _save_interrupted_stream(deltas, parts: List[str], finish, turn: Dict):
+    """Stream whose client disconnected: keep the partial reply and fold old turns into the summary."""
+    try:
+        if deltas is not None:
+            await deltas.aclose()
+        if parts:
+            # A cached opening reply was complete, only its delivery was interrupted
+            await finish(parts, truncated=deltas is not None)
+            await update_rolling_summary(turn["conversation_id"], turn["window_start_id"])
+        else:
+            await _discard_turn(turn)
+    except Exception:
+        logger.exception("Saving interrupted chat stream failed")
+
+def _sse(data: Dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.post("/chat/stream")
+async def handle_chat_stream(request: UserMessage, background_tasks: BackgroundTasks):
+    """
+    Same as /chat, but streams Rod's reply as Server-Sent Events:
+    - event "meta":  {"conversation_id": ...}
+    - (default):     {"delta": "..."} per token chunk
+    - event "done":  {"role": "assistant", "content": full reply, "conversation_id": ...}
+    - event "error": {"detail": ..., "conversation_id": ...} if the model fails mid-reply
+    The reply is saved and the grammar check scheduled once the stream completes. A reply cut off by a
+    model failure or a client disconnect is saved as far as it got, marked truncated.
+    The first chunk is awaited before the response starts, so an overloaded model still answers 503.
+    """
+    check_chat_capacity()
+    text_input = request.message.strip()
+    turn = await _load_turn(request, text_input)
+    conversation_id = turn["conversation_id"]
+    history_dicts = build_prompt_history(turn)
+    opening = is_opening_turn(turn)
+    cached = opening_cache.get(turn["level"], text_input) if opening else None
+    if cached:
+        model, reason = "cache", "opening_cache"
+    else:
+        model, reason = choose_chat_model(turn["level"], text_input, conversation_depth(turn))
+
+    start = time.perf_counter()
+    deltas = None
+    first_delta = cached
+    if not cached:
+        try:
+            check_chat_capacity(model)
+        except LLMOverloaded:
+            await _discard_turn(turn)
+            raise
+        deltas = stream_rod_response(history_dicts, level=turn["level"], model=model)
+        try:
+            first_delta = await deltas.__anext__()
+        except StopAsyncIteration:
+            first_delta = None
+        except LLMOverloaded:
+            await deltas.aclose()
+            await _discard_turn(turn)
+            raise
+
+    async def finish(parts: List[str], truncated: bool = False) -> str:
+        latency_ms = int((time.perf_counter() - start) * 1000)
+        _log_reply(turn["level"], model, reason, latency_ms)
+        response_text = "".join(parts) or "Beklager, jeg forsto ikke det."
+        if opening and not cached and not truncated:
+            opening_cache.put(turn["level"], text_input, response_text)
+        await save_reply(conversation_id, response_text, turn, text_input, model=model, latency_ms=latency_ms,
+                         truncated=truncated)
+        return response_text
+
+    async def event_stream():
+        parts = [first_delta] if first_delta else []
+        finished = False
+        try:
+            yield _sse({"conversation_id": conversation_id}, event="meta")
+            if first_delta:
+                yield _sse({"delta": first_delta})
+            if deltas is not None:
+                try:
+                    async for delta in deltas:
+                        parts.append(delta)
+                        yield _sse({"delta": delta})
+                except Exception:
+                    # The model failed after part of the reply was sent (logged in stream_rod_response)
+                    finished = True
+                    await finish(parts, truncated=True)
+                    _schedule_turn_tasks(background_tasks, turn)
+                    yield _sse({"detail": "Rod's reply was cut off, try again", "conversation_id": conversation_id},
+                               event="error")
+                    return
+
+            finished = True
+            response_text = await finish(parts)
+            # Background tasks run after the stream closes, so they can still be added here
+            _schedule_turn_tasks(background_tasks, turn)
+            yield _sse({"role": "assistant", "content": response_text, "conversation_id": conversation_id}, event="done")
+        finally:
+            if not finished:
+                # Client went away mid-stream. Awaiting here would be cancelled again, so a detached task
+                # stops the model and saves what was generated (marked truncated).
+                _detach(_save_interrupted_stream(deltas, parts, finish, turn))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=background_tasks,
+    )
+
+
+async def _upload_chunks(upload: UploadFile):
+    """Reads an upload in fixed-size chunks instead of all at once."""
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
 
 @app.post("/transcribe")
 async def handle_transcription(audio_file: UploadFile = File(...)):
     """
     Standard Whisper implementation. 
+    The upload is streamed (through ffmpeg if needed) straight to Whisper, with no temp files.
     """
-    temp_path = Path(f"temp_{audio_file.filename}")
+    if audio_file.size is not None and audio_file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Audio file too large")
+    check_capacity("whisper-1")
     try:
-        async with aiofiles.open(temp_path, 'wb') as out_file:
-            content = await audio_file.read()
-            await out_file.write(content)
-        
-        transcribed_text = await speech_to_text(temp_path)
+        transcribed_text = await speech_to_text(_upload_chunks(audio_file), audio_file.filename or "")
         return {"text": transcribed_text}
+    except AudioTooLarge:
+        raise HTTPException(status_code=413, detail="Audio file too large")
+    except TranscodeBusy as e:
+        raise HTTPException(status_code=503, detail="Transcription is busy, try again shortly",
+                            headers={"Retry-After": str(e.retry_after)})
+    except LLMOverloaded:
+        raise
     except Exception as e:
-        print(f"Error during transcription: {e}")
+        logger.exception("Error during transcription")
         return {"error": str(e)}
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
 
 
 @app.post("/synthesize")
 async def handle_synthesis(request: SynthesisRequest, req: Request):
     """
     Standard ElevenLabs implementation.
+    Files are content-addressed, so repeated text returns the cached URL instantly.
     """
-    filename = f"{uuid.uuid4()}.mp3"
-    audio_path = await text_to_speech(request.text, filename=filename)
+    audio_path = await text_to_speech(request.text)
     
     if audio_path:
-        file_url = f"{req.base_url}audio/{filename}"
+        file_url = f"{req.base_url}audio/{audio_path.name}"
         return {"url": file_url}
     else:
         raise HTTPException(status_code=500, detail="Failed to generate audio")
     
+@app.post("/synthesize/stream")
+async def handle_synthesis_stream_request(request: StreamSynthesisRequest, req: Request):
+    """
+    Returns a short-lived URL that streams the audio for the text.
+    The text travels in the body; the URL only carries its cache key, so it stays out of access logs.
+    """
+    key = register_stream(request.text)
+    return {"url": f"{req.base_url}synthesize/stream/{key}"}
+
+@app.get("/synthesize/stream/{key}")
+async def handle_synthesis_stream(key: str):
+    """
+    Streams the MP3 while ElevenLabs generates it, so playback can start on the first chunk.
+    (GET so audio players can use the URL directly.) The audio is cached like /synthesize.
+    """
+    chunks = stream_registered(key)
+    if chunks is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired audio stream")
+    try:
+        # Pull the first chunk before answering, so upstream failures still become a 500
+        first_chunk = await chunks.__anext__()
+    except Exception as e:
+        logger.error("ElevenLabs API error: %s", e)
+        await chunks.aclose()
+        raise HTTPException(status_code=500, detail="Failed to generate audio")
+
+    async def body():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(body(), media_type="audio/mpeg")
+    
 @app.get("/chat/{conversation_id}")
 async def get_conversation_messages(conversation_id: int):
     """Loads the actual messages for a specific thread."""
-    history = db.get_chat_history(conversation_id)
+    history = await db.get_chat_history(conversation_id)
     return {"messages": history}
 
 @app.patch("/conversations/{conversation_id}")
 async def update_title(conversation_id: int, update: TitleUpdate):
     """Renames a conversation."""
-    db.update_conversation_title(conversation_id, update.title)
+    await db.update_conversation_title(conversation_id, update.title)
     return {"status": "success"}
 
+def _encode_history_cursor(item: Dict) -> str:
+    return f"{item['date']}|{item['id']}"
+
+def _decode_history_cursor(cursor: str) -> tuple:
+    try:
+        created_at, conv_id = cursor.rsplit("|", 1)
+        return created_at, int(conv_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @app.get("/history/{user_id}")
-async def get_history(user_id: str):
+async def get_history(user_id: str, limit: int = Query(50, ge=1, le=200), cursor: Optional[str] = None):
     """
-    Returns the list of past conversations for the burger menu.
+    Returns one page of past conversations for the burger menu.
+    Pass the returned next_cursor to load the next (older) page.
     """
-    conversations = db.get_user_conversations(user_id)
-    return {"conversations": conversations}
+    before = _decode_history_cursor(cursor) if cursor else None
+    conversations = await db.get_user_conversations(user_id, limit=limit, before=before)
+    next_cursor = _encode_history_cursor(conversations[-1]) if len(conversations) == limit else None
+    return {"conversations": conversations, "next_cursor": next_cursor}
+
+@app.get("/metrics")
+async def get_metrics(format: str = Query("prometheus", pattern="^(prometheus|json)$")):
+    """
+    Counters, gauges and latency histograms per stage (HTTP routes, DB calls, LLM, ElevenLabs, ffmpeg, RSS,
+    event-loop lag) in the Prometheus text format; ?format=json for the raw snapshot.
+    """
+    if format == "json":
+        return metrics.snapshot()
+    return Response(metrics.render_prometheus(), media_type=metrics.PROMETHEUS_CONTENT_TYPE)
 
 @app.get("/media/news")
-async def get_news(background_tasks: BackgroundTasks):
+async def get_news():
     """
-    Returns DB content instantly. Triggers refresh for next time.
+    Returns cached articles instantly (refreshing happens on a schedule, see lifespan).
     """
     news = await get_cached_news()
-    
-    background_tasks.add_task(refresh_news_background)
-    
     return {"articles": news}
 
+# WORD GAME
+# Valid guesses only change when the index is regenerated
+WORD_VALIDATE_MAX_AGE = 86400
+
+def _cacheable_json(request: Request, payload: Dict, etag: str, max_age: int) -> Response:
+    headers = {"Cache-Control": f"public, max-age={max_age}", "ETag": f'"{etag}"'}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(payload, headers=headers)
+
+def _require_word_index():
+    index = words.get_word_index()
+    if index is None:
+        raise HTTPException(status_code=503, detail="Word index has not been generated")
+    return index
+
+@app.get("/words/validate")
+async def validate_word(request: Request, word: str = Query(..., min_length=1, max_length=32)):
+    """Is this a valid guess? (Replaces the word list that used to ship in the app bundle.)"""
+    index = _require_word_index()
+    word = word.strip().upper()
+    return _cacheable_json(request, {"word": word, "valid": index.is_valid(word)},
+                           etag=index.version, max_age=WORD_VALIDATE_MAX_AGE)
+
+@app.get("/words/daily")
+async def get_daily_word(request: Request, length: int = Query(5, ge=2, le=15)):
+    """Today's word: the same for every user, changes at local midnight."""
+    index = _require_word_index()
+    day = words.today()
+    word = index.daily_word(day, length)
+    if word is None:
+        raise HTTPException(status_code=404, detail=f"No {length}-letter words in the index")
+    return _cacheable_json(request, {"word": word, "date": day.isoformat(), "length": length},
+                           etag=f"{index.version}-{day.isoformat()}-{length}", max_age=words.seconds_until_next_day())
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Measures lexicon lookup throughput, the grammar fast path and resident memory.
+
+Usage (from rod_backend/):
+    python scripts/benchmark_lexicon.py [--lookups 200000] [--compare-set]
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+# Allow `src.services.*` imports when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.services.lexicon_service as lexicon_service
+from src.services.grammar_check_service import quick_check
+
+SAMPLE_MESSAGES = [
+    "Hei!", "Takk skal du ha.", "Jeg heter Ola Nordmann", "Hvordan har du det?", "Fotball.",
+    "Jeg liker å spise fisk og poteter", "What is your name?", "Jeg har 2 katter", "Ha det bra!",
+    "Jeg bor i Bergen.", "Kan du hjelpe meg med leksene mine i dag?", "hello how are you",
+]
+
+def rss_mb() -> float:
+    """Current resident set size (falls back to peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:,.0f}/s ({seconds / count * 1e6:.2f} µs each)"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200_000, help="Word lookups to time")
+    parser.add_argument("--compare-set", action="store_true", help="Also load every form into a Python set for comparison")
+    args = parser.parse_args()
+
+    before = rss_mb()
+    start = time.perf_counter()
+    lexicon = lexicon_service.get_lexicon()
+    if lexicon is None:
+        print("Generate word_bank/lexicon.bin with word_bank/process_words.py first.")
+        return
+    load_time = time.perf_counter() - start
+    print(f"Forms: {len(lexicon):,}  file: {os.path.getsize(lexicon.path) / 1e6:.1f} MB  "
+          f"load: {load_time * 1000:.2f} ms  RSS +{rss_mb() - before:.1f} MB")
+
+    rng = random.Random(0)
+    words = [lexicon._words[rng.randrange(len(lexicon))].decode("utf-8") for _ in range(5000)]
+    misses = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyzæøå") for _ in range(8)) for _ in range(5000)]
+    probes = [rng.choice(words) if rng.random() < 0.8 else rng.choice(misses) for _ in range(args.lookups)]
+
+    # Cold: bypass the LRU in front of the binary search
+    start = time.perf_counter()
+    for word in probes[:20_000]:
+        lexicon._search(word.encode("utf-8"))
+    print(f"Binary search (uncached): {rate(min(20_000, len(probes)), time.perf_counter() - start)}")
+
+    start = time.perf_counter()
+    for word in probes:
+        word in lexicon
+    print(f"Lookup (with LRU):        {rate(len(probes), time.perf_counter() - start)}  {lexicon.cache_info()}")
+
+    start = time.perf_counter()
+    rounds = max(1, args.lookups // (10 * len(SAMPLE_MESSAGES)))
+    skipped = 0
+    for _ in range(rounds):
+        for message in SAMPLE_MESSAGES:
+            skipped += quick_check(message) is not None
+    print(f"Grammar fast path:        {rate(rounds * len(SAMPLE_MESSAGES), time.perf_counter() - start)}  "
+          f"({skipped // rounds}/{len(SAMPLE_MESSAGES)} sample messages skip the LLM)")
+    print(f"RSS after lookups: {rss_mb():.1f} MB")
+
+    if args.compare_set:
+        before = rss_mb()
+        start = time.perf_counter()
+        as_set = {lexicon._words[i].decode("utf-8") for i in range(len(lexicon))}
+        print(f"Python set for comparison: build {time.perf_counter() - start:.2f} s, RSS +{rss_mb() - before:.1f} MB")
+        start = time.perf_counter()
+        for word in probes:
+            word in as_set
+        print(f"Set lookup:               {rate(len(probes), time.perf_counter() - start)}")
+
+if __name__ == "__main__":
+    main()
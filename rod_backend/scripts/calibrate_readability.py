@@ -0,0 +1,112 @@
+"""
+Compares the local readability scorer against LLM labels of cached articles.
+
+Stored labels only exist for articles the scorer escalated (borderline scores), so by default the
+comparison covers that biased subset. --sample N asks the LLM afresh about N random cached articles
+instead, which measures the scorer on the whole feed (costs N GPT-5-mini calls).
+
+Usage (from rod_backend/):
+    python scripts/calibrate_readability.py [--limit 1000]
+    python scripts/calibrate_readability.py --sample 200
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Allow `src.services.*` imports when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.services.db_service as db
+import src.services.llm_gateway as llm
+import src.services.media_service as media
+from src.services.lexicon_service import get_lexicon
+
+LEVEL_ORDER = ["A1", "A2", "B1", "B2", "C1", "C2"]
+
+async def label_sample(size: int):
+    """Fresh LLM labels for a random sample of cached articles (failed classifications are left out)."""
+    articles = db.get_random_media(size)
+    semaphore = asyncio.Semaphore(media.CLASSIFY_CONCURRENCY)
+
+    async def label(article):
+        async with semaphore:
+            level = await media.determine_difficulty(article["title"], article["summary"], default=None)
+        return dict(article, level=level)
+
+    try:
+        labelled = await asyncio.gather(*[label(article) for article in articles])
+    finally:
+        await llm.close()
+    return [row for row in labelled if row["level"]]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=1000, help="Max LLM-labelled articles to compare")
+    parser.add_argument("--sample", type=int, default=0,
+                        help="Label this many random cached articles with the LLM now instead of using stored labels")
+    args = parser.parse_args()
+
+    db.init_db()
+    if args.sample:
+        rows = asyncio.run(label_sample(args.sample))
+        if not rows:
+            print("No articles could be labelled (empty media_cache or LLM unavailable).")
+            return
+    else:
+        rows = db.get_llm_labelled_media(args.limit)
+        if not rows:
+            print("No LLM-labelled articles in media_cache yet.")
+            return
+        print("WARNING: stored LLM labels only cover articles the scorer escalated (borderline scores),")
+        print("         so these numbers are not the scorer's accuracy on the whole feed. Use --sample N for that.\n")
+
+    get_lexicon()  # Load outside the timed loop
+
+    exact = adjacent = escalated = agree_confident = confident = 0
+    confusion = Counter()
+    scores_by_label = {}
+    start = time.perf_counter()
+    for row in rows:
+        level, is_confident = media.local_difficulty(row["title"], row["summary"])
+        features = media.readability_features(f"{row['title']}. {row['summary']}")
+        scores_by_label.setdefault(row["level"], []).append(media.readability_score(features))
+
+        confusion[(row["level"], level)] += 1
+        exact += level == row["level"]
+        if row["level"] in LEVEL_ORDER and level in LEVEL_ORDER:
+            adjacent += abs(LEVEL_ORDER.index(level) - LEVEL_ORDER.index(row["level"])) <= 1
+        if is_confident:
+            confident += 1
+            agree_confident += level == row["level"]
+        else:
+            escalated += 1
+    elapsed = time.perf_counter() - start
+
+    n = len(rows)
+    print(f"Articles compared:        {n}")
+    print(f"Exact agreement:          {exact / n:.1%}")
+    print(f"Within one level:         {adjacent / n:.1%}")
+    print(f"Escalated to LLM:         {escalated / n:.1%}")
+    if confident:
+        print(f"Agreement when confident: {agree_confident / confident:.1%}")
+    # Each iteration classifies twice (decision + score report)
+    print(f"Local scoring time:       {elapsed / (2 * n) * 1e6:.1f} µs per article")
+
+    print("\nConfusion (rows = LLM, columns = local):")
+    labels = [l for l in LEVEL_ORDER if any(l in pair for pair in confusion)]
+    print("      " + "".join(f"{l:>6}" for l in labels))
+    for llm_level in labels:
+        print(f"{llm_level:>6}" + "".join(f"{confusion[(llm_level, l)]:>6}" for l in labels))
+
+    print("\nScore distribution per LLM label (min / median / max):")
+    for label in LEVEL_ORDER:
+        scores = sorted(scores_by_label.get(label, []))
+        if scores:
+            print(f"  {label}: {scores[0]:.1f} / {scores[len(scores) // 2]:.1f} / {scores[-1]:.1f}  (n={len(scores)})")
+    print(f"\nCurrent thresholds: {media.LEVEL_THRESHOLDS}, margin ±{media.BORDERLINE_MARGIN}")
+
+if __name__ == "__main__":
+    main()
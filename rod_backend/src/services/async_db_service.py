@@ -0,0 +1,168 @@
+# Async facade over db_service. Every call runs on a dedicated thread pool sized
+# to the connection pool, so SQLite I/O never blocks the event loop.
+import time
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict
+
+import src.services.db_service as db
+import src.services.metrics_service as metrics
+
+_executor = ThreadPoolExecutor(max_workers=db.POOL_SIZE, thread_name_prefix="rod-db")
+
+DB_OPERATION = metrics.histogram("db_operation_seconds", "Time a db_service function ran on a DB thread, by function.")
+EXECUTOR_WAIT = metrics.histogram("db_executor_wait_seconds", "Time a DB call waited for a free DB thread.")
+
+def _timed(func, submitted: float, *args, **kwargs):
+    started = time.perf_counter()
+    EXECUTOR_WAIT.observe(started - submitted)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        DB_OPERATION.observe(time.perf_counter() - started, op=func.__name__)
+
+async def _run(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(_timed, func, time.perf_counter(), *args, **kwargs))
+
+def shutdown():
+    """Stops the DB executor and closes pooled connections."""
+    _executor.shutdown(wait=True)
+    db.close_pool()
+
+
+async def init_db():
+    return await _run(db.init_db)
+
+
+# USER FUNCTIONS
+async def create_user_if_not_exists(user_id: str):
+    return await _run(db.create_user_if_not_exists, user_id)
+
+async def set_user_level(user_id: str, level: str):
+    return await _run(db.set_user_level, user_id, level)
+
+async def get_user_level(user_id: str) -> str:
+    return await _run(db.get_user_level, user_id)
+
+async def update_user_streak(user_id: str):
+    return await _run(db.update_user_streak, user_id)
+
+async def get_user_streak(user_id: str) -> int:
+    return await _run(db.get_user_streak, user_id)
+
+
+# CONVERSATION FUNCTIONS
+async def start_new_conversation(user_id: str, context_data: Optional[dict] = None) -> int:
+    return await _run(db.start_new_conversation, user_id, context_data)
+
+async def get_latest_conversation_id(user_id: str) -> Optional[int]:
+    return await _run(db.get_latest_conversation_id, user_id)
+
+async def get_conversation_context(conversation_id: int) -> Optional[dict]:
+    return await _run(db.get_conversation_context, conversation_id)
+
+async def update_conversation_title(conversation_id: int, new_title: str):
+    return await _run(db.update_conversation_title, conversation_id, new_title)
+
+async def get_user_conversations(user_id: str, limit: int = 50, before: Optional[tuple] = None) -> List[Dict]:
+    return await _run(db.get_user_conversations, user_id, limit, before)
+
+
+# MESSAGE & FEEDBACK FUNCTIONS
+async def add_message(conversation_id: int, role: str, content: str) -> int:
+    return await _run(db.add_message, conversation_id, role, content)
+
+async def discard_user_message(conversation_id: int, message_id: int):
+    return await _run(db.discard_user_message, conversation_id, message_id)
+
+async def record_chat_turn(user_id: str, content: str, conversation_id: Optional[int] = None,
+                           context_data: Optional[dict] = None, force_new: bool = False,
+                           token_budget: int = 3000, max_messages: int = 40, max_gap_messages: int = 8) -> Dict:
+    return await _run(db.record_chat_turn, user_id, content, conversation_id, context_data, force_new,
+                      token_budget, max_messages, max_gap_messages)
+
+async def get_recent_messages(conversation_id: int, token_budget: int, max_messages: int) -> List[Dict]:
+    return await _run(db.get_recent_messages, conversation_id, token_budget, max_messages)
+
+async def get_chat_history(conversation_id: int) -> List[Dict]:
+    return await _run(db.get_chat_history, conversation_id)
+
+# ROLLING SUMMARIES
+async def get_conversation_summary(conversation_id: int) -> Optional[Dict]:
+    return await _run(db.get_conversation_summary, conversation_id)
+
+async def get_messages_between(conversation_id: int, after_id: int, before_id: int, limit: int = 50) -> List[Dict]:
+    return await _run(db.get_messages_between, conversation_id, after_id, before_id, limit)
+
+async def save_conversation_summary(conversation_id: int, summary: str, summarized_through_id: int):
+    return await _run(db.save_conversation_summary, conversation_id, summary, summarized_through_id)
+
+async def add_feedback(message_id: int, user_text: str, correction: str, explanation: str):
+    return await _run(db.add_feedback, message_id, user_text, correction, explanation)
+
+async def get_feedback_for_conversation(conversation_id: int) -> List[Dict]:
+    return await _run(db.get_feedback_for_conversation, conversation_id)
+
+
+# GRAMMAR CHECK QUEUE
+async def enqueue_grammar_job(job: Dict) -> int:
+    return await _run(db.enqueue_grammar_job, job)
+
+async def record_assistant_reply(conversation_id: int, content: str, grammar_job: Optional[Dict] = None,
+                                 feedback: Optional[Dict] = None, model: Optional[str] = None,
+                                 latency_ms: Optional[int] = None, truncated: bool = False) -> int:
+    return await _run(db.record_assistant_reply, conversation_id, content, grammar_job, feedback, model, latency_ms,
+                      truncated)
+
+async def claim_grammar_jobs(limit: int) -> List[Dict]:
+    return await _run(db.claim_grammar_jobs, limit)
+
+async def complete_grammar_jobs(job_ids: List[int], feedback: List[Dict]):
+    return await _run(db.complete_grammar_jobs, job_ids, feedback)
+
+async def fail_grammar_jobs(job_ids: List[int], error: str, max_attempts: int, backoff: float = 30.0):
+    return await _run(db.fail_grammar_jobs, job_ids, error, max_attempts, backoff)
+
+async def release_grammar_jobs(job_ids: List[int]):
+    return await _run(db.release_grammar_jobs, job_ids)
+
+async def requeue_running_grammar_jobs() -> int:
+    return await _run(db.requeue_running_grammar_jobs)
+
+async def count_pending_grammar_jobs() -> int:
+    return await _run(db.count_pending_grammar_jobs)
+
+async def prune_failed_grammar_jobs(not_before: str) -> Dict:
+    return await _run(db.prune_failed_grammar_jobs, not_before)
+
+async def get_grammar_cache(key: str, not_before: str) -> Optional[Dict]:
+    return await _run(db.get_grammar_cache, key, not_before)
+
+async def save_grammar_cache(key: str, level: str, result: str):
+    return await _run(db.save_grammar_cache, key, level, result)
+
+async def prune_grammar_cache(not_before: str, max_entries: int) -> int:
+    return await _run(db.prune_grammar_cache, not_before, max_entries)
+
+
+# MEDIA HUB
+async def save_media_items(items: List[Dict]):
+    return await _run(db.save_media_items, items)
+
+async def get_cached_media(limit=20) -> List[Dict]:
+    return await _run(db.get_cached_media, limit)
+
+async def get_feed_validators(url: str) -> Optional[Dict]:
+    return await _run(db.get_feed_validators, url)
+
+async def save_feed_validators(url: str, etag: Optional[str], last_modified: Optional[str]):
+    return await _run(db.save_feed_validators, url, etag, last_modified)
+
+async def get_existing_media_links(links: List[str]) -> set:
+    return await _run(db.get_existing_media_links, links)
+
+
+def get_pool_stats() -> Dict:
+    return db.get_pool_stats()
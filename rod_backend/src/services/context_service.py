@@ -0,0 +1,92 @@
+import logging
+import os
+from typing import Dict, List, Optional
+
+import src.services.async_db_service as db
+from src.services.textgen_service import summarize_history
+
+logger = logging.getLogger(__name__)
+
+# CONFIGURATION
+# Rough prompt budget for past messages (~4 characters per token)
+HISTORY_TOKEN_BUDGET = int(os.getenv("ROD_HISTORY_TOKEN_BUDGET", "3000"))
+HISTORY_MAX_MESSAGES = int(os.getenv("ROD_HISTORY_MAX_MESSAGES", "40"))
+# Don't spend a summary call until this many messages have fallen out of the window
+SUMMARY_MIN_MESSAGES = int(os.getenv("ROD_SUMMARY_MIN_MESSAGES", "6"))
+SUMMARY_MAX_MESSAGES = 50
+# Messages that left the window but aren't summarized yet are sent as-is, within what the window left
+# of HISTORY_TOKEN_BUDGET. That gap stays below SUMMARY_MIN_MESSAGES, plus a turn or so while the
+# background summary catches up.
+GAP_MAX_MESSAGES = SUMMARY_MIN_MESSAGES + 2
+
+def build_article_note(context: Dict) -> Dict:
+    """A "System Note" that Rod sees, but isn't saved to the user's chat log."""
+    return {
+        "role": "system",
+        "content": f"""
+            VIKTIG KONTEKST:
+            Brukeren har nettopp lest artikkelen: "{context.get('title')}".
+            Sammendrag: "{context.get('summary')}".
+            
+            DINE INSTRUKSER FOR DENNE SAMTALEN:
+            1. **FOKUS:** Hele denne samtalen skal handle om denne artikkelen.
+            2. **SVAR PÅ SPØRSMÅL:** 
+            3. **LED SAMTALEN:** Etter at du har svart, still et spørsmål tilbake om hva brukeren mener om saken.
+            """
+    }
+
+def build_summary_note(summary: str) -> Dict:
+    return {
+        "role": "system",
+        "content": f"TIDLIGERE I SAMTALEN (oppsummert):\n{summary}"
+    }
+
+def build_prompt_history(turn: Dict) -> List[Dict]:
+    """
+    Messages sent to get_rod_response (the system prompt is added there):
+    article context + rolling summary + the not yet summarized gap + the recent window from record_chat_turn.
+    """
+    notes = []
+    if turn.get("context"):
+        notes.append(build_article_note(turn["context"]))
+    if turn.get("summary"):
+        notes.append(build_summary_note(turn["summary"]))
+    return notes + turn.get("gap", []) + turn["history"]
+
+def conversation_depth(turn: Dict) -> int:
+    """Rough number of messages so far: the recent window, plus at least a full window if older ones were summarized."""
+    depth = len(turn["history"]) + len(turn.get("gap", []))
+    if turn.get("summary"):
+        depth += HISTORY_MAX_MESSAGES
+    return depth
+
+async def load_chat_turn(user_id: str, content: str, conversation_id: Optional[int] = None,
+                         context_data: Optional[dict] = None, force_new: bool = False) -> Dict:
+    """record_chat_turn with the configured history window."""
+    return await db.record_chat_turn(
+        user_id,
+        content,
+        conversation_id=conversation_id,
+        context_data=context_data,
+        force_new=force_new,
+        token_budget=HISTORY_TOKEN_BUDGET,
+        max_messages=HISTORY_MAX_MESSAGES,
+        max_gap_messages=GAP_MAX_MESSAGES,
+    )
+
+async def update_rolling_summary(conversation_id: int, window_start_id: int):
+    """
+    Background Task: folds messages that slid out of the history window into the stored summary.
+    """
+    current = await db.get_conversation_summary(conversation_id)
+    summarized_through = current["summarized_through_id"] if current else 0
+
+    pending = await db.get_messages_between(conversation_id, summarized_through, window_start_id, SUMMARY_MAX_MESSAGES)
+    if len(pending) < SUMMARY_MIN_MESSAGES:
+        return
+
+    summary = await summarize_history(current["summary"] if current else None, pending)
+    if summary:
+        await db.save_conversation_summary(conversation_id, summary, pending[-1]["id"])
+        logger.info("Updated conversation summary",
+                    extra={"summary_conversation_id": conversation_id, "through_message_id": pending[-1]["id"]})
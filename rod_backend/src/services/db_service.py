@@ -1,335 +1,955 @@
+import logging
+import os
+import queue
 import sqlite3
 import json
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict
 
+import src.services.metrics_service as metrics
+
+logger = logging.getLogger(__name__)
+
 # Define the database file location
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DB_FILE = BASE_DIR / "rod.db"
 
+# POOL CONFIGURATION
+POOL_SIZE = int(os.getenv("ROD_DB_POOL_SIZE", "8"))
+POOL_TIMEOUT = float(os.getenv("ROD_DB_POOL_TIMEOUT", "10"))
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once per connection when it is opened
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",       # Readers never block the writer
+    "PRAGMA synchronous=NORMAL",     # Safe with WAL, fsync only at checkpoints
+    "PRAGMA cache_size=-16000",      # ~16 MB page cache per connection
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+POOL_WAIT = metrics.histogram("db_pool_wait_seconds", "Time spent waiting to check out a SQLite connection.")
+POOL_IN_USE = metrics.gauge("db_pool_connections_in_use", "SQLite connections currently checked out.")
+POOL_OPEN = metrics.gauge("db_pool_connections_open", "SQLite connections opened by the pool.")
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of long-lived SQLite connections.
+    A thread that already holds a connection gets the same one back (re-entrant),
+    so nested helpers share a connection instead of deadlocking the pool.
+    """
+
+    def __init__(self, db_file: Path, size: int = POOL_SIZE, timeout: float = POOL_TIMEOUT):
+        self.db_file = db_file
+        self.size = size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None -> autocommit; multi-statement work uses transaction()
+        conn = sqlite3.connect(
+            str(self.db_file),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                POOL_OPEN.set(self._opened)
+                open_new = True
+            else:
+                open_new = False
+        if open_new:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                    POOL_OPEN.set(self._opened)
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No database connection available after {self.timeout}s")
+
+    @contextmanager
+    def connection(self):
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            # Re-entrant use within the same thread
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        start = time.perf_counter()
+        conn = self._checkout()
+        POOL_WAIT.observe(time.perf_counter() - start)
+        POOL_IN_USE.inc()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            if conn.in_transaction:
+                conn.rollback()
+            POOL_IN_USE.dec()
+            self._idle.put(conn)
+
+    def close(self):
+        """Closes every idle connection (used on shutdown)."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+                POOL_OPEN.set(self._opened)
+
+
+_pool = ConnectionPool(DB_FILE)
+
 def get_connection():
-    """Establishes a connection to the SQLite database."""
-    conn = sqlite3.connect(str(DB_FILE))
-    conn.row_factory = sqlite3.Row 
-    return conn
+    """Checks out a pooled connection to the SQLite database. Use as a context manager."""
+    return _pool.connection()
+
+@contextmanager
+def transaction():
+    """Checks out a connection and runs the block in one IMMEDIATE transaction."""
+    with get_connection() as conn:
+        if conn.in_transaction:
+            # Already inside a transaction on this thread; let the outer block commit
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+def close_pool():
+    _pool.close()
+
+def get_pool_stats() -> Dict:
+    """Pool checkout wait times and connection counts."""
+    return {
+        "size": _pool.size,
+        "wait_seconds": POOL_WAIT.snapshot()["values"],
+        "in_use": POOL_IN_USE.snapshot()["values"],
+        "open": POOL_OPEN.snapshot()["values"],
+    }
 
 def init_db():
     """Initializes the database tables."""
-    print(f"Initializing Database at: {DB_FILE}")
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # 1. Users
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS users (
-        id TEXT PRIMARY KEY,
-        proficiency_level TEXT DEFAULT 'A1',
-        streak_days INTEGER DEFAULT 0,
-        last_active_date TEXT,
-        created_at TEXT
-    )
-    """)
+    logger.info("Initializing database at %s", DB_FILE)
+    with get_connection() as conn:
+        cursor = conn.cursor()
 
-    # 2. Conversations
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS conversations (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id TEXT,
-        context_lock TEXT, 
-        title TEXT,
-        created_at TEXT,
-        FOREIGN KEY(user_id) REFERENCES users(id)
-    )
-    """)
+        # 1. Users
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            proficiency_level TEXT DEFAULT 'A1',
+            streak_days INTEGER DEFAULT 0,
+            last_active_date TEXT,
+            created_at TEXT
+        )
+        """)
 
-    # 3. Messages
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS messages (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        conversation_id INTEGER,
-        role TEXT,
-        content TEXT,
-        created_at TEXT,
-        FOREIGN KEY(conversation_id) REFERENCES conversations(id)
-    )
-    """)
+        # 2. Conversations
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS conversations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT,
+            context_lock TEXT, 
+            title TEXT,
+            created_at TEXT,
+            FOREIGN KEY(user_id) REFERENCES users(id)
+        )
+        """)
 
-    # 4. Feedback
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS feedback (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        message_id INTEGER,
-        user_text TEXT,
-        correction TEXT,
-        explanation TEXT,
-        created_at TEXT,
-        FOREIGN KEY(message_id) REFERENCES messages(id)
-    )
-    """)
+        # 3. Messages
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            conversation_id INTEGER,
+            role TEXT,
+            content TEXT,
+            created_at TEXT,
+            FOREIGN KEY(conversation_id) REFERENCES conversations(id)
+        )
+        """)
+
+        # 4. Feedback
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS feedback (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            message_id INTEGER,
+            user_text TEXT,
+            correction TEXT,
+            explanation TEXT,
+            created_at TEXT,
+            FOREIGN KEY(message_id) REFERENCES messages(id)
+        )
+        """)
+
+        # 5. Media Cache
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS media_cache (
+            link TEXT PRIMARY KEY,
+            title TEXT,
+            summary TEXT,
+            image_url TEXT,
+            level TEXT,
+            source TEXT,
+            created_at TEXT
+        )
+        """)
+
+        _apply_migrations(conn)
 
-    # 5. Media Cache
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS media_cache (
-        link TEXT PRIMARY KEY,
-        title TEXT,
-        summary TEXT,
-        image_url TEXT,
-        level TEXT,
-        source TEXT,
-        created_at TEXT
+    scans = find_full_scans()
+    if scans:
+        logger.warning("Hot queries doing full table scans: %s", ", ".join(scans))
+    logger.info("Database initialized")
+
+
+# SCHEMA MIGRATIONS
+PREVIEW_LENGTH = 30
+
+# Append-only: never edit an applied migration, add a new one instead.
+# (version, description, statements)
+MIGRATIONS = [
+    (1, "indexes for hot access paths", [
+        # get_chat_history / record_chat_turn: WHERE conversation_id = ? ORDER BY id
+        "CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id, id)",
+        # get_latest_conversation_id / get_user_conversations: WHERE user_id = ? ORDER BY created_at
+        "CREATE INDEX IF NOT EXISTS idx_conversations_user_created ON conversations(user_id, created_at)",
+        # get_feedback_for_conversation: JOIN on message_id
+        "CREATE INDEX IF NOT EXISTS idx_feedback_message ON feedback(message_id)",
+        # get_cached_media: ORDER BY created_at DESC LIMIT ?
+        "CREATE INDEX IF NOT EXISTS idx_media_cache_created ON media_cache(created_at)",
+    ]),
+    (2, "stored conversation preview (burger menu title fallback)", [
+        "ALTER TABLE conversations ADD COLUMN preview TEXT",
+        f"""UPDATE conversations SET preview = (
+                SELECT CASE WHEN length(m.content) > {PREVIEW_LENGTH}
+                            THEN substr(m.content, 1, {PREVIEW_LENGTH}) || '...'
+                            ELSE m.content END
+                FROM messages m
+                WHERE m.conversation_id = conversations.id AND m.role = 'user' AND m.content != ''
+                ORDER BY m.id LIMIT 1
+            )
+            WHERE preview IS NULL""",
+    ]),
+    (3, "rolling conversation summaries", [
+        """CREATE TABLE IF NOT EXISTS conversation_summaries (
+            conversation_id INTEGER PRIMARY KEY,
+            summary TEXT,
+            summarized_through_id INTEGER,
+            updated_at TEXT,
+            FOREIGN KEY(conversation_id) REFERENCES conversations(id)
+        )""",
+    ]),
+    (4, "HTTP validators for conditional feed fetches", [
+        """CREATE TABLE IF NOT EXISTS feed_state (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            updated_at TEXT
+        )""",
+    ]),
+    (5, "record who classified each article (local scorer or llm)", [
+        "ALTER TABLE media_cache ADD COLUMN level_source TEXT",
+        "UPDATE media_cache SET level_source = 'llm' WHERE level_source IS NULL",
+    ]),
+    (6, "durable grammar-check job queue", [
+        """CREATE TABLE IF NOT EXISTS grammar_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            message_id INTEGER,
+            level TEXT,
+            user_text TEXT,
+            ai_response TEXT,
+            history TEXT,
+            status TEXT DEFAULT 'pending',
+            attempts INTEGER DEFAULT 0,
+            last_error TEXT,
+            created_at TEXT,
+            claimed_at TEXT,
+            FOREIGN KEY(message_id) REFERENCES messages(id)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_grammar_jobs_status ON grammar_jobs(status, level, id)",
+    ]),
+    (7, "grammar-check result cache", [
+        """CREATE TABLE IF NOT EXISTS grammar_cache (
+            key TEXT PRIMARY KEY,
+            level TEXT,
+            result TEXT,
+            created_at TEXT,
+            last_used_at TEXT
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_grammar_cache_last_used ON grammar_cache(last_used_at)",
+    ]),
+    (8, "model and latency per assistant message", [
+        # Which model answered (chat routing) and how long the reply took, for offline comparison
+        "ALTER TABLE messages ADD COLUMN model TEXT",
+        "ALTER TABLE messages ADD COLUMN latency_ms INTEGER",
+    ]),
+    (9, "grammar job retry backoff", [
+        # A failed job is not claimed again before this time (exponential backoff per attempt)
+        "ALTER TABLE grammar_jobs ADD COLUMN not_before TEXT",
+    ]),
+    (10, "truncated replies", [
+        # 1 = streamed reply cut off (upstream failure or client disconnect); content is what was generated
+        "ALTER TABLE messages ADD COLUMN truncated INTEGER NOT NULL DEFAULT 0",
+    ]),
+]
+
+def _apply_migrations(conn: sqlite3.Connection):
+    """Runs every migration newer than the stored schema_version, each in its own transaction."""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT,
+        applied_at TEXT
     )
     """)
-    
-    conn.commit()
-    conn.close()
-    print("Database Initialized")
+    current = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+
+    for version, description, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute("INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                         (version, description, datetime.now().isoformat()))
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        logger.info("Applied migration %s: %s", version, description)
+
+def get_schema_version() -> int:
+    with get_connection() as conn:
+        return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
 
 
 # USER FUNCTIONS
 def create_user_if_not_exists(user_id: str):
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("INSERT OR IGNORE INTO users (id, created_at) VALUES (?, ?)", 
-                       (user_id, datetime.now().isoformat()))
-        conn.commit()
-    except Exception as e:
-        print(f"Error creating user: {e}")
-    finally:
-        conn.close()
+    with get_connection() as conn:
+        try:
+            conn.execute("INSERT OR IGNORE INTO users (id, created_at) VALUES (?, ?)", 
+                         (user_id, datetime.now().isoformat()))
+        except Exception as e:
+            logger.error("Error creating user: %s", e)
 
 def set_user_level(user_id: str, level: str):
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("""
+    with get_connection() as conn:
+        conn.execute("""
             INSERT INTO users (id, proficiency_level, created_at) 
             VALUES (?, ?, ?)
             ON CONFLICT(id) DO UPDATE SET proficiency_level=excluded.proficiency_level
         """, (user_id, level, datetime.now().isoformat()))
-        conn.commit()
-    finally:
-        conn.close()
 
 def get_user_level(user_id: str) -> str:
-    conn = get_connection()
-    cursor = conn.cursor()
-    row = cursor.execute("SELECT proficiency_level FROM users WHERE id = ?", (user_id,)).fetchone()
-    conn.close()
+    with get_connection() as conn:
+        row = conn.execute("SELECT proficiency_level FROM users WHERE id = ?", (user_id,)).fetchone()
     if row and row['proficiency_level']:
         return row['proficiency_level']
     return 'A1'
 
-def update_user_streak(user_id: str):
-    """
-    Updates streak based on activity. 
-    Rules:
-    - Active today? Do nothing.
-    - Active yesterday? Streak + 1.
-    - Inactive for > 1 day? Reset to 1.
-    """
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Get current state
-    row = cursor.execute("SELECT streak_days, last_active_date FROM users WHERE id = ?", (user_id,)).fetchone()
-    
-    today_str = datetime.now().date().isoformat()
-    
-    if not row:
-        create_user_if_not_exists(user_id)
-        current_streak = 1
-    else:
-        last_date_str = row['last_active_date']
-        current_streak = row['streak_days'] or 0
-        
-        if last_date_str == today_str:
-            # Already active today, do nothing
-            conn.close()
-            return
-        
-        if last_date_str:
-            last_date = datetime.fromisoformat(last_date_str).date()
-            delta = (datetime.now().date() - last_date).days
-            
-            if delta == 1:
-                # Was active yesterday -> Increment
-                current_streak += 1
-            else:
-                # Missed a day (or more) -> Reset
-                current_streak = 1
-        else:
-            # First time active
-            current_streak = 1
+# Streak rules as one statement (no read-modify-write race):
+# - Active today? Keep streak.
+# - Active yesterday? Streak + 1.
+# - Inactive for > 1 day (or never active)? Reset to 1.
+STREAK_UPSERT = """
+    INSERT INTO users (id, streak_days, last_active_date, created_at)
+    VALUES (?, 1, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        streak_days = CASE
+            WHEN users.last_active_date = excluded.last_active_date THEN users.streak_days
+            WHEN users.last_active_date = date(excluded.last_active_date, '-1 day') THEN COALESCE(users.streak_days, 0) + 1
+            ELSE 1
+        END,
+        last_active_date = excluded.last_active_date
+"""
 
-    # Save updates
-    cursor.execute("UPDATE users SET streak_days = ?, last_active_date = ? WHERE id = ?", 
-                   (current_streak, today_str, user_id))
-    conn.commit()
-    conn.close()
+def update_user_streak(user_id: str):
+    """Updates streak based on activity (creates the user if needed)."""
+    now = datetime.now()
+    with get_connection() as conn:
+        conn.execute(STREAK_UPSERT, (user_id, now.date().isoformat(), now.isoformat()))
 
 def get_user_streak(user_id: str) -> int:
-    conn = get_connection()
-    cursor = conn.cursor()
-    row = cursor.execute("SELECT streak_days FROM users WHERE id = ?", (user_id,)).fetchone()
-    conn.close()
+    with get_connection() as conn:
+        row = conn.execute("SELECT streak_days FROM users WHERE id = ?", (user_id,)).fetchone()
     return row['streak_days'] if row else 0
 
 
 # CONVERSATION FUNCTIONS
-def start_new_conversation(user_id: str, context_data: Optional[dict] = None) -> int:
-    conn = get_connection()
-    cursor = conn.cursor()
-    
+def _insert_conversation(conn: sqlite3.Connection, user_id: str, context_data: Optional[dict] = None) -> int:
     context_str = json.dumps(context_data) if context_data else None
-    
-    cursor.execute("""
+    cursor = conn.execute("""
         INSERT INTO conversations (user_id, context_lock, created_at) 
         VALUES (?, ?, ?)
     """, (user_id, context_str, datetime.now().isoformat()))
-    
-    conversation_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    return conversation_id or 0
+    return cursor.lastrowid or 0
+
+def start_new_conversation(user_id: str, context_data: Optional[dict] = None) -> int:
+    with get_connection() as conn:
+        return _insert_conversation(conn, user_id, context_data)
+
+# Also used by record_chat_turn to continue the user's last thread
+LATEST_CONVERSATION_QUERY = """
+    SELECT id FROM conversations
+    WHERE user_id = ?
+    ORDER BY created_at DESC, id DESC LIMIT 1
+"""
 
 def get_latest_conversation_id(user_id: str) -> Optional[int]:
-    conn = get_connection()
-    cursor = conn.cursor()
-    row = cursor.execute("""
-        SELECT id FROM conversations
-        WHERE user_id = ?
-        ORDER BY id DESC LIMIT 1
-    """, (user_id,)).fetchone()
-    conn.close()
+    with get_connection() as conn:
+        row = conn.execute(LATEST_CONVERSATION_QUERY, (user_id,)).fetchone()
     return row['id'] if row else None
 
 def get_conversation_context(conversation_id: int) -> Optional[dict]:
-    conn = get_connection()
-    cursor = conn.cursor()
-    row = cursor.execute("SELECT context_lock FROM conversations WHERE id = ?", (conversation_id,)).fetchone()
-    conn.close()
+    with get_connection() as conn:
+        row = conn.execute("SELECT context_lock FROM conversations WHERE id = ?", (conversation_id,)).fetchone()
     if row and row['context_lock']:
         return json.loads(row['context_lock'])
     return None
 
 def update_conversation_title(conversation_id: int, new_title: str):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE conversations SET title = ? WHERE id = ?", (new_title, conversation_id))
-    conn.commit()
-    conn.close()
-
-def get_user_conversations(user_id: str) -> List[Dict]:
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    query = "SELECT id, title, created_at FROM conversations WHERE user_id = ? ORDER BY created_at DESC"
-    rows = cursor.execute(query, (user_id,)).fetchall()
-    
-    results = []
-    for row in rows:
-        display_title = row["title"]
-        
-        if not display_title:
-            # Fallback: Fetch first user message
-            msg_row = cursor.execute(
-                "SELECT content FROM messages WHERE conversation_id = ? AND role = 'user' LIMIT 1", 
-                (row["id"],)
-            ).fetchone()
-            
-            if msg_row and msg_row["content"]:
-                display_title = (msg_row["content"][:30] + '...') if len(msg_row["content"]) > 30 else msg_row["content"]
-            else:
-                display_title = "Ny Samtale"
+    with get_connection() as conn:
+        conn.execute("UPDATE conversations SET title = ? WHERE id = ?", (new_title, conversation_id))
 
-        results.append({
-            "id": row["id"],
-            "date": row["created_at"],
-            "title": display_title
-        })
+# First page of the history menu, and the following pages (keyset cursor)
+USER_CONVERSATIONS_QUERY = """
+    SELECT id, created_at, COALESCE(NULLIF(title, ''), preview, 'Ny Samtale') AS title
+    FROM conversations
+    WHERE user_id = ?
+    ORDER BY created_at DESC, id DESC LIMIT ?
+"""
+USER_CONVERSATIONS_PAGE_QUERY = """
+    SELECT id, created_at, COALESCE(NULLIF(title, ''), preview, 'Ny Samtale') AS title
+    FROM conversations
+    WHERE user_id = ? AND (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC LIMIT ?
+"""
+
+def get_user_conversations(user_id: str, limit: int = 50, before: Optional[tuple] = None) -> List[Dict]:
+    """
+    One page of conversations, newest first.
+    before: (created_at, id) of the last item of the previous page (keyset cursor).
+    """
+    with get_connection() as conn:
+        if before:
+            rows = conn.execute(USER_CONVERSATIONS_PAGE_QUERY, (user_id, *before, limit)).fetchall()
+        else:
+            rows = conn.execute(USER_CONVERSATIONS_QUERY, (user_id, limit)).fetchall()
 
-    conn.close()
-    return results
+    return [{"id": row["id"], "date": row["created_at"], "title": row["title"]} for row in rows]
 
 
 # MESSAGE & FEEDBACK FUNCTIONS
+def _make_preview(content: str) -> str:
+    return (content[:PREVIEW_LENGTH] + '...') if len(content) > PREVIEW_LENGTH else content
+
+def _insert_message(conn: sqlite3.Connection, conversation_id: int, role: str, content: str,
+                    model: Optional[str] = None, latency_ms: Optional[int] = None, truncated: bool = False) -> int:
+    cursor = conn.execute("""
+        INSERT INTO messages (conversation_id, role, content, created_at, model, latency_ms, truncated)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (conversation_id, role, content, datetime.now().isoformat(), model, latency_ms, int(truncated)))
+    if role == "user" and content:
+        # First user message becomes the menu title until the user renames it
+        conn.execute("UPDATE conversations SET preview = ? WHERE id = ? AND preview IS NULL",
+                     (_make_preview(content), conversation_id))
+    return cursor.lastrowid or 0
+
 def add_message(conversation_id: int, role: str, content: str) -> int:
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO messages (conversation_id, role, content, created_at)
-        VALUES (?, ?, ?, ?)
-    """, (conversation_id, role, content, datetime.now().isoformat()))
-    msg_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    return msg_id or 0
+    with transaction() as conn:
+        return _insert_message(conn, conversation_id, role, content)
+
+def discard_user_message(conversation_id: int, message_id: int):
+    """
+    Undoes the user message of a turn that was shed (503) after record_chat_turn,
+    so a retry doesn't duplicate it. A conversation left empty by this is removed too;
+    otherwise its preview is rebuilt from the messages that are left.
+    """
+    with transaction() as conn:
+        conn.execute("DELETE FROM messages WHERE id = ? AND conversation_id = ? AND role = 'user'",
+                     (message_id, conversation_id))
+        conn.execute("""
+            DELETE FROM conversations
+            WHERE id = ? AND NOT EXISTS (SELECT 1 FROM messages WHERE conversation_id = ?)
+        """, (conversation_id, conversation_id))
+        # Same rule as _insert_message (first user message), else the latest message left
+        row = conn.execute("""
+            SELECT content FROM messages
+            WHERE conversation_id = ?
+            ORDER BY role = 'user' DESC, CASE WHEN role = 'user' THEN id ELSE -id END
+            LIMIT 1
+        """, (conversation_id,)).fetchone()
+        conn.execute("UPDATE conversations SET preview = ? WHERE id = ?",
+                     (_make_preview(row["content"]) if row and row["content"] else None, conversation_id))
+
+# Newest messages that fit the token budget (~4 chars per token), oldest first.
+# The inner LIMIT bounds the work; the newest message is always included.
+RECENT_MESSAGES_QUERY = """
+    SELECT id, role, content FROM (
+        SELECT id, role, content,
+               SUM((length(content) + 3) / 4) OVER (ORDER BY id DESC) AS running_tokens,
+               ROW_NUMBER() OVER (ORDER BY id DESC) AS rn
+        FROM (
+            SELECT id, role, content FROM messages
+            WHERE conversation_id = ?
+            ORDER BY id DESC
+            LIMIT ?
+        )
+    )
+    WHERE running_tokens <= ? OR rn = 1
+    ORDER BY id ASC
+"""
+
+def _recent_messages(conn: sqlite3.Connection, conversation_id: int, token_budget: int, max_messages: int) -> List[sqlite3.Row]:
+    return conn.execute(RECENT_MESSAGES_QUERY, (conversation_id, max_messages, token_budget)).fetchall()
+
+# Newest messages older than the window that the rolling summary doesn't cover yet, oldest first,
+# within what is left of the token budget (same estimate as RECENT_MESSAGES_QUERY)
+GAP_MESSAGES_QUERY = """
+    SELECT role, content FROM (
+        SELECT id, role, content,
+               SUM((length(content) + 3) / 4) OVER (ORDER BY id DESC) AS running_tokens
+        FROM (
+            SELECT id, role, content FROM messages
+            WHERE conversation_id = ? AND id > ? AND id < ?
+            ORDER BY id DESC
+            LIMIT ?
+        )
+    )
+    WHERE running_tokens <= ?
+    ORDER BY id ASC
+"""
+
+def _estimate_tokens(content: str) -> int:
+    return (len(content) + 3) // 4
+
+def get_recent_messages(conversation_id: int, token_budget: int, max_messages: int) -> List[Dict]:
+    """The most recent messages that fit the token budget (includes message ids)."""
+    with get_connection() as conn:
+        rows = _recent_messages(conn, conversation_id, token_budget, max_messages)
+    return [dict(row) for row in rows]
+
+def record_chat_turn(user_id: str, content: str, conversation_id: Optional[int] = None,
+                     context_data: Optional[dict] = None, force_new: bool = False,
+                     token_budget: int = 3000, max_messages: int = 40, max_gap_messages: int = 8) -> Dict:
+    """
+    Everything /chat needs before calling the LLM, in ONE transaction:
+    1. Upserts the user and updates the streak.
+    2. Finds/Creates the conversation thread.
+    3. Saves the user message.
+    4. Reads back the recent history window, rolling summary, the unsummarized gap between them,
+       article context and level. Window and gap share token_budget.
+    """
+    now = datetime.now()
+    with transaction() as conn:
+        conn.execute(STREAK_UPSERT, (user_id, now.date().isoformat(), now.isoformat()))
+
+        if force_new or context_data:
+            conversation_id = _insert_conversation(conn, user_id, context_data)
+        elif not conversation_id:
+            row = conn.execute(LATEST_CONVERSATION_QUERY, (user_id,)).fetchone()
+            conversation_id = row['id'] if row else _insert_conversation(conn, user_id)
+
+        msg_id = _insert_message(conn, conversation_id, "user", content)
+
+        rows = _recent_messages(conn, conversation_id, token_budget, max_messages)
+        summary_row = conn.execute("""
+            SELECT summary, summarized_through_id FROM conversation_summaries
+            WHERE conversation_id = ?
+        """, (conversation_id,)).fetchone()
+        window_start_id = rows[0]["id"] if rows else msg_id
+        summarized_through = summary_row["summarized_through_id"] if summary_row else 0
+        gap_budget = token_budget - sum(_estimate_tokens(row["content"]) for row in rows)
+        gap = []
+        if gap_budget > 0 and max_gap_messages > 0:
+            gap = conn.execute(GAP_MESSAGES_QUERY, (conversation_id, summarized_through, window_start_id,
+                                                    max_gap_messages, gap_budget)).fetchall()
+        context_row = conn.execute("SELECT context_lock FROM conversations WHERE id = ?", (conversation_id,)).fetchone()
+        level_row = conn.execute("SELECT proficiency_level FROM users WHERE id = ?", (user_id,)).fetchone()
+
+    return {
+        "conversation_id": conversation_id,
+        "message_id": msg_id,
+        "history": [{"role": row["role"], "content": row["content"]} for row in rows],
+        "gap": [{"role": row["role"], "content": row["content"]} for row in gap],
+        "window_start_id": window_start_id,
+        "summary": summary_row["summary"] if summary_row else None,
+        "context": json.loads(context_row['context_lock']) if context_row and context_row['context_lock'] else None,
+        "level": level_row['proficiency_level'] if level_row and level_row['proficiency_level'] else 'A1',
+    }
+
+CHAT_HISTORY_QUERY = """
+    SELECT role, content FROM messages
+    WHERE conversation_id = ?
+    ORDER BY id ASC
+"""
 
 def get_chat_history(conversation_id: int) -> List[Dict]:
-    conn = get_connection()
-    cursor = conn.cursor()
-    rows = cursor.execute("""
-        SELECT role, content FROM messages 
-        WHERE conversation_id = ? 
-        ORDER BY id ASC
-    """, (conversation_id,)).fetchall()
-    conn.close()
+    with get_connection() as conn:
+        rows = conn.execute(CHAT_HISTORY_QUERY, (conversation_id,)).fetchall()
     return [{"role": row["role"], "content": row["content"]} for row in rows]
 
+# ROLLING SUMMARIES
+def get_conversation_summary(conversation_id: int) -> Optional[Dict]:
+    with get_connection() as conn:
+        row = conn.execute("""
+            SELECT summary, summarized_through_id FROM conversation_summaries
+            WHERE conversation_id = ?
+        """, (conversation_id,)).fetchone()
+    return dict(row) if row else None
+
+def get_messages_between(conversation_id: int, after_id: int, before_id: int, limit: int = 50) -> List[Dict]:
+    """Messages with after_id < id < before_id, oldest first (turns that fell out of the window)."""
+    with get_connection() as conn:
+        rows = conn.execute("""
+            SELECT id, role, content FROM messages
+            WHERE conversation_id = ? AND id > ? AND id < ?
+            ORDER BY id ASC
+            LIMIT ?
+        """, (conversation_id, after_id, before_id, limit)).fetchall()
+    return [dict(row) for row in rows]
+
+def save_conversation_summary(conversation_id: int, summary: str, summarized_through_id: int):
+    """Stores the summary unless a newer one (covering more messages) is already saved."""
+    with get_connection() as conn:
+        conn.execute("""
+            INSERT INTO conversation_summaries (conversation_id, summary, summarized_through_id, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(conversation_id) DO UPDATE SET
+                summary = excluded.summary,
+                summarized_through_id = excluded.summarized_through_id,
+                updated_at = excluded.updated_at
+            WHERE excluded.summarized_through_id > conversation_summaries.summarized_through_id
+        """, (conversation_id, summary, summarized_through_id, datetime.now().isoformat()))
+
 def add_feedback(message_id: int, user_text: str, correction: str, explanation: str):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO feedback (message_id, user_text, correction, explanation, created_at)
-        VALUES (?, ?, ?, ?, ?)
-    """, (message_id, user_text, correction, explanation, datetime.now().isoformat()))
-    conn.commit()
-    conn.close()
+    with get_connection() as conn:
+        conn.execute("""
+            INSERT INTO feedback (message_id, user_text, correction, explanation, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (message_id, user_text, correction, explanation, datetime.now().isoformat()))
+
+CONVERSATION_FEEDBACK_QUERY = """
+    SELECT f.user_text, f.correction, f.explanation, f.created_at
+    FROM feedback f
+    JOIN messages m ON f.message_id = m.id
+    WHERE m.conversation_id = ?
+    ORDER BY f.created_at DESC
+"""
 
 def get_feedback_for_conversation(conversation_id: int) -> List[Dict]:
-    conn = get_connection()
-    cursor = conn.cursor()
-    query = """
-        SELECT f.user_text, f.correction, f.explanation, f.created_at 
-        FROM feedback f
-        JOIN messages m ON f.message_id = m.id
-        WHERE m.conversation_id = ?
-        ORDER BY f.created_at DESC
-    """
-    rows = cursor.execute(query, (conversation_id,)).fetchall()
-    conn.close()
+    with get_connection() as conn:
+        rows = conn.execute(CONVERSATION_FEEDBACK_QUERY, (conversation_id,)).fetchall()
     return [dict(row) for row in rows]
 
 
+# GRAMMAR CHECK QUEUE
+def _insert_grammar_job(conn: sqlite3.Connection, job: Dict) -> int:
+    cursor = conn.execute("""
+        INSERT INTO grammar_jobs (message_id, level, user_text, ai_response, history, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (job["message_id"], job["level"], job["user_text"], job["ai_response"],
+          json.dumps(job["history"], ensure_ascii=False), datetime.now().isoformat()))
+    return cursor.lastrowid or 0
+
+def enqueue_grammar_job(job: Dict) -> int:
+    """job: message_id, level, user_text, ai_response, history (list of messages)."""
+    with get_connection() as conn:
+        return _insert_grammar_job(conn, job)
+
+def record_assistant_reply(conversation_id: int, content: str, grammar_job: Optional[Dict] = None,
+                           feedback: Optional[Dict] = None, model: Optional[str] = None,
+                           latency_ms: Optional[int] = None, truncated: bool = False) -> int:
+    """
+    Saves Rod's reply (with the model that wrote it and how long it took) plus either
+    the queued grammar check of the user message or its already known feedback (cache hit), in one transaction.
+    truncated: the reply is only the part streamed before the stream was cut off.
+    """
+    with transaction() as conn:
+        msg_id = _insert_message(conn, conversation_id, "assistant", content, model, latency_ms, truncated)
+        if grammar_job:
+            _insert_grammar_job(conn, grammar_job)
+        if feedback:
+            conn.execute("""
+                INSERT INTO feedback (message_id, user_text, correction, explanation, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (feedback["message_id"], feedback["user_text"], feedback["correction"],
+                  feedback["explanation"], datetime.now().isoformat()))
+    return msg_id
+
+# Claims a batch of due pending jobs of one level (the level of the oldest due job)
+CLAIM_GRAMMAR_JOBS_QUERY = """
+    UPDATE grammar_jobs
+    SET status = 'running', attempts = attempts + 1, claimed_at = ?
+    WHERE id IN (
+        SELECT id FROM grammar_jobs
+        WHERE status = 'pending' AND (not_before IS NULL OR not_before <= ?) AND level = (
+            SELECT level FROM grammar_jobs
+            WHERE status = 'pending' AND (not_before IS NULL OR not_before <= ?)
+            ORDER BY id LIMIT 1
+        )
+        ORDER BY id LIMIT ?
+    )
+    RETURNING id, message_id, level, user_text, ai_response, history, attempts, created_at
+"""
+
+def claim_grammar_jobs(limit: int) -> List[Dict]:
+    """
+    Marks up to `limit` pending jobs as running and returns them, oldest first.
+    All claimed jobs share the level of the oldest pending job (one prompt per batch).
+    Jobs still backing off after a failure (not_before in the future) are skipped.
+    """
+    now = datetime.now().isoformat()
+    with transaction() as conn:
+        rows = conn.execute(CLAIM_GRAMMAR_JOBS_QUERY, (now, now, now, limit)).fetchall()
+    jobs = [dict(row) for row in rows]
+    for job in jobs:
+        job["history"] = json.loads(job["history"]) if job["history"] else []
+    return sorted(jobs, key=lambda job: job["id"])
+
+def complete_grammar_jobs(job_ids: List[int], feedback: List[Dict]):
+    """Saves the feedback rows and removes the finished jobs, in one transaction."""
+    now = datetime.now().isoformat()
+    with transaction() as conn:
+        conn.executemany("""
+            INSERT INTO feedback (message_id, user_text, correction, explanation, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [(f["message_id"], f["user_text"], f["correction"], f["explanation"], now) for f in feedback])
+        conn.executemany("DELETE FROM grammar_jobs WHERE id = ?", [(job_id,) for job_id in job_ids])
+
+def fail_grammar_jobs(job_ids: List[int], error: str, max_attempts: int, backoff: float = 30.0):
+    """
+    Puts jobs back in the queue after `backoff` seconds, doubled per attempt so far,
+    or marks them failed after max_attempts.
+    """
+    if not job_ids:
+        return
+    now = datetime.now()
+    with transaction() as conn:
+        placeholders = ",".join("?" * len(job_ids))
+        attempts = conn.execute(f"SELECT id, attempts FROM grammar_jobs WHERE id IN ({placeholders})",
+                                job_ids).fetchall()
+        conn.executemany("""
+            UPDATE grammar_jobs
+            SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, last_error = ?, not_before = ?
+            WHERE id = ?
+        """, [(max_attempts, error,
+               (now + timedelta(seconds=backoff * 2 ** max(0, row["attempts"] - 1))).isoformat(), row["id"])
+              for row in attempts])
+
+def release_grammar_jobs(job_ids: List[int]):
+    """Puts claimed jobs back without counting the attempt (e.g. the LLM call was shed)."""
+    with transaction() as conn:
+        conn.executemany("""
+            UPDATE grammar_jobs SET status = 'pending', attempts = MAX(0, attempts - 1)
+            WHERE id = ? AND status = 'running'
+        """, [(job_id,) for job_id in job_ids])
+
+def requeue_running_grammar_jobs() -> int:
+    """Jobs left 'running' by a previous process (crash/restart) go back to pending."""
+    with get_connection() as conn:
+        return conn.execute("UPDATE grammar_jobs SET status = 'pending' WHERE status = 'running'").rowcount
+
+def count_pending_grammar_jobs() -> int:
+    with get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM grammar_jobs WHERE status = 'pending'").fetchone()[0]
+
+def prune_failed_grammar_jobs(not_before: str) -> Dict:
+    """Deletes jobs that failed (last claimed) before `not_before`; returns {"removed", "remaining"} failed jobs."""
+    with transaction() as conn:
+        removed = conn.execute("DELETE FROM grammar_jobs WHERE status = 'failed' AND claimed_at < ?",
+                               (not_before,)).rowcount
+        remaining = conn.execute("SELECT COUNT(*) FROM grammar_jobs WHERE status = 'failed'").fetchone()[0]
+    return {"removed": removed, "remaining": remaining}
+
+# GRAMMAR RESULT CACHE
+def get_grammar_cache(key: str, not_before: str) -> Optional[Dict]:
+    """Cached result JSON + created_at for this key, unless it was created before `not_before` (expired)."""
+    with get_connection() as conn:
+        row = conn.execute("""
+            UPDATE grammar_cache SET last_used_at = ?
+            WHERE key = ? AND created_at >= ?
+            RETURNING result, created_at
+        """, (datetime.now().isoformat(), key, not_before)).fetchone()
+    return dict(row) if row else None
+
+def save_grammar_cache(key: str, level: str, result: str):
+    now = datetime.now().isoformat()
+    with get_connection() as conn:
+        conn.execute("""
+            INSERT INTO grammar_cache (key, level, result, created_at, last_used_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                result = excluded.result,
+                created_at = excluded.created_at,
+                last_used_at = excluded.last_used_at
+        """, (key, level, result, now, now))
+
+def prune_grammar_cache(not_before: str, max_entries: int) -> int:
+    """Drops expired entries, then the least recently used ones beyond max_entries."""
+    with transaction() as conn:
+        removed = conn.execute("DELETE FROM grammar_cache WHERE created_at < ?", (not_before,)).rowcount
+        removed += conn.execute("""
+            DELETE FROM grammar_cache WHERE key IN (
+                SELECT key FROM grammar_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (max_entries,)).rowcount
+    return removed
+
+
 # MEDIA HUB
-def save_media_item(item: Dict):
-    """Saves a single media item if it doesn't exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("""
-            INSERT OR IGNORE INTO media_cache (link, title, summary, image_url, level, source, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (item['link'], item['title'], item['summary'], item['image_url'], item['level'], item['source'], datetime.now().isoformat()))
-        conn.commit()
-    finally:
-        conn.close()
+def save_media_items(items: List[Dict]):
+    """Saves new media items in one transaction (existing links are ignored)."""
+    if not items:
+        return
+    now = datetime.now().isoformat()
+    with transaction() as conn:
+        conn.executemany("""
+            INSERT OR IGNORE INTO media_cache (link, title, summary, image_url, level, level_source, source, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(item['link'], item['title'], item['summary'], item['image_url'], item['level'],
+               item.get('level_source'), item['source'], now)
+              for item in items])
+
+CACHED_MEDIA_QUERY = "SELECT * FROM media_cache ORDER BY created_at DESC LIMIT ?"
 
 def get_cached_media(limit=20) -> List[Dict]:
     """Returns stored articles sorted by newest."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    # Get most recent
-    rows = cursor.execute("SELECT * FROM media_cache ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
-    conn.close()
+    with get_connection() as conn:
+        # Get most recent
+        rows = conn.execute(CACHED_MEDIA_QUERY, (limit,)).fetchall()
+    return [dict(row) for row in rows]
+
+def get_llm_labelled_media(limit: int = 1000) -> List[Dict]:
+    """Articles whose level came from the LLM (ground truth for calibrating the local scorer)."""
+    with get_connection() as conn:
+        rows = conn.execute("""
+            SELECT title, summary, level FROM media_cache
+            WHERE level_source = 'llm'
+            ORDER BY created_at DESC LIMIT ?
+        """, (limit,)).fetchall()
     return [dict(row) for row in rows]
 
-def media_exists(link: str) -> bool:
-    """Checks if we already have this article (to save AI costs)."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    row = cursor.execute("SELECT 1 FROM media_cache WHERE link = ?", (link,)).fetchone()
-    conn.close()
-    return row is not None
\ No newline at end of file
+def get_random_media(limit: int = 200) -> List[Dict]:
+    """A random sample of stored articles, whatever labelled them (unbiased calibration set)."""
+    with get_connection() as conn:
+        rows = conn.execute("SELECT title, summary FROM media_cache ORDER BY RANDOM() LIMIT ?", (limit,)).fetchall()
+    return [dict(row) for row in rows]
+
+def get_feed_validators(url: str) -> Optional[Dict]:
+    """ETag / Last-Modified from the last successful fetch of this feed."""
+    with get_connection() as conn:
+        row = conn.execute("SELECT etag, last_modified FROM feed_state WHERE url = ?", (url,)).fetchone()
+    return dict(row) if row else None
+
+def save_feed_validators(url: str, etag: Optional[str], last_modified: Optional[str]):
+    with get_connection() as conn:
+        conn.execute("""
+            INSERT INTO feed_state (url, etag, last_modified, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                updated_at = excluded.updated_at
+        """, (url, etag, last_modified, datetime.now().isoformat()))
+
+def get_existing_media_links(links: List[str]) -> set:
+    """Which of these articles we already have (one query, to save AI costs)."""
+    if not links:
+        return set()
+    placeholders = ",".join("?" * len(links))
+    with get_connection() as conn:
+        rows = conn.execute(f"SELECT link FROM media_cache WHERE link IN ({placeholders})", links).fetchall()
+    return {row["link"] for row in rows}
+
+
+# QUERY PLAN CHECK
+# Hot queries and sample parameters. The functions above run these same constants.
+HOT_QUERIES = {
+    "get_chat_history": (CHAT_HISTORY_QUERY, (1,)),
+    "get_recent_messages": (RECENT_MESSAGES_QUERY, (1, 40, 3000)),
+    "record_chat_turn_gap": (GAP_MESSAGES_QUERY, (1, 0, 100, 8, 1000)),
+    "claim_grammar_jobs": (CLAIM_GRAMMAR_JOBS_QUERY, ("now", "now", "now", 8)),
+    # get_latest_conversation_id and record_chat_turn
+    "get_latest_conversation_id": (LATEST_CONVERSATION_QUERY, ("u",)),
+    "get_user_conversations": (USER_CONVERSATIONS_QUERY, ("u", 50)),
+    "get_user_conversations_page": (USER_CONVERSATIONS_PAGE_QUERY, ("u", "9999", 0, 50)),
+    "get_feedback_for_conversation": (CONVERSATION_FEEDBACK_QUERY, (1,)),
+    "get_cached_media": (CACHED_MEDIA_QUERY, (20,)),
+}
+
+def explain_hot_queries() -> Dict[str, List[str]]:
+    """Returns the EXPLAIN QUERY PLAN details for every hot query."""
+    plans = {}
+    with get_connection() as conn:
+        for name, (sql, params) in HOT_QUERIES.items():
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+            plans[name] = [row["detail"] for row in rows]
+    return plans
+
+def find_full_scans() -> List[str]:
+    """
+    Names of hot queries whose plan contains a full table SCAN.
+    An ordered index walk ("SCAN ... USING INDEX" under a LIMIT) and scans of
+    already-bounded subqueries are allowed.
+    """
+    return [
+        name for name, details in explain_hot_queries().items()
+        if any(detail.startswith("SCAN") and "INDEX" not in detail and "subquery" not in detail
+               for detail in details)
+    ]
+
+
+if __name__ == "__main__":
+    # python -m src.services.db_service -> migrate and print the hot query plans
+    init_db()
+    print(f"Schema version: {get_schema_version()}")
+    for name, details in explain_hot_queries().items():
+        print(f"{name}:")
+        for detail in details:
+            print(f"  {detail}")
+    scans = find_full_scans()
+    print(f"Full scans: {', '.join(scans) if scans else 'none'}")
@@ -1,13 +1,186 @@
+import logging
 import os
+import re
 import json
-from dotenv import load_dotenv
-from openai import AsyncOpenAI
+import hashlib
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional
 
-# Load environment variables
-load_dotenv()
+import src.services.async_db_service as db
+import src.services.llm_gateway as llm
+import src.services.metrics_service as metrics
+from src.services.lexicon_service import WORD_RE, get_lexicon, tokenize, is_english
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the feedback prompts change, so old cached corrections are not reused
+PROMPT_VERSION = "1"
+
+# RESULT CACHE
+# Short utterances ("Hei", "Jeg heter ...") repeat constantly and their correction barely depends
+# on the context, so results are cached per (normalized text, level, prompt version).
+# Memory LRU in front, SQLite (grammar_cache) behind it, so hits survive restarts.
+GRAMMAR_CACHE_MAX_CHARS = int(os.getenv("ROD_GRAMMAR_CACHE_MAX_CHARS", "80"))
+GRAMMAR_CACHE_TTL = timedelta(days=float(os.getenv("ROD_GRAMMAR_CACHE_TTL_DAYS", "30")))
+GRAMMAR_CACHE_MEMORY_ENTRIES = int(os.getenv("ROD_GRAMMAR_CACHE_MEMORY_ENTRIES", "2000"))
+GRAMMAR_CACHE_MAX_ENTRIES = int(os.getenv("ROD_GRAMMAR_CACHE_MAX_ENTRIES", "50000"))
+# Prune the table every N stored results
+GRAMMAR_CACHE_PRUNE_EVERY = 500
+
+CACHE_REQUESTS = metrics.counter("grammar_cache_requests_total", "Grammar-check cache lookups by result (hit, miss).")
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """Same utterance, same key: unicode NFC, trimmed, single spaces. Case and punctuation are kept (they can be the error)."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+def is_cacheable(text: str) -> bool:
+    normalized = normalize_text(text)
+    return 0 < len(normalized) <= GRAMMAR_CACHE_MAX_CHARS
+
+def result_cache_key(text: str, level: str) -> str:
+    payload = json.dumps([normalize_text(text), level, PROMPT_VERSION], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GrammarCache:
+    """LRU of grammar results in memory, with a TTL, backed by the grammar_cache table."""
+
+    def __init__(self, memory_entries: int, max_entries: int, ttl: timedelta):
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (result, created_at)
+        self._stores = 0
+
+    def _remember(self, key: str, result: Dict, created_at: datetime):
+        self._entries[key] = (result, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.memory_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, text: str, level: str) -> Optional[Dict]:
+        if not is_cacheable(text):
+            return None
+        key = result_cache_key(text, level)
+        now = datetime.now()
+
+        entry = self._entries.get(key)
+        if entry and now - entry[1] < self.ttl:
+            self._entries.move_to_end(key)
+            CACHE_REQUESTS.inc(result="hit")
+            return entry[0]
+        self._entries.pop(key, None)
+
+        stored = await db.get_grammar_cache(key, (now - self.ttl).isoformat())
+        if stored:
+            result = json.loads(stored["result"])
+            # The TTL counts from when the row was written; reading it doesn't extend it
+            self._remember(key, result, datetime.fromisoformat(stored["created_at"]))
+            CACHE_REQUESTS.inc(result="hit")
+            return result
+
+        CACHE_REQUESTS.inc(result="miss")
+        return None
+
+    async def put(self, text: str, level: str, result: Dict):
+        if not is_cacheable(text) or not isinstance(result, dict) or "has_error" not in result:
+            return
+        result = {k: result.get(k) for k in ("has_error", "correction", "explanation")}
+        key = result_cache_key(text, level)
+        self._remember(key, result, datetime.now())
+        await db.save_grammar_cache(key, level, json.dumps(result, ensure_ascii=False))
+
+        self._stores += 1
+        if self._stores % GRAMMAR_CACHE_PRUNE_EVERY == 0:
+            await db.prune_grammar_cache((datetime.now() - self.ttl).isoformat(), self.max_entries)
+
+
+result_cache = GrammarCache(GRAMMAR_CACHE_MEMORY_ENTRIES, GRAMMAR_CACHE_MAX_ENTRIES, GRAMMAR_CACHE_TTL)
+
+async def get_cached_result(text: str, level: str) -> Optional[Dict]:
+    """Known grammar result for this utterance at this level, or None (never calls the model)."""
+    try:
+        return await result_cache.get(text, level)
+    except Exception as e:
+        logger.warning("Grammar cache error: %s", e)
+        return None
+
+async def cache_result(text: str, level: str, result: Dict):
+    try:
+        await result_cache.put(text, level, result)
+    except Exception as e:
+        logger.warning("Grammar cache error: %s", e)
+
+
+# LOCAL FAST PATH
+# Short messages made of known forms that match a safe pattern are accepted without the model.
+FAST_PATH_MAX_WORDS = 6
+SAFE_PHRASES = frozenset("""
+hei|hallo|heisann|hei hei|god morgen|god dag|god kveld|god natt|ha det|ha det bra|ha en fin dag
+takk|tusen takk|takk skal du ha|takk for sist|takk for praten|takk i like måte|vel bekomme
+ja|nei|ja takk|nei takk|ok|okei|greit|det er greit|bra|veldig bra|bare bra|fint|kjempebra
+jeg har det bra|jeg har det fint|det går bra|hvordan har du det|hvordan går det|hva med deg|og du
+unnskyld|beklager|jeg forstår|jeg forstår ikke|jeg vet ikke|kanskje|selvfølgelig|gjerne
+""".replace("\n", "|").split("|")) - {""}
+# Introductions where the slot is a capitalized name (names are rarely in the lexicon)
+NAME_PATTERN = re.compile(
+    r"(?i:jeg heter|mitt navn er|jeg kommer fra|jeg bor i|jeg bor på)\s+[A-ZÆØÅ][a-zæøå]+(?:\s+[A-ZÆØÅ][a-zæøå]+)?"
+)
+ALLOWED_PUNCTUATION = " ,.!?"
+SENTENCE_SPLIT = re.compile(r"[,.!?]+")
+OK_RESULT = {"has_error": False, "correction": "", "explanation": ""}
+
+FAST_PATH = metrics.counter("grammar_fast_path_total", "Local grammar fast-path decisions (skipped = no LLM call needed).")
+
+def quick_check(text: str) -> Optional[Dict]:
+    """
+    OK result for trivially correct messages, None when the model has to look at it.
+    English input is never accepted here (it needs a translation).
+    """
+    normalized = normalize_text(text)
+    words = tokenize(normalized)
+    if not words or len(words) > FAST_PATH_MAX_WORDS:
+        FAST_PATH.inc(result="too_long" if words else "no_words")
+        return None
+    # Digits, emoji, quotes, ...: let the model judge
+    if WORD_RE.sub("", normalized).strip(ALLOWED_PUNCTUATION):
+        FAST_PATH.inc(result="no_pattern")
+        return None
+    if is_english(normalized):
+        FAST_PATH.inc(result="english")
+        return None
+
+    # "Hei, hvordan går det?" = two safe phrases
+    phrases = [" ".join(tokenize(part)).lower() for part in SENTENCE_SPLIT.split(normalized)]
+    if all(phrase in SAFE_PHRASES for phrase in phrases if phrase):
+        FAST_PATH.inc(result="skipped")
+        return dict(OK_RESULT)
+
+    if NAME_PATTERN.fullmatch(normalized.rstrip(ALLOWED_PUNCTUATION)):
+        FAST_PATH.inc(result="skipped")
+        return dict(OK_RESULT)
+
+    # Only the word lookups need the lexicon; the patterns above work without it
+    lexicon = get_lexicon()
+    if lexicon is None:
+        FAST_PATH.inc(result="no_lexicon")
+        return None
+    if len(words) == 1 and words[0] in lexicon:
+        # One-word answer ("Fotball.", "Norge") in a known form
+        FAST_PATH.inc(result="skipped")
+        return dict(OK_RESULT)
+
+    FAST_PATH.inc(result="unknown_word" if any(w not in lexicon for w in words) else "no_pattern")
+    return None
+
+async def get_known_result(text: str, level: str) -> Optional[Dict]:
+    """Result without calling the model: local fast path first, then the result cache."""
+    return quick_check(text) or await get_cached_result(text, level)
 
-API_KEY = os.getenv("OPENAI_API_KEY")
-client = AsyncOpenAI(api_key=API_KEY)
 
 def get_feedback_prompt(level: str) -> str:
     """Returns a tailored feedback persona based on proficiency."""
@@ -67,13 +240,18 @@ Format:
 """
     
 
-async def analyze_grammar(history: list, current_user_text: str, current_ai_response: str, level: str = 'A1'):
-    """
-    Analyzes text using a level-specific prompt.
-    """
-    
-    system_prompt = get_feedback_prompt(level)
-    
+BATCH_INSTRUCTIONS = """
+FLERE MELDINGER (BATCH):
+Du får flere uavhengige oppgaver, hver med en "ID". Vurder hver oppgave for seg, etter reglene over.
+Returner gyldig JSON med ett resultat per ID, i samme format som over:
+{
+  "results": [
+    {"id": 1, "has_error": boolean, "correction": "...", "explanation": "..."}
+  ]
+}
+"""
+
+def _format_task(history: list, current_user_text: str, current_ai_response: str) -> str:
     context_str = "SAMTALEHISTORIKK\n"
     recent_msgs = history[-4:] 
     if not recent_msgs: context_str += "(Starten på samtalen)"
@@ -81,21 +259,54 @@ async def analyze_grammar(history: list, current_user_text: str, current_ai_resp
         role_name = "Student" if msg['role'] == 'user' else "Rod"
         context_str += f"{role_name}: {msg['content']}\n"
 
-    full_prompt = f"{context_str}\nANALYSE\nStudent: '{current_user_text}'\nRod Svarte: '{current_ai_response}'"
+    return f"{context_str}\nANALYSE\nStudent: '{current_user_text}'\nRod Svarte: '{current_ai_response}'"
+
+async def analyze_grammar_batch(items: list, level: str = 'A1'):
+    """
+    Analyzes several messages of the same level in ONE request.
+    items: dicts with id, history, user_text, ai_response.
+    Returns {id: result} (missing ids had no usable answer), or None if the call failed.
+    Raises LLMOverloaded when the call is shed (the jobs should simply wait).
+    Trivially correct or cached utterances are answered without the model.
+    """
+    results = {}
+    pending = []
+    for item in items:
+        cached = await get_known_result(item['user_text'], level)
+        if cached is not None:
+            results[item['id']] = cached
+        else:
+            pending.append(item)
+    if not pending:
+        return results
+
+    system_prompt = get_feedback_prompt(level) + BATCH_INSTRUCTIONS
+    tasks = "\n\n".join(
+        f"### ID {item['id']}\n{_format_task(item['history'], item['user_text'], item['ai_response'])}"
+        for item in pending
+    )
 
     try:
-        response = await client.chat.completions.create(
-            model="gpt-5-nano",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": full_prompt}
-            ],
-            response_format={"type": "json_object"},
-        )
+        response = await llm.chat("gpt-5-nano", [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": tasks}
+        ], response_format={"type": "json_object"}, priority=llm.BACKGROUND)
         
         content = response.choices[0].message.content
-        return json.loads(content) if content else None
-
+        parsed = json.loads(content) if content else {}
+    except llm.LLMOverloaded:
+        raise
     except Exception as e:
-        print(f"Grammar Check Error: {e}")
-        return None
\ No newline at end of file
+        logger.error("Grammar batch error: %s", e, extra={"batch_size": len(items)})
+        return None
+
+    by_id = {item['id']: item for item in pending}
+    for result in parsed.get("results", []):
+        try:
+            item_id = int(result["id"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if item_id in by_id:
+            results[item_id] = result
+            await cache_result(by_id[item_id]['user_text'], level, result)
+    return results
@@ -0,0 +1,184 @@
+import logging
+import os
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import src.services.async_db_service as db
+import src.services.metrics_service as metrics
+from src.services.llm_gateway import LLMOverloaded
+from src.services.grammar_check_service import analyze_grammar_batch, get_known_result
+from src.services.log_service import SAMPLED
+
+logger = logging.getLogger(__name__)
+
+# Grammar checks are persisted in the grammar_jobs table and drained by a few workers,
+# so a restart (or a burst of messages) never loses a check.
+GRAMMAR_WORKERS = int(os.getenv("ROD_GRAMMAR_WORKERS", "2"))
+GRAMMAR_BATCH_SIZE = int(os.getenv("ROD_GRAMMAR_BATCH_SIZE", "8"))
+# How long a worker waits for more jobs to fill a batch after waking up
+GRAMMAR_BATCH_LINGER = float(os.getenv("ROD_GRAMMAR_BATCH_LINGER", "0.5"))
+# Fallback poll (jobs enqueued by another process, or retries after a failure)
+GRAMMAR_POLL_INTERVAL = float(os.getenv("ROD_GRAMMAR_POLL_INTERVAL", "5"))
+MAX_ATTEMPTS = 3
+# First retry delay after a failed batch, doubled per attempt (an upstream outage doesn't burn every attempt at once)
+RETRY_BACKOFF = float(os.getenv("ROD_GRAMMAR_RETRY_BACKOFF", "30"))
+# Jobs that failed for good are kept this long for inspection, then deleted
+FAILED_RETENTION = timedelta(days=float(os.getenv("ROD_GRAMMAR_FAILED_RETENTION_DAYS", "7")))
+PRUNE_INTERVAL = 3600
+
+QUEUE_DEPTH = metrics.gauge("grammar_queue_depth", "Grammar checks waiting in the queue.")
+BATCH_SIZE = metrics.histogram("grammar_batch_size", "Jobs sent to the LLM in one grammar request.",
+                               buckets=(1, 2, 4, 8, 16))
+QUEUE_LAG = metrics.histogram("grammar_queue_lag_seconds", "Time from enqueue until the grammar check finished.")
+JOBS_FAILED = metrics.counter("grammar_jobs_failed_total", "Grammar batches that failed (jobs were retried or dropped).")
+JOBS_DEAD = metrics.gauge("grammar_jobs_dead", "Grammar jobs that used up their attempts and were given up on.")
+JOBS_INCOMPLETE = metrics.counter("grammar_jobs_incomplete_total", "Jobs missing from the model's batch answer (retried).")
+
+_wakeup: Optional[asyncio.Event] = None
+
+
+def _get_wakeup() -> asyncio.Event:
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+def notify():
+    """Wakes an idle worker (call after enqueueing)."""
+    _get_wakeup().set()
+
+def build_job(turn: Dict, user_text: str, ai_response: str) -> Dict:
+    """Queue entry for checking the user message of a chat turn."""
+    return {
+        "message_id": turn["message_id"],
+        "level": turn["level"],
+        "user_text": user_text,
+        "ai_response": ai_response,
+        # The prompt only uses the last few messages before this one
+        "history": turn["history"][:-1][-4:],
+    }
+
+async def save_reply(conversation_id: int, response_text: str, turn: Dict, user_text: str,
+                     model: Optional[str] = None, latency_ms: Optional[int] = None, truncated: bool = False) -> int:
+    """
+    Saves Rod's reply together with the grammar check of the user message.
+    Trivially correct or cached utterances get their feedback written right away; everything else is queued.
+    """
+    known = await get_known_result(user_text, turn["level"])
+    if known is not None:
+        feedback = None
+        if known.get("has_error"):
+            feedback = {
+                "message_id": turn["message_id"],
+                "user_text": user_text,
+                "correction": known.get("correction", ""),
+                "explanation": known.get("explanation", ""),
+            }
+        return await db.record_assistant_reply(conversation_id, response_text, feedback=feedback,
+                                               model=model, latency_ms=latency_ms, truncated=truncated)
+
+    msg_id = await db.record_assistant_reply(conversation_id, response_text, build_job(turn, user_text, response_text),
+                                             model=model, latency_ms=latency_ms, truncated=truncated)
+    notify()
+    return msg_id
+
+def _observe_lag(jobs: List[Dict]):
+    now = datetime.now()
+    for job in jobs:
+        try:
+            QUEUE_LAG.observe((now - datetime.fromisoformat(job["created_at"])).total_seconds())
+        except (TypeError, ValueError):
+            pass
+
+async def process_batch(jobs: List[Dict]):
+    """Runs one LLM call for the claimed jobs and stores the resulting feedback."""
+    level = jobs[0]["level"] or "A1"
+    job_ids = [job["id"] for job in jobs]
+    BATCH_SIZE.observe(len(jobs))
+    logger.debug("Checking grammar batch", extra={"jobs": len(jobs), "cefr_level": level})
+
+    items = [
+        {"id": job["id"], "history": job["history"], "user_text": job["user_text"], "ai_response": job["ai_response"]}
+        for job in jobs
+    ]
+    results = await analyze_grammar_batch(items, level)
+    if results is None:
+        JOBS_FAILED.inc()
+        await db.fail_grammar_jobs(job_ids, "grammar check failed", MAX_ATTEMPTS, RETRY_BACKOFF)
+        return
+
+    # Ids the model left out of its answer are retried, not taken as "no error"
+    missing = [job["id"] for job in jobs if job["id"] not in results]
+    if missing:
+        JOBS_INCOMPLETE.inc(len(missing))
+        await db.fail_grammar_jobs(missing, "missing from batch result", MAX_ATTEMPTS, RETRY_BACKOFF)
+    jobs = [job for job in jobs if job["id"] in results]
+    job_ids = [job["id"] for job in jobs]
+
+    feedback = []
+    for job in jobs:
+        result = results[job["id"]]
+        if result and result.get("has_error"):
+            feedback.append({
+                "message_id": job["message_id"],
+                "user_text": job["user_text"],
+                "correction": result.get("correction", ""),
+                "explanation": result.get("explanation", ""),
+            })
+
+    await db.complete_grammar_jobs(job_ids, feedback)
+    _observe_lag(jobs)
+    logger.info("Grammar batch checked", extra={**SAMPLED, "jobs": len(jobs), "feedback_items": len(feedback), "cefr_level": level})
+
+async def _worker():
+    wakeup = _get_wakeup()
+    while True:
+        # Clear before claiming: a notify() that lands after an empty claim then still wakes us up
+        wakeup.clear()
+        jobs = await db.claim_grammar_jobs(GRAMMAR_BATCH_SIZE)
+        if not jobs:
+            QUEUE_DEPTH.set(0)
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=GRAMMAR_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                continue
+            # Give concurrent chat turns a moment to land in the same batch
+            await asyncio.sleep(GRAMMAR_BATCH_LINGER)
+            continue
+
+        try:
+            await process_batch(jobs)
+        except asyncio.CancelledError:
+            # Shutdown mid-batch: the jobs are requeued on next startup
+            raise
+        except LLMOverloaded as e:
+            # Chat traffic has priority: put the jobs back and let the model cool down
+            await db.release_grammar_jobs([job["id"] for job in jobs])
+            await asyncio.sleep(e.retry_after)
+        except Exception as e:
+            logger.exception("Grammar worker error")
+            JOBS_FAILED.inc()
+            await db.fail_grammar_jobs([job["id"] for job in jobs], str(e), MAX_ATTEMPTS, RETRY_BACKOFF)
+        QUEUE_DEPTH.set(await db.count_pending_grammar_jobs())
+
+async def _prune_failed():
+    """Hourly: deletes failed jobs older than FAILED_RETENTION and reports how many are left."""
+    while True:
+        try:
+            pruned = await db.prune_failed_grammar_jobs((datetime.now() - FAILED_RETENTION).isoformat())
+            JOBS_DEAD.set(pruned["remaining"])
+            if pruned["remaining"] or pruned["removed"]:
+                logger.warning("Failed grammar checks", extra={"failed_jobs": pruned["remaining"],
+                                                                "pruned_jobs": pruned["removed"]})
+        except Exception:
+            logger.exception("Pruning failed grammar checks failed")
+        await asyncio.sleep(PRUNE_INTERVAL)
+
+async def run_grammar_workers():
+    """Drains the grammar queue, started and cancelled by the app lifespan."""
+    requeued = await db.requeue_running_grammar_jobs()
+    if requeued:
+        logger.info("Requeued unfinished grammar checks", extra={"jobs": requeued})
+    QUEUE_DEPTH.set(await db.count_pending_grammar_jobs())
+    await asyncio.gather(_prune_failed(), *(_worker() for _ in range(GRAMMAR_WORKERS)))
@@ -0,0 +1,125 @@
+import logging
+import os
+import re
+import mmap
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Binary lexicon written by word_bank/process_words.py. Layout (little-endian):
+#   magic (8 bytes) | count (uint32) | reserved (uint32)
+#   offsets: count + 1 uint32, start of each word in the blob
+#   blob: lowercase NFC UTF-8 full forms, sorted bytewise, no separators
+# The file is memory-mapped, so loading is instant and the pages are shared between workers.
+LEXICON_PATH = Path(__file__).resolve().parent.parent.parent / "word_bank" / "lexicon.bin"
+LEXICON_MAGIC = b"RODLEX\x01\x00"
+HEADER_SIZE = 16
+LOOKUP_CACHE_SIZE = int(os.getenv("ROD_LEXICON_CACHE_SIZE", "65536"))
+
+WORD_RE = re.compile(r"[A-Za-zÆØÅæøåÉéÈèÓóÒòÔôÜüÄäÖö]+")
+
+
+class _Words:
+    """Read-only sequence view of the sorted words (lets bisect run in C)."""
+
+    def __init__(self, blob: memoryview, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]])
+
+
+class Lexicon:
+    """Membership test over every Norwegian full form, backed by an mmap of lexicon.bin."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:8] != LEXICON_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a lexicon file (regenerate it with process_words.py)")
+
+        view = memoryview(self._mmap)
+        count = int.from_bytes(view[8:12], "little")
+        offsets_end = HEADER_SIZE + 4 * (count + 1)
+        if sys.byteorder == "little":
+            offsets = view[HEADER_SIZE:offsets_end].cast("I")
+        else:
+            offsets = array("I", view[HEADER_SIZE:offsets_end])
+            offsets.byteswap()
+        self._words = _Words(view[offsets_end:], offsets)
+        self._lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._search)
+
+    def __len__(self):
+        return len(self._words)
+
+    def _search(self, key: bytes) -> bool:
+        i = bisect_left(self._words, key)
+        return i < len(self._words) and self._words[i] == key
+
+    def __contains__(self, word: str) -> bool:
+        word = word.lower()
+        if not word.isascii():
+            word = unicodedata.normalize("NFC", word)
+        return self._lookup(word.encode("utf-8"))
+
+    def cache_info(self):
+        return self._lookup.cache_info()
+
+
+_lexicon: Optional[Lexicon] = None
+_lexicon_loaded = False
+
+def get_lexicon() -> Optional[Lexicon]:
+    """Maps the lexicon once. Returns None if it hasn't been generated (callers skip lexicon features)."""
+    global _lexicon, _lexicon_loaded
+    if not _lexicon_loaded:
+        _lexicon_loaded = True
+        try:
+            _lexicon = Lexicon(LEXICON_PATH)
+            logger.info("Lexicon loaded", extra={"forms": len(_lexicon)})
+        except FileNotFoundError:
+            logger.warning("No lexicon at %s, lexicon features are disabled", LEXICON_PATH)
+        except ValueError as e:
+            logger.warning("%s", e)
+    return _lexicon
+
+def tokenize(text: str) -> list:
+    return WORD_RE.findall(text or "")
+
+
+# ENGLISH DETECTION
+# Frequent English words that are not also Norwegian forms ("i", "is", "and", "for", "by" are left out on purpose).
+# Contractions are split by the tokenizer, so only their first half is listed.
+ENGLISH_WORDS = frozenset("""
+the you your what how why where when who which this that these those with without
+would could should was were been being does did don doesn didn isn aren won
+it there their they them he she we our of in on about because but
+hello hey thanks thank please yes yeah
+name speak english norwegian know think want need really very much good great nice
+morning evening night today tomorrow yesterday day week work school friend friends family
+doing going learning living weather help understand again
+""".split())
+
+def english_ratio(text: str) -> float:
+    """Share of the words that are clearly English (0 when there are no words)."""
+    words = [w.lower() for w in tokenize(text)]
+    if not words:
+        return 0.0
+    lexicon = get_lexicon()
+    english = sum(1 for w in words if w in ENGLISH_WORDS and (lexicon is None or w not in lexicon))
+    return english / len(words)
+
+def is_english(text: str, threshold: float = 0.4) -> bool:
+    return english_ratio(text) >= threshold
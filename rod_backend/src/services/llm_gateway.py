@@ -0,0 +1,432 @@
+import os
+import math
+import time
+import heapq
+import itertools
+import random
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+import openai
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+import src.services.metrics_service as metrics
+
+# Every OpenAI call goes through this module: one pooled HTTP client,
+# per-model timeouts, jittered retries, optional hedging and metrics.
+load_dotenv()
+API_KEY = os.getenv("OPENAI_API_KEY")
+
+try:
+    import h2  # noqa: F401  (httpx only speaks HTTP/2 when h2 is installed)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+POOL_MAX_CONNECTIONS = int(os.getenv("ROD_LLM_MAX_CONNECTIONS", "50"))
+POOL_MAX_KEEPALIVE = int(os.getenv("ROD_LLM_MAX_KEEPALIVE", "20"))
+CONNECT_TIMEOUT = 5.0
+
+# timeout: seconds for a whole non-streamed call (between chunks when streaming)
+# attempts: total tries for retryable errors
+# concurrency: calls in flight; rpm: token-bucket refill (requests per minute), burst: bucket size
+MODEL_SETTINGS = {
+    "gpt-5": {"timeout": 45.0, "attempts": 2, "concurrency": 16, "rpm": 500, "burst": 20},
+    "gpt-5-mini": {"timeout": 30.0, "attempts": 3, "concurrency": 8, "rpm": 500, "burst": 10},
+    "gpt-5-nano": {"timeout": 20.0, "attempts": 3, "concurrency": 16, "rpm": 1000, "burst": 20},
+    "whisper-1": {"timeout": 60.0, "attempts": 2, "concurrency": 8, "rpm": 100, "burst": 10},
+}
+DEFAULT_SETTINGS = {"timeout": 30.0, "attempts": 2, "concurrency": 8, "rpm": 300, "burst": 10}
+
+# PRIORITY CLASSES
+# Lower value = served first. Background work may only use part of a model's slots,
+# so interactive requests always find headroom.
+INTERACTIVE = 0
+BACKGROUND = 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+BACKGROUND_SHARE = float(os.getenv("ROD_LLM_BACKGROUND_SHARE", "0.5"))
+# Longest a request may wait for a slot; if the estimate is longer it is shed right away
+MAX_QUEUE_WAIT = {
+    INTERACTIVE: float(os.getenv("ROD_LLM_INTERACTIVE_MAX_WAIT", "8")),
+    BACKGROUND: float(os.getenv("ROD_LLM_BACKGROUND_MAX_WAIT", "120")),
+}
+RETRY_BACKOFF = 0.5  # seconds, doubled per attempt (full jitter)
+RETRY_BACKOFF_MAX = 8.0
+
+# Hedging: if a call is slower than this percentile of recent calls, send a duplicate and take the first reply.
+# Doubles the cost of slow calls, so it is opt-in per model.
+HEDGE_MODELS = {m for m in os.getenv("ROD_LLM_HEDGE_MODELS", "").split(",") if m}
+HEDGE_PERCENTILE = float(os.getenv("ROD_LLM_HEDGE_PERCENTILE", "0.95"))
+# Live statistics (hedging, limiter estimates, chat routing) need this many recent calls
+MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+# Older samples are ignored, so a model that stopped getting traffic (e.g. routed around) is judged afresh
+STATS_MAX_AGE = float(os.getenv("ROD_LLM_STATS_MAX_AGE", "300"))
+
+RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+REQUEST_DURATION = metrics.histogram("llm_request_seconds", "Latency of successful LLM calls by model and operation.")
+REQUESTS = metrics.counter("llm_requests_total", "LLM calls by model and outcome (ok, error).")
+RETRIES = metrics.counter("llm_retries_total", "Retried LLM attempts by model and error type.")
+HEDGES = metrics.counter("llm_hedges_total", "Hedged LLM calls by model and result (sent or skipped, then primary or hedge won).")
+TOKENS = metrics.counter("llm_tokens_total", "Tokens used by model and kind (prompt, completion).")
+IN_FLIGHT = metrics.gauge("llm_in_flight", "LLM calls currently holding a slot, by model.")
+QUEUED = metrics.gauge("llm_queued", "LLM calls waiting for a slot, by model and priority.")
+QUEUE_WAIT = metrics.histogram("llm_queue_wait_seconds", "Time spent waiting for an LLM slot, by model and priority.")
+SHED = metrics.counter("llm_shed_total", "LLM calls rejected because the wait would exceed the deadline.")
+
+
+class LLMOverloaded(Exception):
+    """Raised when a call would wait longer than its deadline (caller should answer 503 + Retry-After)."""
+
+    def __init__(self, model: str, retry_after: int = 5):
+        super().__init__(f"{model} is overloaded")
+        self.model = model
+        self.retry_after = retry_after
+
+
+class ModelLimiter:
+    """
+    Concurrency slots + request token bucket for one model, handed out by priority.
+    Waiters are served strictly by (priority, arrival); background only gets BACKGROUND_SHARE of the slots.
+    """
+
+    def __init__(self, model: str, concurrency: int, rpm: float, burst: int):
+        self.model = model
+        self.concurrency = concurrency
+        self.rate = rpm / 60.0
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._in_flight = 0
+        self._waiters = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _slots_for(self, priority: int) -> int:
+        if priority == INTERACTIVE:
+            return self.concurrency
+        return max(1, int(self.concurrency * BACKGROUND_SHARE))
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def _can_start(self, priority: int) -> bool:
+        return self._in_flight < self._slots_for(priority) and self._tokens >= 1
+
+    def _start(self):
+        self._tokens -= 1
+        self._in_flight += 1
+        IN_FLIGHT.set(self._in_flight, model=self.model)
+
+    def estimate_wait(self, priority: int) -> float:
+        """Rough seconds until a new request of this priority would start."""
+        self._refill()
+        ahead = sum(1 for p, _, fut in self._waiters if p <= priority and not fut.done())
+        slots = self._slots_for(priority)
+        busy = max(0, self._in_flight - slots + 1)
+        typical = latency_percentile(self.model, 0.5) or settings_for(self.model)["timeout"] / 4
+        slot_wait = (ahead + busy) / slots * typical if ahead or busy else 0.0
+        token_wait = max(0.0, ahead + 1 - self._tokens) / self.rate
+        return max(slot_wait, token_wait)
+
+    def _update_queued(self):
+        for priority, name in PRIORITY_NAMES.items():
+            QUEUED.set(sum(1 for p, _, fut in self._waiters if p == priority and not fut.done()),
+                       model=self.model, priority=name)
+
+    def _dispatch(self):
+        self._timer = None
+        self._refill()
+        while self._waiters:
+            priority, _, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_start(priority):
+                break
+            heapq.heappop(self._waiters)
+            self._start()
+            fut.set_result(None)
+        # Waiting on the bucket (not on a slot): wake up when the next token is due
+        if self._waiters and self._tokens < 1 and self._timer is None:
+            delay = (1 - self._tokens) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+        self._update_queued()
+
+    def try_acquire(self, priority: int) -> bool:
+        """Takes a slot and a token only if one is free right now (nobody waiting); never queues."""
+        self._refill()
+        if self._waiters or not self._can_start(priority):
+            return False
+        self._start()
+        return True
+
+    async def acquire(self, priority: int, max_wait: float):
+        self._refill()
+        if not self._waiters and self._can_start(priority):
+            self._start()
+            return
+
+        estimate = self.estimate_wait(priority)
+        if estimate > max_wait:
+            self._shed(priority, estimate)
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        self._dispatch()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(fut, timeout=max_wait)
+        except asyncio.TimeoutError:
+            self._update_queued()
+            self._shed(priority, max_wait)
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over just as we were cancelled
+                self.release()
+            self._update_queued()
+            raise
+        QUEUE_WAIT.observe(time.perf_counter() - start, model=self.model, priority=PRIORITY_NAMES[priority])
+
+    def _shed(self, priority: int, wait: float):
+        SHED.inc(model=self.model, priority=PRIORITY_NAMES[priority])
+        raise LLMOverloaded(self.model, retry_after=max(1, math.ceil(wait)))
+
+    def release(self):
+        self._in_flight -= 1
+        IN_FLIGHT.set(self._in_flight, model=self.model)
+        self._dispatch()
+
+
+_limiters: Dict[str, ModelLimiter] = {}
+
+def limiter_for(model: str) -> ModelLimiter:
+    limiter = _limiters.get(model)
+    if limiter is None:
+        settings = settings_for(model)
+        limiter = ModelLimiter(model, settings["concurrency"], settings["rpm"], settings["burst"])
+        _limiters[model] = limiter
+    return limiter
+
+def would_shed(model: str, priority: int = INTERACTIVE) -> bool:
+    return limiter_for(model).estimate_wait(priority) > MAX_QUEUE_WAIT[priority]
+
+def check_capacity(model: str, priority: int = INTERACTIVE):
+    """Raises LLMOverloaded now if a call would be shed, so endpoints can answer 503 before doing any work."""
+    limiter = limiter_for(model)
+    wait = limiter.estimate_wait(priority)
+    if wait > MAX_QUEUE_WAIT[priority]:
+        limiter._shed(priority, wait)
+
+@asynccontextmanager
+async def slot(model: str, priority: int = INTERACTIVE):
+    """Holds one of the model's slots for the duration of the block."""
+    limiter = limiter_for(model)
+    await limiter.acquire(priority, MAX_QUEUE_WAIT[priority])
+    try:
+        yield
+    finally:
+        limiter.release()
+
+http_client = httpx.AsyncClient(
+    http2=HTTP2,
+    timeout=httpx.Timeout(DEFAULT_SETTINGS["timeout"], connect=CONNECT_TIMEOUT),
+    limits=httpx.Limits(max_connections=POOL_MAX_CONNECTIONS, max_keepalive_connections=POOL_MAX_KEEPALIVE),
+)
+# Retries are done here (with jitter and metrics), not inside the SDK
+client = AsyncOpenAI(api_key=API_KEY, http_client=http_client, max_retries=0)
+
+_latencies: Dict[str, deque] = {}  # (monotonic time, seconds)
+_outcomes: Dict[str, deque] = {}  # (monotonic time, 1 = error / 0 = ok)
+
+
+def settings_for(model: str) -> Dict:
+    return MODEL_SETTINGS.get(model, DEFAULT_SETTINGS)
+
+def _request_timeout(model: str) -> httpx.Timeout:
+    """Per-call HTTP timeout from MODEL_SETTINGS (the shared client's default only covers unlisted models)."""
+    return httpx.Timeout(settings_for(model)["timeout"], connect=CONNECT_TIMEOUT)
+
+def _record_latency(model: str, operation: str, seconds: float, track: bool = True):
+    REQUEST_DURATION.observe(seconds, model=model, operation=operation)
+    if track:
+        _latencies.setdefault(model, deque(maxlen=LATENCY_WINDOW)).append((time.monotonic(), seconds))
+
+def _record_outcome(model: str, outcome: str):
+    REQUESTS.inc(model=model, outcome=outcome)
+    _outcomes.setdefault(model, deque(maxlen=LATENCY_WINDOW)).append((time.monotonic(), 1 if outcome == "error" else 0))
+
+def _recent(window: Optional[deque]) -> list:
+    """Values of the window younger than STATS_MAX_AGE ([] if there are fewer than MIN_SAMPLES)."""
+    if not window or len(window) < MIN_SAMPLES:
+        return []
+    cutoff = time.monotonic() - STATS_MAX_AGE
+    values = [value for recorded_at, value in window if recorded_at >= cutoff]
+    return values if len(values) >= MIN_SAMPLES else []
+
+def latency_percentile(model: str, q: float = 0.95) -> Optional[float]:
+    """Recent latency percentile of complete successful calls to this model (None until there is enough data)."""
+    samples = _recent(_latencies.get(model))
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def error_rate(model: str) -> Optional[float]:
+    """Share of recent calls to this model that failed after retries (None until there is enough data)."""
+    outcomes = _recent(_outcomes.get(model))
+    if not outcomes:
+        return None
+    return sum(outcomes) / len(outcomes)
+
+def _record_usage(model: str, usage):
+    if usage is None:
+        return
+    if getattr(usage, "prompt_tokens", None):
+        TOKENS.inc(usage.prompt_tokens, model=model, kind="prompt")
+    if getattr(usage, "completion_tokens", None):
+        TOKENS.inc(usage.completion_tokens, model=model, kind="completion")
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * (2 ** attempt)))
+
+async def _with_retries(model: str, operation: str, call, priority: Optional[int] = INTERACTIVE,
+                        track: bool = True):
+    """
+    Runs call() with the model's timeout, retrying retryable errors with jittered backoff.
+    Each attempt holds a slot of the given priority (None: the caller already holds one).
+    track=False keeps the latency out of the live statistics (e.g. only a stream being opened).
+    """
+    settings = settings_for(model)
+    attempts = settings["attempts"]
+    for attempt in range(attempts):
+        start = time.perf_counter()
+        try:
+            if priority is None:
+                result = await asyncio.wait_for(call(), timeout=settings["timeout"])
+            else:
+                async with slot(model, priority):
+                    start = time.perf_counter()
+                    result = await asyncio.wait_for(call(), timeout=settings["timeout"])
+        except RETRYABLE_ERRORS as e:
+            if attempt == attempts - 1:
+                _record_outcome(model, "error")
+                raise
+            RETRIES.inc(model=model, error=type(e).__name__)
+            await asyncio.sleep(_backoff(attempt))
+            continue
+        except LLMOverloaded:
+            # Counted in llm_shed_total; never retried (that is what shedding avoids)
+            raise
+        except Exception:
+            _record_outcome(model, "error")
+            raise
+        _record_latency(model, operation, time.perf_counter() - start, track)
+        _record_outcome(model, "ok")
+        return result
+
+async def _hedged(model: str, call, priority: int = INTERACTIVE):
+    """
+    Starts a second identical request if the first is slower than the recent percentile; first reply wins.
+    The hedge holds its own slot and token, and is only sent if one is free right now (never while shedding).
+    """
+    delay = latency_percentile(model, HEDGE_PERCENTILE)
+    if delay is None:
+        return await call()
+
+    tasks = [asyncio.ensure_future(call())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return tasks[0].result()
+
+        limiter = limiter_for(model)
+        if would_shed(model, priority) or not limiter.try_acquire(priority):
+            HEDGES.inc(model=model, result="skipped")
+            return await tasks[0]
+
+        HEDGES.inc(model=model, result="sent")
+        hedge = asyncio.ensure_future(call())
+        # Done callback, not finally: it also runs if the task is cancelled before it starts
+        hedge.add_done_callback(lambda _: limiter.release())
+        tasks.append(hedge)
+        pending = set(tasks)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    HEDGES.inc(model=model, result="primary" if task is tasks[0] else "hedge")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def chat(model: str, messages: list, priority: int = INTERACTIVE, hedge: Optional[bool] = None, **kwargs):
+    """
+    chat.completions.create with the gateway's limits and timeout/retry/hedging policy. Returns the SDK response.
+    Raises LLMOverloaded when the call is shed.
+    """
+    use_hedge = model in HEDGE_MODELS if hedge is None else hedge
+
+    async def call():
+        return await client.chat.completions.create(model=model, messages=messages,
+                                                    timeout=_request_timeout(model), **kwargs)
+
+    attempt = (lambda: _hedged(model, call, priority)) if use_hedge else call
+    response = await _with_retries(model, "chat", attempt, priority)
+    _record_usage(model, getattr(response, "usage", None))
+    return response
+
+async def chat_stream(model: str, messages: list, priority: int = INTERACTIVE, **kwargs) -> AsyncIterator:
+    """
+    Streaming chat: yields SDK chunks, holding one slot for the whole stream. Connecting is retried like chat();
+    once chunks flow, a stall longer than the model timeout raises instead of hanging.
+    """
+    async def call():
+        return await client.chat.completions.create(
+            model=model, messages=messages, stream=True,
+            stream_options={"include_usage": True},
+            timeout=_request_timeout(model),
+            **kwargs,
+        )
+
+    async with slot(model, priority):
+        start = time.perf_counter()
+        stream = await _with_retries(model, "chat_stream", call, priority=None, track=False)
+        try:
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    _record_usage(model, chunk.usage)
+                yield chunk
+        finally:
+            # Also runs when the consumer stops early (client disconnected): free the pooled connection
+            await stream.close()
+        _record_latency(model, "chat_stream_total", time.perf_counter() - start)
+
+async def transcribe(model: str, file, priority: int = INTERACTIVE, **kwargs):
+    """audio.transcriptions.create with the gateway's limits and timeout/retry policy."""
+    async def call():
+        return await client.audio.transcriptions.create(model=model, file=file,
+                                                        timeout=_request_timeout(model), **kwargs)
+
+    return await _with_retries(model, "transcribe", call, priority)
+
+async def close():
+    """Closes the shared connection pool (app shutdown)."""
+    await http_client.aclose()
@@ -0,0 +1,178 @@
+import os
+import sys
+import json
+import copy
+import uuid
+import queue
+import atexit
+import logging
+import itertools
+import contextvars
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import src.services.metrics_service as metrics
+
+# Structured logging: one JSON object per line on stdout.
+# Callers only put records on a bounded in-memory queue; a listener thread formats and writes them,
+# so a slow stdout (log shipper backpressure) never blocks the event loop. When the queue is full,
+# records are dropped and counted instead of waiting.
+LOG_LEVEL = os.getenv("ROD_LOG_LEVEL", "INFO").upper()
+LOG_QUEUE_SIZE = int(os.getenv("ROD_LOG_QUEUE_SIZE", "10000"))
+# Per-turn messages marked with extra=SAMPLED are kept 1 in N (warnings and errors are never sampled)
+LOG_SAMPLE_EVERY = max(1, int(os.getenv("ROD_LOG_SAMPLE_EVERY", "10")))
+# Chatty libraries that log every HTTP request at INFO
+QUIET_LOGGERS = ("httpx", "httpcore", "openai", "elevenlabs")
+REQUEST_ID_HEADER = "x-request-id"
+
+SAMPLED = {"sampled": True}
+
+DROPPED = metrics.counter("log_records_dropped_total", "Log records dropped because the log queue was full.")
+
+# CORRELATION IDS
+# Set per request by CorrelationIdMiddleware (and bind_conversation in the chat endpoints);
+# asyncio copies the context into background tasks, so their records carry the same ids.
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+conversation_id_var: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("conversation_id", default=None)
+
+def bind_conversation(conversation_id: Optional[int]):
+    conversation_id_var.set(conversation_id)
+
+# Attributes every LogRecord has; anything else on a record came from extra= and is logged as a field
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sampled", "request_id", "conversation_id"}
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps 1 in `every` records marked sampled, counted per message template."""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self._counters: Dict[str, itertools.count] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.every <= 1 or not getattr(record, "sampled", False) or record.levelno >= logging.WARNING:
+            return True
+        counter = self._counters.get(record.msg)
+        if counter is None:
+            counter = self._counters.setdefault(record.msg, itertools.count())
+        if next(counter) % self.every:
+            return False
+        record.sample_rate = self.every
+        return True
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Runs in the caller: resolves the message, traceback and correlation ids, then hands off without blocking.
+    JSON encoding and the write happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        record.request_id = request_id_var.get()
+        record.conversation_id = conversation_id_var.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            DROPPED.inc(level=record.levelname)
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Blocking put: at shutdown the queue may still be full, and the sentinel must not be lost
+        self.queue.put(self._sentinel)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("request_id", "conversation_id"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        for key, value in vars(record).items():
+            if key not in _RESERVED:
+                # Fields from extra= never overwrite the standard keys
+                entry.setdefault(key, value)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+_listener: Optional[_Listener] = None
+
+def configure_logging():
+    """Routes all logging through the queue handler. Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    handler = AsyncQueueHandler(log_queue)
+    handler.addFilter(SamplingFilter(LOG_SAMPLE_EVERY))
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(LOG_LEVEL)
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(max(logging.WARNING, root.level))
+
+    _listener = _Listener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+def shutdown_logging():
+    """Flushes queued records and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class CorrelationIdMiddleware:
+    """Plain ASGI middleware: takes X-Request-ID from the client (or makes one) and echoes it on the response."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER.encode():
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex[:16]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(REQUEST_ID_HEADER.encode(), request_id.encode("latin-1"))]
+            await send(message)
+
+        request_token = request_id_var.set(request_id)
+        conversation_token = conversation_id_var.set(None)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(request_token)
+            conversation_id_var.reset(conversation_token)
@@ -1,57 +1,160 @@
 import feedparser
+import httpx
 from bs4 import BeautifulSoup
 import time
-from openai import AsyncOpenAI
 import os
-from dotenv import load_dotenv
+import logging
 import asyncio
-import src.services.db_service as db
+import re
+from typing import Dict, Optional, Tuple
+import src.services.async_db_service as db
+import src.services.llm_gateway as llm
+import src.services.metrics_service as metrics
+from src.services.lexicon_service import get_lexicon, tokenize
 
-load_dotenv()
-API_KEY = os.getenv("OPENAI_API_KEY")
-client = AsyncOpenAI(api_key=API_KEY)
+logger = logging.getLogger(__name__)
 
-NRK_RSS_URL = "https://www.nrk.no/toppsaker.rss"
+NRK_RSS_URL = os.getenv("ROD_NEWS_FEED_URL", "https://www.nrk.no/toppsaker.rss")
 
-# In-Memory Cache
+# Pooled HTTP client for feed fetches (closed by the app lifespan)
+http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(10.0, connect=5.0),
+    limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+    headers={"User-Agent": "RoD/1.0 (+news reader)"},
+    follow_redirects=True,
+)
+
+# In-Memory Cache (rendered article list; invalidated when a refresh adds items)
+# generation is bumped on every invalidation, so a read that started before it can't store stale data.
 NEWS_CACHE = {
     "last_updated": 0,
-    "data": []
+    "data": [],
+    "generation": 0,
 }
 CACHE_DURATION = 3600  # 1 hour
 
-async def determine_difficulty(title: str, summary: str) -> str:
+# Scheduled refresh
+NEWS_REFRESH_INTERVAL = int(os.getenv("ROD_NEWS_REFRESH_INTERVAL", "900"))  # 15 minutes
+_refresh_lock = asyncio.Lock()
+
+RSS_DURATION = metrics.histogram("rss_fetch_seconds", "Feed fetch time by stage (download, parse).")
+
+# Classification fan-out
+MAX_FEED_ITEMS = 20
+CLASSIFY_CONCURRENCY = int(os.getenv("ROD_CLASSIFY_CONCURRENCY", "4"))
+CLASSIFY_ATTEMPTS = 3
+VALID_LEVELS = {"A1", "A2", "B1", "B2", "C1", "C2"}
+
+# LOCAL READABILITY SCORER
+# Word coverage uses the Norsk Ordbank lexicon (lexicon_service)
+# Upper score bound per level (score = LIX + OOV_WEIGHT * % unknown words).
+# Tune with scripts/calibrate_readability.py.
+LEVEL_THRESHOLDS = (("A2", 33.0), ("B1", 43.0), ("B2", 53.0))
+TOP_LEVEL = "C1"
+OOV_WEIGHT = 0.5
+# Scores this close to a threshold (or very short texts) go to the LLM instead
+BORDERLINE_MARGIN = 2.5
+MIN_WORDS = 15
+LONG_WORD_LENGTH = 6
+
+SENTENCE_END_RE = re.compile(r"[.!?:]+(?:\s|$)")
+
+def readability_features(text: str) -> Dict:
+    """LIX, sentence length, word length and share of words missing from the lexicon."""
+    words = tokenize(text)
+    n_words = len(words)
+    n_sentences = max(1, len(SENTENCE_END_RE.findall(text)))
+    if not n_words:
+        return {"words": 0, "sentences": n_sentences, "lix": 0.0, "avg_sentence_length": 0.0,
+                "avg_word_length": 0.0, "oov_rate": None}
+
+    long_words = sum(1 for w in words if len(w) > LONG_WORD_LENGTH)
+    avg_sentence_length = n_words / n_sentences
+
+    oov_rate = None
+    lexicon = get_lexicon()
+    if lexicon is not None:
+        # Capitalized words are mostly names, which say nothing about difficulty
+        common = [w for w in words if not w[0].isupper()]
+        if common:
+            oov_rate = sum(1 for w in common if w.lower() not in lexicon) / len(common)
+
+    return {
+        "words": n_words,
+        "sentences": n_sentences,
+        "lix": avg_sentence_length + 100 * long_words / n_words,
+        "avg_sentence_length": avg_sentence_length,
+        "avg_word_length": sum(len(w) for w in words) / n_words,
+        "oov_rate": oov_rate,
+    }
+
+def readability_score(features: Dict) -> float:
+    score = features["lix"]
+    if features["oov_rate"] is not None:
+        score += OOV_WEIGHT * 100 * features["oov_rate"]
+    return score
+
+def score_to_level(score: float) -> str:
+    for level, upper in LEVEL_THRESHOLDS:
+        if score < upper:
+            return level
+    return TOP_LEVEL
+
+def local_difficulty(title: str, summary: str) -> Tuple[str, bool]:
+    """
+    Deterministic CEFR estimate (microseconds, no network).
+    Returns (level, confident). Not confident = borderline score or too little text.
+    """
+    features = readability_features(f"{title}. {summary}")
+    score = readability_score(features)
+    level = score_to_level(score)
+    borderline = any(abs(score - upper) < BORDERLINE_MARGIN for _, upper in LEVEL_THRESHOLDS)
+    return level, not borderline and features["words"] >= MIN_WORDS
+
+async def _classify_once(title: str, summary: str) -> str:
+    """One GPT-5-mini call. Raises if the call fails or the answer isn't a level."""
+    # PROMPT
+    prompt = f"""
+    Classify the Norwegian reading level of this news text.
+    Title: "{title}"
+    Summary: "{summary}"
+    
+    Levels:
+    - A2: Very simple, familiar topics.
+    - B1: Clear standard language, work/school topics.
+    - B2: Complex concrete/abstract topics.
+    - C1: Demanding, implicit meaning.
+    
+    CRITICAL: Respond with ONLY the two chars (e.g. "B1"). Do not write sentences.
+    """
+    
+    response = await llm.chat("gpt-5-mini", [
+        {"role": "system", "content": "You are a linguistics expert."},
+        {"role": "user", "content": prompt}
+    ], priority=llm.BACKGROUND)
+    content = (response.choices[0].message.content or "").strip().upper()
+    if content not in VALID_LEVELS:
+        raise ValueError(f"Unexpected level {content!r}")
+    return content
+
+async def determine_difficulty(title: str, summary: str, default: Optional[str] = "B1") -> Optional[str]:
     """
     Uses GPT-5-mini to guess the reading level.
+    Asks again if the answer isn't a level (transport errors are retried by the gateway), falls back to default.
     """
-    try:
-        # PROMPT
-        prompt = f"""
-        Classify the Norwegian reading level of this news text.
-        Title: "{title}"
-        Summary: "{summary}"
-        
-        Levels:
-        - A2: Very simple, familiar topics.
-        - B1: Clear standard language, work/school topics.
-        - B2: Complex concrete/abstract topics.
-        - C1: Demanding, implicit meaning.
-        
-        CRITICAL: Respond with ONLY the two chars (e.g. "B1"). Do not write sentences.
-        """
-        
-        response = await client.chat.completions.create(
-            model="gpt-5-mini",
-            messages=[{"role": "system", "content": "You are a linguistics expert."}, 
-                      {"role": "user", "content": prompt}]
-        )
-        content = response.choices[0].message.content
-        print(f"📊 Classified '{title[:20]}...' as: {content}")
-
-        return content.strip() if content else "B1"
-    except Exception as e:
-        print(f"⚠️ Classifier Failed: {e}")
-        return "B1"
+    for _ in range(CLASSIFY_ATTEMPTS):
+        try:
+            level = await _classify_once(title, summary)
+            logger.debug("Classified article", extra={"title": title[:40], "cefr_level": level})
+            return level
+        except ValueError as e:
+            logger.warning("Classifier answer rejected: %s", e)
+        except llm.LLMOverloaded:
+            raise
+        except Exception as e:
+            logger.warning("Classifier failed: %s", e)
+            break
+    return default
 
 def extract_image(entry) -> str:
     if 'media_content' in entry:
@@ -68,48 +171,142 @@ def clean_summary(html_summary: str) -> str:
     soup = BeautifulSoup(html_summary, 'html.parser')
     return soup.get_text().strip()
 
-async def refresh_news_background():
+async def classify_article(title: str, summary: str, semaphore: asyncio.Semaphore) -> Tuple[str, str]:
+    """
+    Returns (level, source). The local scorer decides clear cases;
+    only borderline ones are escalated to the LLM.
+    """
+    level, confident = local_difficulty(title, summary)
+    if confident:
+        return level, "local"
+    
+    # AI Classification (at most CLASSIFY_CONCURRENCY calls in flight)
+    async with semaphore:
+        try:
+            return await determine_difficulty(title, summary), "llm"
+        except llm.LLMOverloaded:
+            # Chat traffic has priority: keep the local estimate
+            return level, "local"
+
+async def _build_item(entry, link: str, semaphore: asyncio.Semaphore) -> dict:
+    title = str(entry.get('title', 'No Title'))
+    raw_summary = str(entry.get('summary', ''))
+    text_summary = clean_summary(raw_summary)
+    image_url = extract_image(entry)
+    
+    level, level_source = await classify_article(title, text_summary, semaphore)
+    
+    return {
+        "title": title,
+        "summary": text_summary,
+        "link": link,
+        "image_url": image_url,
+        "level": level,
+        "level_source": level_source,
+        "source": "NRK"
+    }
+
+async def fetch_feed(url: str = NRK_RSS_URL, client: Optional[httpx.AsyncClient] = None) -> Optional[Dict]:
+    """
+    Conditional GET of the feed using the stored ETag / Last-Modified.
+    Returns None when the server answers 304 Not Modified, otherwise
+    {"feed": parsed feed, "etag": ..., "last_modified": ...}.
+    Parsing runs in a worker thread so it never blocks the event loop.
+    """
+    client = client or http_client
+    headers = {}
+    validators = await db.get_feed_validators(url)
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    with RSS_DURATION.time(stage="download"):
+        response = await client.get(url, headers=headers)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    with RSS_DURATION.time(stage="parse"):
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
+    return {
+        "feed": feed,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+async def close_http_client():
+    await http_client.aclose()
+
+async def refresh_news_background() -> int:
     """
     Fetches RSS. Checks DB. Only classifies and saves NEW items.
+    Returns the number of new articles.
     """
-    print("🌍 Checking for fresh news...")
-    feed = feedparser.parse(NRK_RSS_URL)
+    logger.debug("Checking for fresh news")
+    result = await fetch_feed(NRK_RSS_URL)
+    if result is None:
+        logger.debug("Feed not modified")
+        return 0
+    feed = result["feed"]
     
-    new_count = 0
-    # Check top 20 items
-    for entry in feed.entries[:20]:
+    # Check top items, in feed order, without duplicate links
+    candidates = {}
+    for entry in feed.entries[:MAX_FEED_ITEMS]:
         link = str(entry.get('link', ''))
-        
-        # OPTIMIZATION
-        if db.media_exists(link):
-            continue
-
-        # If new, process it
-        title = str(entry.get('title', 'No Title'))
-        raw_summary = str(entry.get('summary', ''))
-        text_summary = clean_summary(raw_summary)
-        image_url = extract_image(entry)
-        
-        # AI Classification
-        level = await determine_difficulty(title, text_summary)
-        
-        item = {
-            "title": title,
-            "summary": text_summary,
-            "link": link,
-            "image_url": image_url,
-            "level": level,
-            "source": "NRK"
-        }
-        
-        db.save_media_item(item)
-        new_count += 1
-    
-    if new_count > 0:
-        print(f"✅ Added {new_count} new articles to DB.")
+        if link and link not in candidates:
+            candidates[link] = entry
+
+    # OPTIMIZATION: one lookup for all candidates
+    existing = await db.get_existing_media_links(list(candidates))
+    new_entries = [(link, entry) for link, entry in candidates.items() if link not in existing]
+
+    if new_entries:
+        semaphore = asyncio.Semaphore(CLASSIFY_CONCURRENCY)
+        items = await asyncio.gather(*[_build_item(entry, link, semaphore) for link, entry in new_entries])
+        await db.save_media_items(items)
+        invalidate_news_cache()
+
+    # Only remember the validators once the items are safely stored
+    await db.save_feed_validators(NRK_RSS_URL, result["etag"], result["last_modified"])
+
+    if new_entries:
+        logger.info("Added new articles", extra={"articles": len(new_entries)})
     else:
-        print("💤 No new news.")
+        logger.debug("No new news")
+    return len(new_entries)
+
+async def refresh_news_if_due() -> int:
+    """Single-flight refresh: if one is already running (slow feed), don't start another."""
+    if _refresh_lock.locked():
+        return 0
+    async with _refresh_lock:
+        return await refresh_news_background()
+
+async def run_news_refresher():
+    """Periodic refresher, started and cancelled by the app lifespan."""
+    while True:
+        try:
+            await refresh_news_if_due()
+        except Exception as e:
+            logger.warning("News refresh failed: %s", e)
+        await asyncio.sleep(NEWS_REFRESH_INTERVAL)
+
+def invalidate_news_cache():
+    NEWS_CACHE["generation"] += 1
+    NEWS_CACHE["last_updated"] = 0
+    NEWS_CACHE["data"] = []
 
 async def get_cached_news():
-    """Returns what is in the DB immediately."""
-    return db.get_cached_media(limit=20)
\ No newline at end of file
+    """Returns the cached article list, reading the DB only when the cache is cold or stale."""
+    if NEWS_CACHE["last_updated"] and time.monotonic() - NEWS_CACHE["last_updated"] < CACHE_DURATION:
+        return NEWS_CACHE["data"]
+
+    generation = NEWS_CACHE["generation"]
+    news = await db.get_cached_media(limit=20)
+    # Invalidated while we were reading: serve this result once, but don't cache it
+    if NEWS_CACHE["generation"] == generation:
+        NEWS_CACHE["data"] = news
+        NEWS_CACHE["last_updated"] = time.monotonic()
+    return news
\ No newline at end of file
@@ -0,0 +1,237 @@
+import time
+import asyncio
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+# Latency buckets in seconds (covers SQLite microseconds up to slow LLM calls)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels."""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {"type": "counter", "values": [{"labels": dict(k), "value": v} for k, v in self._values.items()]}
+
+
+class Gauge:
+    """Value that can go up and down (queue depths, in-flight counts)."""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {"type": "gauge", "values": [{"labels": dict(k), "value": v} for k, v in self._values.items()]}
+
+
+class Histogram:
+    """Fixed-bucket histogram. Observing is a bisect plus two additions."""
+
+    def __init__(self, name: str, description: str, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        # label key -> [bucket counts..., +Inf count], sum, count
+        self._series: Dict[LabelKey, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels) -> "_Timer":
+        """`with HISTOGRAM.time(stage="x"):` observes the block's wall time."""
+        return _Timer(self, labels)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            values = []
+            for key, (counts, total, count) in self._series.items():
+                values.append({
+                    "labels": dict(key),
+                    "count": count,
+                    "sum": total,
+                    "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], counts)),
+                })
+            return {"type": "histogram", "values": values}
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+# REGISTRY
+_REGISTRY: Dict[str, object] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+def _get_or_create(cls, name: str, description: str, **kwargs):
+    with _REGISTRY_LOCK:
+        metric = _REGISTRY.get(name)
+        if metric is None:
+            metric = cls(name, description, **kwargs)
+            _REGISTRY[name] = metric
+        return metric
+
+def counter(name: str, description: str = "") -> Counter:
+    return _get_or_create(Counter, name, description)
+
+def gauge(name: str, description: str = "") -> Gauge:
+    return _get_or_create(Gauge, name, description)
+
+def histogram(name: str, description: str = "", buckets=DEFAULT_BUCKETS) -> Histogram:
+    return _get_or_create(Histogram, name, description, buckets=buckets)
+
+def snapshot() -> Dict[str, Dict]:
+    """Returns every registered metric as plain JSON-friendly data."""
+    with _REGISTRY_LOCK:
+        metrics = list(_REGISTRY.items())
+    return {name: metric.snapshot() for name, metric in metrics}
+
+
+# PROMETHEUS TEXT FORMAT
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(labels: Dict[str, str], extra: Tuple[str, str] = None) -> str:
+    pairs = list(labels.items()) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+def render_prometheus() -> str:
+    """Every registered metric in the Prometheus text exposition format (histogram buckets are cumulative)."""
+    lines: List[str] = []
+    for name, data in snapshot().items():
+        with _REGISTRY_LOCK:
+            description = _REGISTRY[name].description
+        lines.append(f"# HELP {name} {_escape(description)}")
+        lines.append(f"# TYPE {name} {data['type']}")
+        for series in data["values"]:
+            labels = series["labels"]
+            if data["type"] != "histogram":
+                lines.append(f"{name}{_labels(labels)} {_number(series['value'])}")
+                continue
+            cumulative = 0
+            for bound, count in series["buckets"].items():
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels, ('le', bound))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(series['sum'])}")
+            lines.append(f"{name}_count{_labels(labels)} {series['count']}")
+    return "\n".join(lines) + "\n"
+
+
+# REQUEST AND EVENT-LOOP METRICS
+HTTP_DURATION = histogram("http_request_duration_seconds", "Time to send the full response, by route template, method and status.")
+HTTP_IN_FLIGHT = gauge("http_requests_in_flight", "HTTP requests currently being handled.")
+LOOP_LAG = histogram("event_loop_lag_seconds", "How late the event loop woke up a periodic timer (time spent behind other work).")
+LOOP_LAG_LAST = gauge("event_loop_lag_last_seconds", "Most recent event-loop lag measurement.")
+LOOP_LAG_INTERVAL = 0.5
+
+
+class RequestMetricsMiddleware:
+    """
+    Plain ASGI middleware (no per-request task or body buffering, streaming responses pass straight through).
+    Routes are labelled by their template ("/chat/{conversation_id}"), so the label set stays small.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_DURATION.observe(time.perf_counter() - start, route=_route_label(scope),
+                                  method=scope["method"], status=status["code"])
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Mounted apps (static files) have no route object; use the mount path
+    if "endpoint" in scope:
+        return scope.get("root_path") or "/"
+    return "unmatched"
+
+async def run_loop_lag_monitor(interval: float = LOOP_LAG_INTERVAL):
+    """Sleeps `interval` in a loop; any extra delay before waking up is time the loop spent busy elsewhere."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        LOOP_LAG.observe(lag)
+        LOOP_LAG_LAST.set(lag)
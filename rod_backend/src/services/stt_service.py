@@ -1,76 +1,209 @@
+import logging
 import os
+import time
 import asyncio
+import struct
 import ffmpeg
-import tempfile
-from pathlib import Path
-from openai import AsyncOpenAI
-from dotenv import load_dotenv
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
-import subprocess
+import src.services.llm_gateway as llm
+import src.services.metrics_service as metrics
+from src.services.log_service import SAMPLED
 
-load_dotenv()
-API_KEY = os.getenv("OPENAI_API_KEY")
-client = AsyncOpenAI(api_key=API_KEY)
+logger = logging.getLogger(__name__)
 
-def _convert_to_wav_sync(filepath: Path) -> Optional[str]:
+# Whisper rejects files above 25 MB
+MAX_UPLOAD_BYTES = int(os.getenv("ROD_MAX_AUDIO_UPLOAD_BYTES", str(25 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Formats Whisper accepts as-is (no conversion needed)
+WHISPER_NATIVE_EXTS = (".m4a", ".mp3", ".wav", ".ogg", ".oga", ".webm", ".flac", ".mp4", ".mpeg", ".mpga")
+# Formats we convert to 16 kHz mono WAV first
+CONVERT_EXTS = (".aac",)
+
+# Transcoding pool: at most TRANSCODE_WORKERS ffmpeg processes, TRANSCODE_QUEUE_SIZE callers waiting
+TRANSCODE_WORKERS = int(os.getenv("ROD_TRANSCODE_WORKERS", str(os.cpu_count() or 2)))
+TRANSCODE_QUEUE_SIZE = int(os.getenv("ROD_TRANSCODE_QUEUE_SIZE", "8"))
+TRANSCODE_QUEUE_TIMEOUT = float(os.getenv("ROD_TRANSCODE_QUEUE_TIMEOUT", "10"))
+
+TRANSCODE_QUEUE_DEPTH = metrics.gauge("transcode_queue_depth", "Transcriptions waiting for an ffmpeg slot.")
+TRANSCODE_ACTIVE = metrics.gauge("transcode_active", "ffmpeg conversions currently running.")
+TRANSCODE_REJECTED = metrics.counter("transcode_rejected_total", "Transcriptions rejected because the pool was saturated.")
+TRANSCODE_DURATION = metrics.histogram("transcode_duration_seconds", "Wall time of one ffmpeg conversion.")
+WHISPER_UPLOAD_DURATION = metrics.histogram("whisper_request_seconds", "Time to upload audio to Whisper and get the transcript.")
+
+
+class AudioTooLarge(Exception):
+    """Raised while streaming an upload that exceeds MAX_UPLOAD_BYTES."""
+
+
+class TranscodeBusy(Exception):
+    """Raised when the transcoding queue is full (caller should answer 503 + Retry-After)."""
+
+    def __init__(self, retry_after: int = 5):
+        super().__init__("Transcoding queue is full")
+        self.retry_after = retry_after
+
+
+class TranscodePool:
+    """
+    Admission control for ffmpeg: a fixed number of slots and a bounded wait queue.
+    When the queue is full, callers are rejected immediately instead of piling up.
+    """
+
+    def __init__(self, workers: int, queue_size: int, queue_timeout: float):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(workers)
+        # Running + waiting callers, counted synchronously so bursts can't overshoot
+        self._admitted = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._admitted >= self.workers + self.queue_size:
+            TRANSCODE_REJECTED.inc()
+            raise TranscodeBusy()
+
+        self._admitted += 1
+        TRANSCODE_QUEUE_DEPTH.inc()
+        try:
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                TRANSCODE_REJECTED.inc()
+                raise TranscodeBusy()
+            finally:
+                TRANSCODE_QUEUE_DEPTH.dec()
+
+            TRANSCODE_ACTIVE.inc()
+            try:
+                yield
+            finally:
+                TRANSCODE_ACTIVE.dec()
+                self._slots.release()
+        finally:
+            self._admitted -= 1
+
+
+transcode_pool = TranscodePool(TRANSCODE_WORKERS, TRANSCODE_QUEUE_SIZE, TRANSCODE_QUEUE_TIMEOUT)
+
+
+def _extension(filename: str) -> str:
+    return os.path.splitext(filename or "")[1].lower()
+
+async def _read_limited(chunks: AsyncIterator[bytes]) -> bytes:
+    """Collects the upload into memory, enforcing the size limit as chunks arrive."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) > MAX_UPLOAD_BYTES:
+            raise AudioTooLarge()
+    return bytes(buffer)
+
+def _fix_wav_header(wav: bytearray) -> bytearray:
+    """
+    ffmpeg can't seek back on a pipe, so the RIFF/data sizes in the header are placeholders.
+    Patch them now that the whole file is in memory.
+    """
+    if len(wav) < 12 or wav[:4] != b"RIFF":
+        return wav
+    struct.pack_into("<I", wav, 4, len(wav) - 8)
+    data_pos = wav.find(b"data", 12)
+    if data_pos != -1:
+        struct.pack_into("<I", wav, data_pos + 4, len(wav) - data_pos - 8)
+    return wav
+
+async def _convert_to_wav(chunks: AsyncIterator[bytes]) -> Optional[bytes]:
     """
-    Synchronous (blocking) function to convert audio file to WAV.
-    This MUST be run in a separate thread.
+    Streams the upload into ffmpeg's stdin and reads 16 kHz mono WAV back from stdout.
+    No temp files: everything stays in memory.
     """
-    print(f"Starting audio conversion for {filepath}...")
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp:
-        temp_path = temp.name
-    
+    args = (
+        ffmpeg
+        .input("pipe:0")
+        .output("pipe:1", ar=16000, ac=1, format="wav")
+        .global_args("-loglevel", "error")
+        .compile()
+    )
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def feed():
+        total = 0
+        try:
+            async for chunk in chunks:
+                total += len(chunk)
+                if total > MAX_UPLOAD_BYTES:
+                    raise AudioTooLarge()
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg exited early; its stderr explains why
+            pass
+        finally:
+            process.stdin.close()
+
     try:
-        (
-            ffmpeg
-            .input(str(filepath))
-            .output(temp_path, ar=16000, ac=1, format='wav')
-            .overwrite_output()
-            .run(quiet=True)
-        )
-        print("Audio converted.")
-        return temp_path
-    except Exception as e:
-        print(f"FFMPEG error: {e}")
+        # Feed stdin while draining stdout/stderr, otherwise full pipes deadlock
+        _, wav, stderr = await asyncio.gather(feed(), process.stdout.read(), process.stderr.read())
+        await process.wait()
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    if process.returncode != 0 or not wav:
+        logger.warning("ffmpeg conversion failed", extra={"returncode": process.returncode,
+                                                          "stderr": stderr.decode(errors='replace').strip()[-1000:]})
         return None
-    
-async def speech_to_text(filepath: Path) -> str:
+
+    logger.debug("Audio converted", extra={"bytes": len(wav)})
+    return bytes(_fix_wav_header(bytearray(wav)))
+
+async def speech_to_text(chunks: AsyncIterator[bytes], filename: str) -> str:
     """
-    Asynchronously converts an audio file to text using Whisper.
+    Asynchronously converts streamed audio to text using Whisper.
+    Raises AudioTooLarge if the upload exceeds MAX_UPLOAD_BYTES,
+    TranscodeBusy if conversion is needed but the transcoding queue is full,
+    and LLMOverloaded if Whisper calls are being shed.
     """
-    EXTS = (".m4a", ".mp3", ".wav", ".aac", ".ogg") # Common audio formats
-    if not filepath.suffix.lower() in EXTS:
+    ext = _extension(filename)
+    if ext not in WHISPER_NATIVE_EXTS + CONVERT_EXTS:
         return "Unsupported audio format."
 
-    print(f"Transcribing {filepath}...")
-    
-    # Run the blocking FFMPEG conversion in a separate thread
-    wav_path_str = await asyncio.to_thread(_convert_to_wav_sync, filepath)
-    
-    if not wav_path_str:
+    logger.debug("Transcribing upload", extra={"format": ext})
+
+    if ext in WHISPER_NATIVE_EXTS:
+        # Whisper understands this container already: skip ffmpeg entirely
+        audio_bytes = await _read_limited(chunks)
+        upload_name = f"audio{ext}"
+    else:
+        async with transcode_pool.slot():
+            start = time.perf_counter()
+            audio_bytes = await _convert_to_wav(chunks)
+            TRANSCODE_DURATION.observe(time.perf_counter() - start)
+        upload_name = "audio.wav"
+
+    if not audio_bytes:
         return "Error converting audio."
 
-    wav_path = Path(wav_path_str)
     try:
-        # Now that we have the file, open it and call the async API
-        with open(wav_path, "rb") as audio_file:
-            transcript = await client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language="no"
-            )
+        start = time.perf_counter()
+        transcript = await llm.transcribe("whisper-1", (upload_name, audio_bytes), language="no")
+        WHISPER_UPLOAD_DURATION.observe(time.perf_counter() - start)
         text = transcript.text.strip()
-        print(f"Transcription: {text}")
+        # Length only: the transcript is user content
+        logger.info("Transcribed audio", extra={**SAMPLED, "chars": len(text)})
         return text
+    except llm.LLMOverloaded:
+        raise
     except Exception as e:
-        print(f"Whisper API error: {e}")
+        logger.error("Whisper API error: %s", e)
         return "Error transcribing audio."
-    finally:
-        # Clean up the temporary WAV file
-        if wav_path.exists():
-            try:
-                wav_path.unlink()
-            except Exception as e:
-                print(f"Warning: Could not delete {wav_path}: {e}")
\ No newline at end of file
@@ -1,13 +1,75 @@
+import logging
 import os
-from dotenv import load_dotenv
-from openai import AsyncOpenAI
+import re
+import time
+import random
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+import src.services.llm_gateway as llm
+import src.services.metrics_service as metrics
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# CONFIGURATION
-API_KEY = os.getenv("OPENAI_API_KEY")
+# MODEL ROUTING
+# Short turns early in a beginner conversation don't need the large model; the light one answers them faster.
+# The primary model is also bypassed while its recent p95 latency or error rate is over budget, or it is saturated.
+CHAT_MODEL = "gpt-5"
+LIGHT_CHAT_MODEL = "gpt-5-mini"
+ROUTING_ENABLED = os.getenv("ROD_CHAT_ROUTING", "1") == "1"
+LIGHT_LEVELS = ("A1", "A2")
+SHORT_MESSAGE_CHARS = 80
+SHALLOW_CONVERSATION_MESSAGES = 12
+PRIMARY_P95_BUDGET = float(os.getenv("ROD_CHAT_P95_BUDGET", "15"))
+PRIMARY_MAX_ERROR_RATE = 0.2
+# While the primary is bypassed for being slow or failing, this share of turns still goes to it,
+# so its latency/error window keeps getting fresh samples and routing can switch back
+PRIMARY_PROBE_SHARE = float(os.getenv("ROD_CHAT_PRIMARY_PROBE_SHARE", "0.1"))
+
+ROUTES = metrics.counter("chat_model_routes_total", "Chat turns per chosen model and routing reason.")
+
+def choose_chat_model(level: str, user_text: str, depth: int) -> Tuple[str, str]:
+    """Returns (model, reason) for one chat turn. depth: messages in the conversation so far."""
+    if not ROUTING_ENABLED:
+        model, reason = CHAT_MODEL, "fixed"
+    elif level in LIGHT_LEVELS and len(user_text or "") <= SHORT_MESSAGE_CHARS and depth <= SHALLOW_CONVERSATION_MESSAGES:
+        if llm.would_shed(LIGHT_CHAT_MODEL) and not llm.would_shed(CHAT_MODEL):
+            model, reason = CHAT_MODEL, "light_busy"
+        else:
+            model, reason = LIGHT_CHAT_MODEL, "short_beginner_turn"
+    elif (llm.latency_percentile(CHAT_MODEL, 0.95) or 0) > PRIMARY_P95_BUDGET:
+        model, reason = _unless_probe("primary_slow")
+    elif (llm.error_rate(CHAT_MODEL) or 0) > PRIMARY_MAX_ERROR_RATE:
+        model, reason = _unless_probe("primary_errors")
+    elif llm.would_shed(CHAT_MODEL) and not llm.would_shed(LIGHT_CHAT_MODEL):
+        model, reason = LIGHT_CHAT_MODEL, "primary_busy"
+    else:
+        model, reason = CHAT_MODEL, "default"
+    ROUTES.inc(model=model, reason=reason)
+    return model, reason
+
+def _unless_probe(reason: str) -> Tuple[str, str]:
+    if random.random() < PRIMARY_PROBE_SHARE:
+        return CHAT_MODEL, "probe"
+    # Bypassing a slow primary must not shed a turn the primary still has room for
+    if llm.would_shed(LIGHT_CHAT_MODEL) and not llm.would_shed(CHAT_MODEL):
+        return CHAT_MODEL, "light_busy"
+    return LIGHT_CHAT_MODEL, reason
+
+def check_chat_capacity(model: Optional[str] = None):
+    """
+    Raises LLMOverloaded (503) if the turn can't get a slot.
+    model: the model choose_chat_model picked; before routing, only raises if no model the turn
+    could be routed to has room (busy primaries fall back to the light model for any turn).
+    """
+    if model:
+        llm.check_capacity(model)
+    elif not ROUTING_ENABLED or llm.would_shed(LIGHT_CHAT_MODEL):
+        llm.check_capacity(CHAT_MODEL)
+
+# Bump whenever the system prompts change, so cached opening replies are not reused
+SYSTEM_PROMPT_VERSION = "1"
 
 # PROMPT DEFINITIONS
 def get_system_prompt(level: str) -> str:
@@ -72,9 +134,7 @@ DINE REGLER:
 7.  **FORBUD MOT RETTING:** Du skal ALDRI korrigere brukerens grammatikk eller staving i selve samtalen. Hvis de sier noe feil, bare forstå det og svar naturlig. Ignorer enkle grammatikkfeil (f.eks. feil bøyning), uformelle skrivefeil som er vanlige i chat (f.eks. "hvosdan" i stedet for "hvordan") og (f.eks. manglende punktum/komma, eller feil bruk av store/små bokstaver), med mindre det endrer meningen fullstendig. (Det finnes et annet system som tar seg av retting).
 """
 
-client = AsyncOpenAI(api_key=API_KEY)
-    
-async def get_rod_response(conversation_history, level: str = 'A1'):
+async def get_rod_response(conversation_history, level: str = 'A1', model: str = CHAT_MODEL):
     """
     Takes a conversation history and returns Rod's response.
     This function is asynchronous to avoid freezing the app's UI.
@@ -85,11 +145,155 @@ async def get_rod_response(conversation_history, level: str = 'A1'):
     messages = [{"role": "system", "content": system_instruction}] + conversation_history
     
     try:
-        response = await client.chat.completions.create(
-            model="gpt-5",
-            messages=messages
-        )
+        response = await llm.chat(model, messages)
         return response.choices[0].message.content
+    except llm.LLMOverloaded:
+        # Let the endpoint answer 503 + Retry-After instead of a fake reply
+        raise
+    except Exception as e:
+        logger.error("Error getting response from Rod: %s", e, extra={"model": model})
+        return FALLBACK_RESPONSE
+
+FALLBACK_RESPONSE = "Beklager, jeg har problemer med å koble til akkurat nå."
+
+TIME_TO_FIRST_TOKEN = metrics.histogram("chat_time_to_first_token_seconds", "Time until the first streamed token of Rod's reply.")
+STREAM_DURATION = metrics.histogram("chat_stream_duration_seconds", "Total time to stream Rod's reply.")
+
+async def stream_rod_response(conversation_history, level: str = 'A1', model: str = CHAT_MODEL):
+    """
+    Streaming variant of get_rod_response.
+    Yields text deltas as they arrive; yields the fallback message if the call fails before any text.
+    A failure after text was already yielded is re-raised, so the caller knows the reply is cut off.
+    """
+    system_instruction = get_system_prompt(level)
+    
+    messages = [{"role": "system", "content": system_instruction}] + conversation_history
+    
+    start = time.perf_counter()
+    first_token = True
+    try:
+        async for chunk in llm.chat_stream(model, messages):
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            if first_token:
+                TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - start, model=model)
+                first_token = False
+            yield delta
+    except llm.LLMOverloaded:
+        # Only possible before the first token (the slot is held for the whole stream)
+        raise
+    except Exception as e:
+        logger.error("Error streaming response from Rod: %s", e, extra={"model": model})
+        if not first_token:
+            raise
+        yield FALLBACK_RESPONSE
+    finally:
+        STREAM_DURATION.observe(time.perf_counter() - start, model=model)
+
+# OPENING REPLY CACHE
+# The first reply of a conversation without article context depends only on the level and the first message,
+# and most openings are the same few greetings. Each key keeps a small pool of real replies: misses call the
+# model and add to the pool until it is full, hits then pick one at random so openings don't all read the same.
+OPENING_CACHE_ENABLED = os.getenv("ROD_OPENING_CACHE", "1") == "1"
+OPENING_CACHE_MAX_CHARS = 40
+OPENING_POOL_SIZE = int(os.getenv("ROD_OPENING_POOL_SIZE", "5"))
+OPENING_CACHE_TTL = float(os.getenv("ROD_OPENING_CACHE_TTL_HOURS", "24")) * 3600
+OPENING_CACHE_MAX_KEYS = 1000
+
+OPENING_CACHE_REQUESTS = metrics.counter("chat_opening_cache_requests_total", "Opening-turn reply cache lookups by result (hit, miss).")
+OPENING_CACHE_KEYS = metrics.gauge("chat_opening_cache_keys", "Distinct openings in the reply cache.")
+
+_OPENING_NOISE = re.compile(r"[\s.,!?]+")
+
+def normalize_opening(text: str) -> str:
+    """Same opening, same key ("Hei!" = "hei"): NFC, lowercase, punctuation and extra spaces dropped."""
+    return _OPENING_NOISE.sub(" ", unicodedata.normalize("NFC", text or "").lower()).strip()
+
+def is_opening_turn(turn: Dict) -> bool:
+    """First message of a conversation with no article context or summary to answer from."""
+    return (len(turn["history"]) == 1 and not turn.get("gap")
+            and not turn.get("context") and not turn.get("summary"))
+
+
+class OpeningCache:
+    """(level, normalized opening, prompt version) -> pool of (reply, stored_at), with a TTL per reply."""
+
+    def __init__(self, pool_size: int, ttl: float, max_keys: int):
+        self.pool_size = pool_size
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._pools: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+
+    def _key(self, level: str, text: str) -> Optional[tuple]:
+        opening = normalize_opening(text)
+        if not OPENING_CACHE_ENABLED or not 0 < len(opening) <= OPENING_CACHE_MAX_CHARS:
+            return None
+        return (level, opening, SYSTEM_PROMPT_VERSION)
+
+    def _fresh(self, key: tuple) -> List[tuple]:
+        cutoff = time.monotonic() - self.ttl
+        pool = [entry for entry in self._pools.get(key, []) if entry[1] > cutoff]
+        if pool:
+            self._pools[key] = pool
+        else:
+            self._pools.pop(key, None)
+        return pool
+
+    def get(self, level: str, text: str) -> Optional[str]:
+        """A stored reply once the pool for this opening is full, otherwise None (the caller asks the model)."""
+        key = self._key(level, text)
+        if key is None:
+            return None
+        pool = self._fresh(key)
+        if len(pool) < self.pool_size:
+            OPENING_CACHE_REQUESTS.inc(result="miss")
+            return None
+        self._pools.move_to_end(key)
+        OPENING_CACHE_REQUESTS.inc(result="hit")
+        return random.choice(pool)[0]
+
+    def put(self, level: str, text: str, reply: str):
+        key = self._key(level, text)
+        if key is None or not reply or reply == FALLBACK_RESPONSE:
+            return
+        pool = self._fresh(key)
+        if len(pool) >= self.pool_size or any(reply == stored for stored, _ in pool):
+            return
+        pool.append((reply, time.monotonic()))
+        self._pools[key] = pool
+        self._pools.move_to_end(key)
+        while len(self._pools) > self.max_keys:
+            self._pools.popitem(last=False)
+        OPENING_CACHE_KEYS.set(len(self._pools))
+
+
+opening_cache = OpeningCache(OPENING_POOL_SIZE, OPENING_CACHE_TTL, OPENING_CACHE_MAX_KEYS)
+
+SUMMARY_PROMPT = """
+Du oppsummerer en samtale mellom en norskstudent og RoD (en samtalepartner).
+Oppdater den eksisterende oppsummeringen med de nye meldingene.
+Behold: temaer, fakta brukeren har fortalt om seg selv, avtaler og åpne spørsmål.
+Skriv maks 8 korte punkter på norsk. Ikke ta med grammatikkfeil.
+"""
+
+async def summarize_history(previous_summary, messages):
+    """
+    Folds older messages into the rolling conversation summary.
+    Returns the new summary, or None on failure.
+    """
+    transcript = "\n".join(
+        f"{'Student' if msg['role'] == 'user' else 'RoD'}: {msg['content']}" for msg in messages
+    )
+    prompt = f"EKSISTERENDE OPPSUMMERING:\n{previous_summary or '(ingen)'}\n\nNYE MELDINGER:\n{transcript}"
+
+    try:
+        response = await llm.chat("gpt-5-nano", [
+            {"role": "system", "content": SUMMARY_PROMPT},
+            {"role": "user", "content": prompt}
+        ], priority=llm.BACKGROUND)
+        content = response.choices[0].message.content
+        return content.strip() if content else None
     except Exception as e:
-        print(f"Error getting response from Rod: {e}")
-        return "Beklager, jeg har problemer med å koble til akkurat nå."
\ No newline at end of file
+        logger.warning("Error summarizing conversation: %s", e)
+        return None
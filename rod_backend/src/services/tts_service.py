@@ -1,51 +1,269 @@
+import logging
 import os
+import json
+import time
+import uuid
+import hashlib
+import aiofiles
+from collections import OrderedDict
 from dotenv import load_dotenv
 from elevenlabs.client import AsyncElevenLabs
-from elevenlabs import save
 import asyncio
 from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+
+import src.services.metrics_service as metrics
+from src.services.log_service import SAMPLED
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 API_KEY = os.getenv("ELEVENLABS_API_KEY")
 client = AsyncElevenLabs(api_key=API_KEY)
 
+# Voice settings (part of the cache key)
+VOICE_ID = "s2xtA7B2CTXPPlJzch1v"
+MODEL_ID = "eleven_flash_v2_5"
+OUTPUT_FORMAT = "mp3_44100_128"
+
 # Resource Folder
 # Create a dedicated folder for audio files inside resources
 AUDIO_OUTPUT_DIR = Path.cwd() / "src" / "assets" / "audio"
 AUDIO_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+# In-progress downloads live next to (not inside) the served folder, so half-written audio is never
+# reachable under /audio. Same filesystem, so the final os.replace stays atomic.
+AUDIO_PARTIAL_DIR = Path.cwd() / "src" / "assets" / "audio_partial"
+AUDIO_PARTIAL_DIR.mkdir(parents=True, exist_ok=True)
 
-def _save_audio_sync(audio_bytes: bytes, output_path: str):
-    """Synchronous function to save bytes to a file."""
-    try:
-        save(audio_bytes, output_path)
-    except Exception as e:
-        print(f"Error saving audio file: {e}")
+# Total size of cached audio before least-recently-used files are deleted
+CACHE_MAX_BYTES = int(os.getenv("ROD_TTS_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))
+
+CACHE_REQUESTS = metrics.counter("tts_cache_requests_total", "TTS requests by cache result (hit, miss, coalesced).")
+CACHE_BYTES = metrics.gauge("tts_cache_bytes", "Bytes of synthesized audio on disk.")
+SYNTHESIS_DURATION = metrics.histogram("tts_synthesis_seconds", "Time to stream one ElevenLabs synthesis to the cache, by outcome.")
+FIRST_CHUNK = metrics.histogram("tts_first_chunk_seconds", "Time until ElevenLabs sent the first audio chunk.")
 
-async def text_to_speech(chat_text: str, filename="output.mp3"):
+
+def cache_key(text: str, voice_id: str = VOICE_ID, model_id: str = MODEL_ID, output_format: str = OUTPUT_FORMAT) -> str:
+    """Content address of a synthesis request."""
+    payload = json.dumps([text, voice_id, model_id, output_format], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
     """
-    Asynchronously converts text to speech using ElevenLabs and saves it.
-    Returns the Path to the saved file.
+    LRU index over the audio folder, bounded by total bytes.
+    File mtimes are the recency order, so it survives restarts.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # filename -> size, oldest first
+        self._total = 0
+        self._loaded = False
+
+    async def load(self):
+        """Indexes the folder on a worker thread; the glob + stat of every file would block the event loop."""
+        if not self._loaded:
+            await asyncio.to_thread(self._load)
+
+    def _load(self):
+        files = [p for p in self.directory.glob("*.mp3") if p.is_file()]
+        for path in sorted(files, key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self._total += size
+        self._loaded = True
+        self._evict()
+
+    def get(self, filename: str) -> Optional[Path]:
+        if not self._loaded:
+            self._load()
+        if filename not in self._entries:
+            return None
+        path = self.directory / filename
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._total -= self._entries.pop(filename)
+            return None
+        self._entries.move_to_end(filename)
+        return path
+
+    def add(self, filename: str, size: int):
+        if not self._loaded:
+            self._load()
+        self._total -= self._entries.pop(filename, 0)
+        self._entries[filename] = size
+        self._total += size
+        self._evict()
+
+    def _evict(self):
+        # Never evict the newest entry (it is about to be served)
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            filename, size = self._entries.popitem(last=False)
+            self._total -= size
+            try:
+                (self.directory / filename).unlink()
+            except FileNotFoundError:
+                pass
+            logger.debug("Evicted cached audio", extra={"file": filename})
+        CACHE_BYTES.set(self._total)
+
+
+audio_cache = AudioCache(AUDIO_OUTPUT_DIR, CACHE_MAX_BYTES)
+
+# Synthesis currently running per cache key (identical requests share one upstream call)
+_inflight: Dict[str, "asyncio.Future"] = {}
+
+STREAM_READ_SIZE = 64 * 1024
+
+# Texts handed in by POST /synthesize/stream, picked up by key from the GET stream URL,
+# so user text never ends up in a query string (and in access logs). Short-lived and bounded.
+STREAM_TTL = float(os.getenv("ROD_TTS_STREAM_TTL", "300"))
+STREAM_MAX_PENDING = 1000
+_pending_streams: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (text, expires_at), oldest first
+
+async def _stream_to_cache(chat_text: str, voice_id: str, model_id: str, output_format: str,
+                           output_path: Path) -> AsyncIterator[bytes]:
     """
-    print("Generating speech...")
+    Pipes ElevenLabs chunks to the caller while writing them incrementally to disk.
+    The file only becomes visible (and cached) once the whole stream arrived.
+    """
+    logger.debug("Generating speech", extra={"chars": len(chat_text)})
+    tmp_path = AUDIO_PARTIAL_DIR / f"{output_path.stem}.{uuid.uuid4().hex}.part"
+    size = 0
+    complete = False
+    start = time.perf_counter()
     try:
         audio_stream = client.text_to_speech.convert(
-            voice_id="s2xtA7B2CTXPPlJzch1v",
-            model_id="eleven_flash_v2_5",
+            voice_id=voice_id,
+            model_id=model_id,
             text=chat_text,
-            output_format="mp3_44100_128"
+            output_format=output_format
         )
-        
-        # Iterate over the stream to collect the bytes
-        audio_bytes = b""
-        async for chunk in audio_stream:
-            audio_bytes += chunk
-
-        output_path = AUDIO_OUTPUT_DIR / filename
-        
-        await asyncio.to_thread(_save_audio_sync, audio_bytes, str(output_path))
-        
-        print(f"Audio saved to {output_path}")
-        return output_path
+        async with aiofiles.open(tmp_path, "wb") as out_file:
+            async for chunk in audio_stream:
+                if not size:
+                    FIRST_CHUNK.observe(time.perf_counter() - start)
+                await out_file.write(chunk)
+                size += len(chunk)
+                yield chunk
+        complete = True
+    finally:
+        SYNTHESIS_DURATION.observe(time.perf_counter() - start, outcome="ok" if complete and size else "error")
+        if complete and size:
+            os.replace(tmp_path, output_path)
+            audio_cache.add(output_path.name, size)
+            logger.info("Audio saved", extra={**SAMPLED, "file": output_path.name, "bytes": size,
+                                              "seconds": round(time.perf_counter() - start, 3)})
+        else:
+            # Upstream error or client went away mid-stream
+            tmp_path.unlink(missing_ok=True)
+
+async def _read_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as in_file:
+        while True:
+            chunk = await in_file.read(STREAM_READ_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+async def _synthesize(chat_text: str, voice_id: str, model_id: str, output_format: str, output_path: Path) -> Optional[Path]:
+    try:
+        async for _ in _stream_to_cache(chat_text, voice_id, model_id, output_format, output_path):
+            pass
+        return output_path if output_path.exists() else None
     except Exception as e:
-        print(f"ElevenLabs API error: {e}")
-        return None
\ No newline at end of file
+        logger.error("ElevenLabs API error: %s", e)
+        return None
+
+async def text_to_speech(chat_text: str, voice_id: str = VOICE_ID, model_id: str = MODEL_ID,
+                         output_format: str = OUTPUT_FORMAT) -> Optional[Path]:
+    """
+    Asynchronously converts text to speech using ElevenLabs and saves it.
+    Identical requests are served from the on-disk cache (or share the in-flight call).
+    Returns the Path to the saved file.
+    """
+    key = cache_key(chat_text, voice_id, model_id, output_format)
+    filename = f"{key}.mp3"
+
+    cached = audio_cache.get(filename)
+    if cached:
+        CACHE_REQUESTS.inc(result="hit")
+        return cached
+
+    task = _inflight.get(key)
+    if task:
+        CACHE_REQUESTS.inc(result="coalesced")
+    else:
+        CACHE_REQUESTS.inc(result="miss")
+        task = asyncio.ensure_future(
+            _synthesize(chat_text, voice_id, model_id, output_format, AUDIO_OUTPUT_DIR / filename)
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shield: one caller disconnecting must not cancel the shared synthesis
+    return await asyncio.shield(task)
+
+async def stream_speech(chat_text: str, voice_id: str = VOICE_ID, model_id: str = MODEL_ID,
+                        output_format: str = OUTPUT_FORMAT) -> AsyncIterator[bytes]:
+    """
+    Yields audio chunks as soon as ElevenLabs produces them (playback can start on the first one),
+    teeing them into the cache file. Cache hits are streamed from disk.
+    """
+    key = cache_key(chat_text, voice_id, model_id, output_format)
+    filename = f"{key}.mp3"
+
+    cached = audio_cache.get(filename)
+    if not cached and key in _inflight:
+        # Someone is already synthesizing this text; wait for the file instead of paying twice
+        CACHE_REQUESTS.inc(result="coalesced")
+        cached = await asyncio.shield(_inflight[key])
+    elif cached:
+        CACHE_REQUESTS.inc(result="hit")
+
+    if cached:
+        async for chunk in _read_file_chunks(cached):
+            yield chunk
+        return
+
+    CACHE_REQUESTS.inc(result="miss")
+    # Let /synthesize callers for the same text wait on this stream
+    done = asyncio.get_running_loop().create_future()
+    _inflight[key] = done
+    output_path = AUDIO_OUTPUT_DIR / filename
+    try:
+        async for chunk in _stream_to_cache(chat_text, voice_id, model_id, output_format, output_path):
+            yield chunk
+    finally:
+        _inflight.pop(key, None)
+        done.set_result(output_path if output_path.exists() else None)
+
+def register_stream(chat_text: str) -> str:
+    """Remembers the text for a later stream_registered(key) call and returns the key."""
+    key = cache_key(chat_text)
+    now = time.monotonic()
+    _pending_streams.pop(key, None)
+    _pending_streams[key] = (chat_text, now + STREAM_TTL)
+    # Same TTL for every entry, so the oldest one expires first
+    while _pending_streams and (len(_pending_streams) > STREAM_MAX_PENDING
+                                or next(iter(_pending_streams.values()))[1] <= now):
+        _pending_streams.popitem(last=False)
+    return key
+
+def stream_registered(key: str) -> Optional[AsyncIterator[bytes]]:
+    """
+    Audio chunks for a key from register_stream(), or None if it is unknown or expired.
+    Once synthesized, the key keeps working for as long as the file stays cached.
+    """
+    entry = _pending_streams.get(key)
+    if entry and entry[1] > time.monotonic():
+        return stream_speech(entry[0])
+    cached = audio_cache.get(f"{key}.mp3")
+    if cached:
+        CACHE_REQUESTS.inc(result="hit")
+        return _read_file_chunks(cached)
+    return None
@@ -0,0 +1,118 @@
+import logging
+import os
+import mmap
+import struct
+import hashlib
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# Word-game index written by word_bank/process_words.py. Layout (little-endian):
+#   magic (8 bytes) | section count (uint32) | reserved (uint32)
+#   per section: length, kind, count, offset (uint32 each)
+#   sections: sorted uppercase ISO-8859-1 words packed back to back (fixed width per section)
+WORD_INDEX_PATH = Path(__file__).resolve().parent.parent.parent / "word_bank" / "words.bin"
+WORD_INDEX_MAGIC = b"RODWRD\x01\x00"
+WORD_ENCODING = "iso-8859-1"
+KIND_VALID, KIND_TARGET = 0, 1
+
+# The daily word changes at local midnight
+DAILY_WORD_TZ = os.getenv("ROD_DAILY_WORD_TZ", "Europe/Oslo")
+
+
+class _Records:
+    """Fixed-width records of one section as a sequence (lets bisect run in C)."""
+
+    def __init__(self, view: memoryview, width: int, count: int):
+        self._view = view
+        self._width = width
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        start = i * self._width
+        return bytes(self._view[start:start + self._width])
+
+
+class WordIndex:
+    """Valid guesses and daily answers per word length, backed by an mmap of words.bin."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:8] != WORD_INDEX_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a word index (regenerate it with process_words.py)")
+
+        view = memoryview(self._mmap)
+        (section_count,) = struct.unpack_from("<I", self._mmap, 8)
+        self._sections: Dict[Tuple[int, int], _Records] = {}
+        for i in range(section_count):
+            length, kind, count, offset = struct.unpack_from("<IIII", self._mmap, 16 + 16 * i)
+            self._sections[(length, kind)] = _Records(view[offset:offset + length * count], length, count)
+
+        # Identifies this build of the index (ETag for validation responses)
+        self.version = hashlib.sha256(self._mmap[:]).hexdigest()[:16]
+
+    @property
+    def lengths(self):
+        return sorted({length for length, _ in self._sections})
+
+    def is_valid(self, word: str) -> bool:
+        records = self._sections.get((len(word), KIND_VALID))
+        if records is None:
+            return False
+        try:
+            key = word.upper().encode(WORD_ENCODING)
+        except UnicodeEncodeError:
+            return False
+        i = bisect_left(records, key)
+        return i < len(records) and records[i] == key
+
+    def daily_word(self, day: date, length: int) -> Optional[str]:
+        """Same word for everyone on a given day: a hash of the date picks the answer."""
+        records = self._sections.get((length, KIND_TARGET)) or self._sections.get((length, KIND_VALID))
+        if not records:
+            return None
+        digest = hashlib.sha256(f"{day.isoformat()}:{length}".encode()).digest()
+        return records[int.from_bytes(digest[:8], "big") % len(records)].decode(WORD_ENCODING)
+
+
+_index: Optional[WordIndex] = None
+_index_loaded = False
+
+def get_word_index() -> Optional[WordIndex]:
+    """Maps the word index once. Returns None if it hasn't been generated."""
+    global _index, _index_loaded
+    if not _index_loaded:
+        _index_loaded = True
+        try:
+            _index = WordIndex(WORD_INDEX_PATH)
+            logger.info("Word index loaded", extra={"lengths": _index.lengths})
+        except FileNotFoundError:
+            logger.warning("No word index at %s, word game endpoints are disabled", WORD_INDEX_PATH)
+        except ValueError as e:
+            logger.warning("%s", e)
+    return _index
+
+def _daily_tz():
+    try:
+        return ZoneInfo(DAILY_WORD_TZ)
+    except ZoneInfoNotFoundError:
+        return timezone.utc
+
+def today() -> date:
+    return datetime.now(_daily_tz()).date()
+
+def seconds_until_next_day() -> int:
+    """How long today's daily word stays valid (for Cache-Control)."""
+    now = datetime.now(_daily_tz())
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=now.tzinfo)
+    return max(1, int((midnight - now).total_seconds()))
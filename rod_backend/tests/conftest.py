@@ -0,0 +1,27 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Run from anywhere: the services import as src.services.*, relative to rod_backend/
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.chdir(BACKEND_DIR)
+
+# The SDK clients are created at import time and refuse to start without a key
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("ELEVENLABS_API_KEY", "test")
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """The sync db_service on a fresh, migrated database file."""
+    import src.services.db_service as db
+
+    path = tmp_path / "rod.db"
+    monkeypatch.setattr(db, "DB_FILE", path)
+    monkeypatch.setattr(db, "_pool", db.ConnectionPool(path))
+    db.init_db()
+    yield db
+    db.close_pool()
@@ -0,0 +1,43 @@
+import pytest
+
+import src.services.llm_gateway as llm
+import src.services.textgen_service as textgen
+
+
+@pytest.fixture
+def light_saturated(monkeypatch):
+    """gpt-5-mini's limiter reports a wait far over the interactive deadline; gpt-5 is idle."""
+    monkeypatch.setattr(textgen, "ROUTING_ENABLED", True)
+    monkeypatch.setattr(llm, "_limiters", {})
+    monkeypatch.setattr(llm.limiter_for(textgen.LIGHT_CHAT_MODEL), "estimate_wait", lambda priority: 60.0)
+    assert llm.would_shed(textgen.LIGHT_CHAT_MODEL)
+    assert not llm.would_shed(textgen.CHAT_MODEL)
+
+
+def test_short_beginner_turn_goes_to_light_model(monkeypatch):
+    monkeypatch.setattr(textgen, "ROUTING_ENABLED", True)
+    monkeypatch.setattr(llm, "_limiters", {})
+    assert textgen.choose_chat_model("A1", "Hei!", 1) == (textgen.LIGHT_CHAT_MODEL, "short_beginner_turn")
+
+
+def test_short_beginner_turn_falls_back_when_light_model_is_full(light_saturated):
+    model, reason = textgen.choose_chat_model("A1", "Hei!", 1)
+    assert (model, reason) == (textgen.CHAT_MODEL, "light_busy")
+    # Neither the early check nor the check of the routed model sheds the turn
+    textgen.check_chat_capacity()
+    textgen.check_chat_capacity(model)
+
+
+def test_slow_primary_is_kept_when_light_model_is_full(light_saturated, monkeypatch):
+    monkeypatch.setattr(textgen, "PRIMARY_PROBE_SHARE", 0.0)
+    monkeypatch.setattr(llm, "latency_percentile", lambda model, q=0.95: textgen.PRIMARY_P95_BUDGET + 1)
+    assert textgen.choose_chat_model("B2", "Fortell meg om helgen din, hva gjorde du?", 30)[0] == textgen.CHAT_MODEL
+
+
+def test_sheds_when_every_model_is_full(light_saturated, monkeypatch):
+    monkeypatch.setattr(llm.limiter_for(textgen.CHAT_MODEL), "estimate_wait", lambda priority: 30.0)
+    with pytest.raises(llm.LLMOverloaded):
+        textgen.check_chat_capacity()
+    model, _ = textgen.choose_chat_model("A1", "Hei!", 1)
+    with pytest.raises(llm.LLMOverloaded):
+        textgen.check_chat_capacity(model)
@@ -0,0 +1,33 @@
+def _menu_titles(db, user_id):
+    return [item["title"] for item in db.get_user_conversations(user_id)]
+
+
+def test_discarding_the_first_message_resets_the_preview(temp_db):
+    cid = temp_db.start_new_conversation("u1", {"title": "Artikkel"})
+    turn = temp_db.record_chat_turn("u1", "Hva synes du om saken?", cid)
+    assert _menu_titles(temp_db, "u1") == ["Hva synes du om saken?"]
+
+    temp_db.add_message(cid, "assistant", "Hei! Har du lest artikkelen?")
+    temp_db.discard_user_message(cid, turn["message_id"])
+
+    assert _menu_titles(temp_db, "u1") == ["Hei! Har du lest artikkelen?"]
+
+
+def test_earlier_user_message_stays_the_preview(temp_db):
+    first = temp_db.record_chat_turn("u1", "Hei, jeg heter Kari")
+    cid = first["conversation_id"]
+    temp_db.add_message(cid, "assistant", "Hei Kari!")
+    shed = temp_db.record_chat_turn("u1", "Hvor bor du?", cid)
+
+    temp_db.discard_user_message(cid, shed["message_id"])
+
+    assert _menu_titles(temp_db, "u1") == ["Hei, jeg heter Kari"]
+    assert [m["content"] for m in temp_db.get_chat_history(cid)] == ["Hei, jeg heter Kari", "Hei Kari!"]
+
+
+def test_conversation_left_empty_is_removed(temp_db):
+    turn = temp_db.record_chat_turn("u1", "Hei!")
+
+    temp_db.discard_user_message(turn["conversation_id"], turn["message_id"])
+
+    assert _menu_titles(temp_db, "u1") == []
@@ -0,0 +1,32 @@
+import pytest
+
+import src.services.grammar_check_service as grammar
+
+
+@pytest.fixture
+def no_lexicon(monkeypatch):
+    monkeypatch.setattr(grammar, "get_lexicon", lambda: None)
+
+
+@pytest.mark.parametrize("text", ["Hei, hvordan går det?", "Tusen takk!", "Jeg heter Kari Nordmann."])
+def test_safe_phrases_and_names_skip_the_model_without_a_lexicon(no_lexicon, text):
+    assert grammar.quick_check(text) == grammar.OK_RESULT
+
+
+def test_word_lookups_need_the_lexicon(no_lexicon):
+    assert grammar.quick_check("Fotball.") is None
+
+
+class FakeLexicon:
+    """Case-insensitive like the real Lexicon."""
+
+    def __init__(self, *words):
+        self.words = set(words)
+
+    def __contains__(self, word):
+        return word.lower() in self.words
+
+
+def test_one_known_word_is_accepted(monkeypatch):
+    monkeypatch.setattr(grammar, "get_lexicon", lambda: FakeLexicon("fotball"))
+    assert grammar.quick_check("Fotball.") == grammar.OK_RESULT
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.services.llm_gateway as llm
+
+MODEL = "gpt-5"
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """First call is slow, every later one fast; records the limiter state each call sees."""
+    monkeypatch.setattr(llm, "_limiters", {})
+    monkeypatch.setattr(llm, "latency_percentile", lambda model, q=0.95: 0.01)
+    seen = []
+
+    async def create(**kwargs):
+        limiter = llm.limiter_for(MODEL)
+        seen.append({"in_flight": limiter._in_flight, "tokens": limiter._tokens})
+        await asyncio.sleep(0.2 if len(seen) == 1 else 0.01)
+        return SimpleNamespace(usage=None, call=len(seen))
+
+    completions = SimpleNamespace(create=create)
+    monkeypatch.setattr(llm, "client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    return seen
+
+
+def test_hedge_takes_its_own_slot_and_token(fake_openai):
+    async def run():
+        limiter = llm.limiter_for(MODEL)
+        burst = limiter._tokens
+        response = await llm.chat(MODEL, [], hedge=True)
+        await asyncio.sleep(0)  # slot release runs as a done callback
+        return response, burst, limiter
+
+    response, burst, limiter = asyncio.run(run())
+
+    assert response.call == 2  # the hedge won
+    assert fake_openai[0]["in_flight"] == 1
+    assert fake_openai[1]["in_flight"] == 2
+    assert fake_openai[1]["tokens"] < burst - 1.5  # two tokens taken (plus a few ms of refill)
+    assert limiter._in_flight == 0
+
+
+def test_no_hedge_while_the_model_would_shed(fake_openai, monkeypatch):
+    async def run():
+        limiter = llm.limiter_for(MODEL)
+        monkeypatch.setattr(llm, "would_shed", lambda model, priority=llm.INTERACTIVE: True)
+        response = await llm.chat(MODEL, [], hedge=True)
+        await asyncio.sleep(0)
+        return response, limiter
+
+    response, limiter = asyncio.run(run())
+
+    assert response.call == 1
+    assert len(fake_openai) == 1
+    assert limiter._in_flight == 0
+
+
+def test_no_hedge_without_a_free_slot(fake_openai, monkeypatch):
+    async def run():
+        limiter = llm.limiter_for(MODEL)
+        monkeypatch.setattr(limiter, "concurrency", 1)
+        response = await llm.chat(MODEL, [], hedge=True)
+        await asyncio.sleep(0)
+        return response, limiter
+
+    response, limiter = asyncio.run(run())
+
+    assert response.call == 1
+    assert limiter._in_flight == 0
@@ -0,0 +1,45 @@
+from src.services import context_service
+
+
+def _tokens(messages):
+    return sum((len(m["content"]) + 3) // 4 for m in messages)
+
+def _turn(db, conversation_id, content, **kwargs):
+    kwargs.setdefault("max_gap_messages", context_service.GAP_MAX_MESSAGES)
+    return db.record_chat_turn("u1", content, conversation_id, **kwargs)
+
+
+def test_gap_fills_in_between_summary_and_window(temp_db):
+    cid = temp_db.start_new_conversation("u1")
+    for i in range(10):
+        temp_db.add_message(cid, "user" if i % 2 == 0 else "assistant", f"m{i}")
+    temp_db.save_conversation_summary(cid, "S", 5)  # covers m0..m4
+
+    turn = _turn(temp_db, cid, "m10", max_messages=4)
+    history = context_service.build_prompt_history(turn)
+
+    assert [m["content"] for m in history] == [
+        "TIDLIGERE I SAMTALEN (oppsummert):\nS", "m5", "m6", "m7", "m8", "m9", "m10"]
+
+
+def test_long_gap_messages_stay_within_the_token_budget(temp_db):
+    cid = temp_db.start_new_conversation("u1")
+    for i in range(8):
+        temp_db.add_message(cid, "user" if i % 2 == 0 else "assistant", "x" * 400)  # 100 tokens each
+
+    turn = _turn(temp_db, cid, "y" * 400, token_budget=450, max_messages=2)
+
+    assert len(turn["history"]) == 2
+    # 200 tokens used by the window: only two of the six gap messages fit in the rest
+    assert len(turn["gap"]) == 2
+    assert _tokens(turn["gap"] + turn["history"]) <= 450
+
+
+def test_no_gap_when_the_window_used_the_whole_budget(temp_db):
+    cid = temp_db.start_new_conversation("u1")
+    for i in range(6):
+        temp_db.add_message(cid, "user" if i % 2 == 0 else "assistant", "x" * 4000)
+
+    turn = _turn(temp_db, cid, "y" * 4000, token_budget=1500, max_messages=4)
+
+    assert turn["gap"] == []
@@ -1,74 +1,141 @@
-import csv
+import argparse
 import os
+import struct
+import unicodedata
+from pathlib import Path
 
 # CONFIGURATION
+# Inputs default to, and outputs always go to, this folder (where the backend services read them), whatever the cwd
+WORD_BANK_DIR = Path(__file__).resolve().parent
 INPUT_FILENAME = "fullformsliste.txt"
-OUTPUT_FILENAME = "ValidWords.ts"
+# Curated answers for the daily word (one per line); always counted as valid guesses
+TARGETS_FILENAME = "target_words.txt"
+# Word lengths the game can use
+DEFAULT_LENGTHS = (5,)
+# All full forms, memory-mapped by the backend (see src/services/lexicon_service.py for the layout)
+LEXICON_FILENAME = "lexicon.bin"
+LEXICON_MAGIC = b"RODLEX\x01\x00"
+# Valid guesses + daily answers per length, memory-mapped by the backend (see src/services/word_service.py)
+WORD_INDEX_FILENAME = "words.bin"
+WORD_INDEX_MAGIC = b"RODWRD\x01\x00"
+WORD_ENCODING = "iso-8859-1"  # One byte per letter (ÆØÅ included), so records are fixed width
+KIND_VALID, KIND_TARGET = 0, 1
 
-def process_word_list():
-    print(f"🚀 Starting processing of {INPUT_FILENAME}...")
-    
-    if not os.path.exists(INPUT_FILENAME):
-        print(f"❌ Error: Could not find {INPUT_FILENAME}")
-        return
+def write_lexicon(path, forms):
+    """Sorted UTF-8 blob + uint32 offset table, so lookups are a binary search over an mmap."""
+    encoded = sorted({unicodedata.normalize("NFC", form).encode("utf-8") for form in forms})
+    offsets = [0]
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+
+    with open(path, 'wb') as out:
+        out.write(LEXICON_MAGIC)
+        out.write(struct.pack("<II", len(encoded), 0))
+        out.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for word in encoded:
+            out.write(word)
+    return len(encoded)
+
+def write_word_index(path, sections):
+    """
+    sections: {(length, kind): set of uppercase words}.
+    Layout: magic | section count | (length, kind, count, offset) per section | sorted packed records.
+    """
+    header_size = 16 + 16 * len(sections)
+    table = []
+    blobs = []
+    offset = header_size
+    for (length, kind), words in sorted(sections.items()):
+        blob = b"".join(sorted(w.encode(WORD_ENCODING) for w in words))
+        table.append((length, kind, len(words), offset))
+        blobs.append(blob)
+        offset += len(blob)
 
-    unique_words = set()
-    
-    # Norsk Ordbank often uses ISO-8859-1 encoding
+    with open(path, 'wb') as out:
+        out.write(WORD_INDEX_MAGIC)
+        out.write(struct.pack("<II", len(sections), 0))
+        for entry in table:
+            out.write(struct.pack("<IIII", *entry))
+        for blob in blobs:
+            out.write(blob)
+
+def _decode(line: bytes) -> str:
+    # Norsk Ordbank often uses ISO-8859-1 encoding; decide per line so a stray byte can't abort the run
     try:
-        f = open(INPUT_FILENAME, 'r', encoding='utf-8')
-        f.readline()
-        f.seek(0)
+        return line.decode('utf-8')
     except UnicodeDecodeError:
-        print("⚠️ UTF-8 failed, switching to ISO-8859-1...")
-        f = open(INPUT_FILENAME, 'r', encoding='iso-8859-1')
-
-    with f:
-        # Use DictReader to automatically map columns by name (LOEPENR, OPPSLAG, etc.)
-        reader = csv.DictReader(f, delimiter='\t')
-        
-        for row in reader:
-            word = row.get('OPPSLAG')
-            
-            if not word:
-                continue
-
-            # 1. Clean the word
-            word = word.strip().upper()
-
-            # 2. Filter Logic
-            # Must be exactly 5 letters
-            if len(word) != 5:
-                continue
-            
-            # Must be letters only
-            # We verify it contains only Norwegian alphabetic characters
-            if not word.isalpha():
-                continue
-            
-            # Add to set
-            unique_words.add(word)
-
-    # Sort list for neatness
-    sorted_words = sorted(list(unique_words))
-    
-    print(f"✅ Found {len(sorted_words)} unique 5-letter words.")
-    
-    # Write directly to a TypeScript file for the Frontend
-    with open(OUTPUT_FILENAME, 'w', encoding='utf-8') as out:
-        out.write("// Auto-generated from Norsk Ordbank\n")
-        out.write("export const VALID_GUESSES = [\n")
-        
-        # Write chunks to avoid one massive line
-        chunk_size = 10
-        for i in range(0, len(sorted_words), chunk_size):
-            chunk = sorted_words[i:i+chunk_size]
-            quoted_chunk = [f'"{w}"' for w in chunk]
-            out.write("  " + ", ".join(quoted_chunk) + ",\n")
-            
-        out.write("];\n")
-
-    print(f"🎉 Done! Created {OUTPUT_FILENAME}")
+        return line.decode('iso-8859-1')
+
+def iter_full_forms(path):
+    """Streams the OPPSLAG column of the tab-separated word list, one line at a time."""
+    with open(path, 'rb') as f:
+        header = _decode(f.readline()).rstrip("\r\n").split("\t")
+        column = header.index("OPPSLAG")
+        for raw in f:
+            fields = _decode(raw).rstrip("\r\n").split("\t")
+            if len(fields) > column and fields[column]:
+                yield fields[column]
+
+def _game_word(word: str, lengths) -> bool:
+    if len(word) not in lengths or not word.isalpha():
+        return False
+    try:
+        word.encode(WORD_ENCODING)
+    except UnicodeEncodeError:
+        return False
+    return True
+
+def process_word_list(input_path=WORD_BANK_DIR / INPUT_FILENAME, lengths=DEFAULT_LENGTHS,
+                      targets_path=WORD_BANK_DIR / TARGETS_FILENAME):
+    print(f"🚀 Starting processing of {input_path}...")
+
+    if not os.path.exists(input_path):
+        print(f"❌ Error: Could not find {input_path}")
+        return
+
+    lengths = set(lengths)
+    sections = {(length, kind): set() for length in lengths for kind in (KIND_VALID, KIND_TARGET)}
+    all_forms = set()
+
+    # One pass: lexicon forms and game words per length
+    for word in iter_full_forms(input_path):
+        word = unicodedata.normalize("NFC", word.strip())
+        if not word.isalpha():
+            continue
+        all_forms.add(word.lower())
+
+        upper = word.upper()
+        if _game_word(upper, lengths):
+            sections[(len(upper), KIND_VALID)].add(upper)
+
+    if os.path.exists(targets_path):
+        with open(targets_path, encoding='utf-8') as f:
+            for line in f:
+                upper = unicodedata.normalize("NFC", line.strip()).upper()
+                if _game_word(upper, lengths):
+                    sections[(len(upper), KIND_TARGET)].add(upper)
+                    # An answer must always be accepted as a guess
+                    sections[(len(upper), KIND_VALID)].add(upper)
+    else:
+        print(f"⚠️ No {targets_path}, the daily word will be drawn from all valid words")
+
+    for length in sorted(lengths):
+        print(f"✅ {length} letters: {len(sections[(length, KIND_VALID)])} valid words, "
+              f"{len(sections[(length, KIND_TARGET)])} daily answers")
+
+    word_index_path = WORD_BANK_DIR / WORD_INDEX_FILENAME
+    write_word_index(word_index_path, {key: words for key, words in sections.items() if words})
+    print(f"🔎 Wrote word index to {word_index_path}")
+
+    lexicon_path = WORD_BANK_DIR / LEXICON_FILENAME
+    count = write_lexicon(lexicon_path, all_forms)
+    print(f"📚 Wrote {count} full forms to {lexicon_path}")
+    print("🎉 Done!")
 
 if __name__ == "__main__":
-    process_word_list()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Builds the lexicon and word-game index from Norsk Ordbank.")
+    parser.add_argument("--input", default=str(WORD_BANK_DIR / INPUT_FILENAME), help="Norsk Ordbank fullformsliste.txt")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(DEFAULT_LENGTHS), help="Word lengths for the game")
+    parser.add_argument("--targets", default=str(WORD_BANK_DIR / TARGETS_FILENAME), help="Curated daily answers, one per line")
+    args = parser.parse_args()
+    process_word_list(args.input, args.lengths, args.targets)